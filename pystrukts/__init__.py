@@ -1,4 +1,5 @@
 # pylint: skip-file
 
 from .max_heap import MaxHeap
-from .union_find import UnionFind
\ No newline at end of file
+from .union_find import UnionFind
+from .cache import LRUCache, LFUCache
\ No newline at end of file
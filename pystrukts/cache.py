@@ -0,0 +1,390 @@
+'''
+Cache module.
+
+This module implements LRU and LFU caches on top of doubly linked lists.
+'''
+
+from abc import ABC, abstractmethod
+from collections import Counter
+from contextlib import nullcontext
+from dataclasses import dataclass
+from threading import RLock
+from time import monotonic
+from typing import Any, Callable, Hashable, Optional
+from .list import DoublyLinkedList, DoublyLinkedNode
+
+@dataclass(eq=False, repr=False)
+class CacheEntry:
+    '''
+    CacheEntry Class.
+
+    Attributes:
+        key (Hashable): The key of the entry.
+        value (Any): The value of the entry.
+        weight (float): The weight of the entry.
+        expires (float): The time when the entry expires, or None.
+        node (DoublyLinkedNode): The node holding the entry.
+        bucket (DoublyLinkedNode): The frequency bucket of the entry, for LFU caches.
+    '''
+
+    __slots__ = ('key', 'value', 'weight', 'expires', 'node', 'bucket')
+
+    key: Hashable
+    value: Any
+    weight: float
+    expires: Optional[float]
+    node: Optional[DoublyLinkedNode]
+    bucket: Optional[DoublyLinkedNode]
+
+    def __init__(self, key: Hashable, value: Any, weight: float, expires: Optional[float]):
+        self.key = key
+        self.value = value
+        self.weight = weight
+        self.expires = expires
+        self.node = None
+        self.bucket = None
+
+class Cache(ABC):
+    '''
+    Cache Class.
+
+    Base class of the caches. Entries are evicted, following the policy of the
+    subclass, until their total weight fits in the capacity. Expired entries are
+    dropped when they are accessed, or all at once with `expire`.
+
+    Attributes:
+        capacity (float): The maximum total weight of the entries.
+        ttl (float): The number of seconds an entry lives after being set, or None.
+        size (float): The total weight of the entries.
+        stats (Counter): The number of hits, misses, evictions and expirations.
+
+    Methods:
+        `__len__()`: Return the number of entries.
+        `__contains__(key: Hashable)`: Check if a key is in the cache.
+        `__getitem__(key: Hashable)`: Get the value of a key.
+        `__setitem__(key: Hashable, value: Any)`: Set the value of a key.
+        `__delitem__(key: Hashable)`: Delete a key.
+        `get(key: Hashable, default: Any)`: Get the value of a key, or a default value.
+        `put(key: Hashable, value: Any)`: Set the value of a key.
+        `expire()`: Remove the expired entries.
+        `clear()`: Remove all the entries.
+    '''
+
+    def __init__(self, capacity: float = 128,
+                 weight: Optional[Callable[[Hashable, Any], float]] = None,
+                 ttl: Optional[float] = None, thread_safe: bool = False):
+        '''
+        Initialize the cache.
+
+        Args:
+            capacity (float): The maximum total weight of the entries.
+            weight (Callable[[Hashable, Any], float]): The weight of an entry. Defaults to 1.
+            ttl (float): The number of seconds an entry lives after being set, or None.
+            thread_safe (bool): Whether to guard every operation with a lock.
+
+        Raises:
+            ValueError: If the capacity is not positive.
+        '''
+
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+
+        self.capacity = capacity
+        self.ttl = ttl
+        self.size = 0
+        self.stats = Counter(hits=0, misses=0, evictions=0, expirations=0)
+        self._weight = weight
+        self._entries = {}
+        self._lock = RLock() if thread_safe else nullcontext()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable):
+        with self._lock:
+            return self._lookup(key) is not None
+
+    def __getitem__(self, key: Hashable):
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is None:
+                self.stats['misses'] += 1
+                raise KeyError(key)
+
+            self.stats['hits'] += 1
+            self._touch(entry)
+            return entry.value
+
+    def __setitem__(self, key: Hashable, value: Any):
+        self.put(key, value)
+
+    def __delitem__(self, key: Hashable):
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is None:
+                raise KeyError(key)
+
+            self._remove(entry)
+
+    @abstractmethod
+    def _link(self, entry: CacheEntry):
+        '''
+        Add a new entry to the eviction order.
+
+        Args:
+            entry (CacheEntry): The entry.
+        '''
+
+    @abstractmethod
+    def _unlink(self, entry: CacheEntry):
+        '''
+        Remove an entry from the eviction order.
+
+        Args:
+            entry (CacheEntry): The entry.
+        '''
+
+    @abstractmethod
+    def _touch(self, entry: CacheEntry):
+        '''
+        Record an access to an entry.
+
+        Args:
+            entry (CacheEntry): The entry.
+        '''
+
+    @abstractmethod
+    def _victim(self, exclude: Optional[CacheEntry]):
+        '''
+        Get the entry to be evicted next.
+
+        Args:
+            exclude (CacheEntry): An entry that must not be evicted, or None.
+
+        Returns:
+            out (CacheEntry): The entry.
+        '''
+
+    def _lookup(self, key: Hashable):
+        '''
+        Get the entry of a key, dropping it if it has expired.
+
+        Args:
+            key (Hashable): The key.
+
+        Returns:
+            out (CacheEntry): The entry, or None if the key is not in the cache.
+        '''
+
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires is not None and entry.expires <= monotonic():
+            self._remove(entry)
+            self.stats['expirations'] += 1
+            return None
+
+        return entry
+
+    def _remove(self, entry: CacheEntry):
+        '''
+        Remove an entry from the cache.
+
+        Args:
+            entry (CacheEntry): The entry.
+        '''
+
+        self._unlink(entry)
+        del self._entries[entry.key]
+        self.size -= entry.weight
+
+    def get(self, key: Hashable, default: Any = None):
+        '''
+        Get the value of a key, recording the access.
+
+        Args:
+            key (Hashable): The key.
+            default (Any): The value to return if the key is not in the cache.
+
+        Returns:
+            out (Any): The value of the key, or the default value.
+        '''
+
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def put(self, key: Hashable, value: Any):
+        '''
+        Set the value of a key, evicting entries until the cache fits in its capacity.
+
+        Args:
+            key (Hashable): The key.
+            value (Any): The value.
+
+        Raises:
+            ValueError: If the weight of the entry exceeds the capacity.
+        '''
+
+        weight = 1 if self._weight is None else self._weight(key, value)
+        if weight > self.capacity:
+            raise ValueError("Entry weight exceeds the capacity of the cache")
+
+        expires = None if self.ttl is None else monotonic() + self.ttl
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self.size -= entry.weight
+                entry.value, entry.weight, entry.expires = value, weight, expires
+                self._touch(entry)
+
+            while self.size + weight > self.capacity:
+                self._remove(self._victim(entry))
+                self.stats['evictions'] += 1
+
+            if entry is None:
+                entry = CacheEntry(key, value, weight, expires)
+                self._entries[key] = entry
+                self._link(entry)
+
+            self.size += weight
+
+    def expire(self):
+        '''
+        Remove the expired entries.
+        '''
+
+        with self._lock:
+            for key in list(self._entries):
+                self._lookup(key)
+
+    def clear(self):
+        '''
+        Remove all the entries, keeping the statistics.
+        '''
+
+        with self._lock:
+            for entry in list(self._entries.values()):
+                self._remove(entry)
+
+class LRUCache(Cache):
+    '''
+    LRUCache Class.
+
+    Cache that evicts the least recently used entry. Entries are kept in a doubly
+    linked list from the most to the least recently used, so every operation is O(1).
+
+    Attributes:
+        capacity (float): The maximum total weight of the entries.
+        ttl (float): The number of seconds an entry lives after being set, or None.
+        size (float): The total weight of the entries.
+        stats (Counter): The number of hits, misses, evictions and expirations.
+    '''
+
+    def __init__(self, capacity: float = 128,
+                 weight: Optional[Callable[[Hashable, Any], float]] = None,
+                 ttl: Optional[float] = None, thread_safe: bool = False):
+        super().__init__(capacity, weight, ttl, thread_safe)
+        self._order = DoublyLinkedList()
+
+    def _link(self, entry: CacheEntry):
+        entry.node = self._order.appendleft(entry)
+
+    def _unlink(self, entry: CacheEntry):
+        self._order.remove_node(entry.node)
+
+    def _touch(self, entry: CacheEntry):
+        self._order.move_to_front(entry.node)
+
+    def _victim(self, exclude: Optional[CacheEntry]):
+        # The excluded entry was just touched, so it is never the least recently used.
+        return self._order.get(-1)
+
+class LFUCache(Cache):
+    '''
+    LFUCache Class.
+
+    Cache that evicts the least frequently used entry, and the least recently used
+    among those. Entries with the same number of accesses share a bucket, and the
+    buckets are kept in a doubly linked list by increasing frequency, so every
+    operation is O(1).
+
+    Attributes:
+        capacity (float): The maximum total weight of the entries.
+        ttl (float): The number of seconds an entry lives after being set, or None.
+        size (float): The total weight of the entries.
+        stats (Counter): The number of hits, misses, evictions and expirations.
+    '''
+
+    def __init__(self, capacity: float = 128,
+                 weight: Optional[Callable[[Hashable, Any], float]] = None,
+                 ttl: Optional[float] = None, thread_safe: bool = False):
+        super().__init__(capacity, weight, ttl, thread_safe)
+        self._buckets = DoublyLinkedList()
+        self._first = None
+
+    def frequency(self, key: Hashable):
+        '''
+        Get the number of times a key has been set or accessed since it was added.
+
+        Args:
+            key (Hashable): The key.
+
+        Returns:
+            out (int): The frequency of the key.
+
+        Raises:
+            KeyError: If the key is not in the cache.
+        '''
+
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is None:
+                raise KeyError(key)
+
+            return entry.bucket.data[0]
+
+    def _add_to_bucket(self, entry: CacheEntry, bucket: DoublyLinkedNode):
+        '''
+        Add an entry to a bucket, as its most recently used entry.
+
+        Args:
+            entry (CacheEntry): The entry.
+            bucket (DoublyLinkedNode): The bucket.
+        '''
+
+        entry.bucket = bucket
+        entry.node = bucket.data[1].appendleft(entry)
+
+    def _link(self, entry: CacheEntry):
+        if self._first is None or self._first.data[0] != 1:
+            self._first = self._buckets.appendleft((1, DoublyLinkedList()))
+
+        self._add_to_bucket(entry, self._first)
+
+    def _unlink(self, entry: CacheEntry):
+        bucket = entry.bucket
+        bucket.data[1].remove_node(entry.node)
+
+        if len(bucket.data[1]) == 0:
+            if bucket is self._first:
+                self._first = bucket.next
+            self._buckets.remove_node(bucket)
+
+    def _touch(self, entry: CacheEntry):
+        bucket = entry.bucket
+        frequency = bucket.data[0] + 1
+
+        following = bucket.next
+        if following is None or following.data[0] != frequency:
+            following = self._buckets.insert_after(bucket, (frequency, DoublyLinkedList()))
+
+        self._unlink(entry)
+        self._add_to_bucket(entry, following)
+
+    def _victim(self, exclude: Optional[CacheEntry]):
+        victim = self._first.data[1].get(-1)
+        if victim is exclude:
+            victim = self._first.next.data[1].get(-1)
+
+        return victim
@@ -1,4 +1,5 @@
 # pylint: skip-file
 
 from .singly_linked_list import SinglyLinkedList, SinglyLinkedNode
-from .doubly_linked_list import DoublyLinkedList, DoublyLinkedNode
\ No newline at end of file
+from .doubly_linked_list import DoublyLinkedList, DoublyLinkedNode
+from .unrolled_linked_list import UnrolledLinkedList
\ No newline at end of file
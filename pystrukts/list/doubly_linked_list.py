@@ -22,9 +22,26 @@ class DoublyLinkedNode:
         `__str__()`: Return the string representation of the node.
     '''
 
-    data: Any = None
-    prev: 'DoublyLinkedNode' = None
-    next: 'DoublyLinkedNode' = None
+    __slots__ = ('data', 'prev', 'next')
+
+    data: Any
+    prev: 'DoublyLinkedNode'
+    next: 'DoublyLinkedNode'
+
+    def __init__(self, data: Any = None, prev: 'DoublyLinkedNode' = None,
+                 next: 'DoublyLinkedNode' = None):  # pylint: disable=redefined-builtin
+        '''
+        Initialize the node.
+
+        Args:
+            data (Any): The data stored in the node.
+            prev (DoublyLinkedNode): The previous node in the list.
+            next (DoublyLinkedNode): The next node in the list.
+        '''
+
+        self.data = data
+        self.prev = prev
+        self.next = next
 
     def __str__(self):
         return f"DoublyLinkedNode({self.data}){' <-> ' + str(self.next) if self.next else ''}"
@@ -50,14 +67,20 @@ class DoublyLinkedList(LinkedList[DoublyLinkedNode]):
         `insert(data: Any, index: int)`: Insert data at the specified index.
         `append(data: Any)`: Append data to the end of the list.
         `appendleft(data: Any)`: Append data to the beginning of the list.
+        `insert_after(node: Type[T], data: Any)`: Insert data after the specified node.
+        `insert_before(node: Type[T], data: Any)`: Insert data before the specified node in O(1).
         `remove(index: int)`: Remove data at the specified index.
-        `pop()`: Remove data from the end of the list.
+        `remove_node(node: Type[T])`: Remove the specified node in O(1).
+        `move_to_front(node: Type[T])`: Move the specified node to the beginning in O(1).
+        `pop()`: Remove data from the end of the list in O(1).
         `popleft()`: Remove data from the beginning of the list.
-        `get(index: int)`: Get data at the specified index.
+        `get(index: int)`: Get data at the specified index, walking from the closest end.
         `index(data: Any)`: Get the index of the specified data.
         `clear()`: Clear the list.
     '''
 
+    _bidirectional = True
+
     def __init__(self, circular: bool = False):
         super().__init__(DoublyLinkedNode, circular)
 
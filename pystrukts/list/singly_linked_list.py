@@ -21,8 +21,23 @@ class SinglyLinkedNode:
         `__str__()`: Return the string representation of the node.
     '''
 
-    data: Any = None
-    next: 'SinglyLinkedNode' = None
+    __slots__ = ('data', 'next')
+
+    data: Any
+    next: 'SinglyLinkedNode'
+
+    def __init__(self, data: Any = None,
+                 next: 'SinglyLinkedNode' = None):  # pylint: disable=redefined-builtin
+        '''
+        Initialize the node.
+
+        Args:
+            data (Any): The data stored in the node.
+            next (SinglyLinkedNode): The next node in the list.
+        '''
+
+        self.data = data
+        self.next = next
 
     def __str__(self):
         return f"SinglyLinkedNode({self.data}){' -> ' + str(self.next) if self.next else ''}"
@@ -47,7 +62,11 @@ class SinglyLinkedList(LinkedList[SinglyLinkedNode]):
         `insert(data: Any, index: int)`: Insert data at the specified index.
         `append(data: Any)`: Append data to the end of the list.
         `appendleft(data: Any)`: Append data to the beginning of the list.
+        `insert_after(node: Type[T], data: Any)`: Insert data after the specified node.
+        `insert_before(node: Type[T], data: Any)`: Insert data before the specified node in O(n).
         `remove(index: int)`: Remove data at the specified index.
+        `remove_node(node: Type[T])`: Remove the specified node in O(n).
+        `move_to_front(node: Type[T])`: Move the specified node to the beginning in O(n).
         `pop()`: Remove data from the end of the list.
         `popleft()`: Remove data from the beginning of the list.
         `get(index: int)`: Get data at the specified index.
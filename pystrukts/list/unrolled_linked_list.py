@@ -0,0 +1,350 @@
+'''
+Unrolled Linked List Module.
+
+This module implements an Unrolled Linked List, a linked list of small arrays.
+'''
+
+from itertools import chain
+from typing import Any
+from .doubly_linked_list import DoublyLinkedList
+
+class UnrolledLinkedList:
+    '''
+    UnrolledLinkedList Class.
+
+    The elements are stored in blocks of at most `capacity` elements, kept in a
+    DoublyLinkedList. Iteration walks contiguous arrays, and indexing skips whole
+    blocks from the closest end of the list, so it takes O(n / capacity + capacity).
+    Blocks are split when they overflow and merged with their successor when they
+    fall below half their capacity.
+
+    The capacity doubles, and the blocks are regrouped in O(n), whenever the length
+    exceeds its square, so it stays between sqrt(n) and 2 sqrt(n) as the list grows
+    and indexing and insertion take O(sqrt(n)). It never shrinks, so after many
+    removals indexing degrades towards O(capacity).
+
+    Attributes:
+        capacity (int): The maximum number of elements in a block.
+        blocks (DoublyLinkedList): The blocks of the list, as Python lists.
+
+    Methods:
+        `__str__()`: Return the string representation of the list.
+        `__len__()`: Return the length of the list.
+        `__iter__()`: Return an iterator for the list.
+        `iscircular()`: Check if the list is circular.
+        `_preprocess_index(index: int)`: Preprocess the index.
+        `_locate(index: int)`: Find the block and offset of an index.
+        `_grow()`: Double the capacity if the list has outgrown it.
+        `insert(data: Any, index: int)`: Insert data at the specified index.
+        `append(data: Any)`: Append data to the end of the list.
+        `appendleft(data: Any)`: Append data to the beginning of the list.
+        `remove(index: int)`: Remove data at the specified index.
+        `pop()`: Remove data from the end of the list.
+        `popleft()`: Remove data from the beginning of the list.
+        `get(index: int)`: Get data at the specified index.
+        `index(data: Any)`: Get the index of the specified data.
+        `clear()`: Clear the list.
+    '''
+
+    __slots__ = ('capacity', 'blocks', '__length')
+
+    def __init__(self, capacity: int = 64):
+        '''
+        Initialize the UnrolledLinkedList.
+
+        Args:
+            capacity (int): The initial maximum number of elements in a block.
+
+        Raises:
+            ValueError: If the capacity is less than 2.
+        '''
+
+        if capacity < 2:
+            raise ValueError("Capacity must be at least 2")
+
+        self.capacity = capacity
+        self.blocks = DoublyLinkedList()
+        self.__length = 0
+
+    def __str__(self):
+        return f"{self.__class__.__name__}({list(self)})"
+
+    def __len__(self):
+        return self.__length
+
+    def __iter__(self):
+        '''
+        Return an iterator for the list.
+
+        Returns:
+            out (Iterator): The iterator for the list.
+        '''
+
+        return chain.from_iterable(self.blocks)
+
+    def iscircular(self):
+        '''
+        Check if the list is circular. Unrolled linked lists are never circular.
+
+        Returns:
+            out (bool): Whether the list is circular.
+        '''
+
+        return False
+
+    def _preprocess_index(self, index: int, insert: bool = False):
+        '''
+        Turn a possibly negative index into a non-negative one.
+
+        Args:
+            index (int): The index to preprocess.
+            insert (bool): Whether the index is for insertion, so it may equal the length.
+
+        Returns:
+            out (int): The preprocessed index.
+
+        Raises:
+            IndexError: If the index is out of bounds.
+        '''
+
+        bound = self.__length + 1 if insert else self.__length
+        if not -bound <= index < bound:
+            raise IndexError("Index out of bounds")
+
+        return index % bound
+
+    def _locate(self, index: int):
+        '''
+        Find the block holding an index, walking from the closest end of the list.
+
+        Args:
+            index (int): The index, which must be in bounds.
+
+        Returns:
+            out (Tuple[DoublyLinkedNode, int]): The node of the block and the offset in it.
+        '''
+
+        if index < self.__length // 2:
+            node = self.blocks.head
+            while index >= len(node.data):
+                index -= len(node.data)
+                node = node.next
+
+            return node, index
+
+        index = self.__length - 1 - index
+        node = self.blocks.tail
+        while index >= len(node.data):
+            index -= len(node.data)
+            node = node.prev
+
+        return node, len(node.data) - 1 - index
+
+    def _grow(self):
+        '''
+        Double the capacity and regroup the elements into full blocks if the length
+        exceeds the square of the capacity.
+        '''
+
+        if self.__length <= self.capacity * self.capacity:
+            return
+
+        data = list(self)
+        self.capacity *= 2
+        self.blocks.clear()
+        for start in range(0, len(data), self.capacity):
+            self.blocks.append(data[start:start + self.capacity])
+
+    def insert(self, data: Any, index: int):
+        '''
+        Insert data at the specified index.
+
+        Args:
+            data (Any): The data to be inserted.
+            index (int): The index to insert the data.
+
+        Raises:
+            IndexError: If the index is out of bounds.
+        '''
+
+        index = self._preprocess_index(index, insert=True)
+
+        if index == self.__length:
+            self.append(data)
+            return
+
+        node, offset = self._locate(index)
+        block = node.data
+
+        if len(block) == self.capacity:
+            half = self.capacity // 2
+            self.blocks.insert_after(node, block[half:])
+            del block[half:]
+
+            if offset > half:
+                node, offset = node.next, offset - half
+                block = node.data
+
+        block.insert(offset, data)
+        self.__length += 1
+        self._grow()
+
+    def append(self, data: Any):
+        '''
+        Append data to the end of the list.
+
+        Args:
+            data (Any): The data to be appended.
+        '''
+
+        tail = self.blocks.tail
+        if tail is None or len(tail.data) == self.capacity:
+            self.blocks.append([data])
+        else:
+            tail.data.append(data)
+
+        self.__length += 1
+        self._grow()
+
+    def appendleft(self, data: Any):
+        '''
+        Append data to the beginning of the list.
+
+        Args:
+            data (Any): The data to be appended.
+        '''
+
+        head = self.blocks.head
+        if head is None or len(head.data) == self.capacity:
+            self.blocks.appendleft([data])
+        else:
+            head.data.insert(0, data)
+
+        self.__length += 1
+        self._grow()
+
+    def remove(self, index: int):
+        '''
+        Remove data at the specified index.
+
+        Args:
+            index (int): The index to remove the data.
+
+        Returns:
+            out (Any): The removed data.
+
+        Raises:
+            IndexError: If the index is out of bounds.
+        '''
+
+        index = self._preprocess_index(index)
+
+        node, offset = self._locate(index)
+        block = node.data
+        data = block.pop(offset)
+        self.__length -= 1
+
+        following = node.next
+        if not block:
+            self.blocks.remove_node(node)
+        elif (len(block) < self.capacity // 2 and following is not None
+              and len(block) + len(following.data) <= self.capacity):
+            block.extend(following.data)
+            self.blocks.remove_node(following)
+
+        return data
+
+    def pop(self):
+        '''
+        Extract data from the end of the list.
+
+        Returns:
+            out (Any): The extracted data.
+
+        Raises:
+            IndexError: If the list is empty.
+        '''
+
+        if self.__length == 0:
+            raise IndexError("Empty list")
+
+        tail = self.blocks.tail
+        data = tail.data.pop()
+        if not tail.data:
+            self.blocks.pop()
+
+        self.__length -= 1
+
+        return data
+
+    def popleft(self):
+        '''
+        Extract data from the beginning of the list.
+
+        Returns:
+            out (Any): The extracted data.
+
+        Raises:
+            IndexError: If the list is empty.
+        '''
+
+        if self.__length == 0:
+            raise IndexError("Empty list")
+
+        head = self.blocks.head
+        data = head.data.pop(0)
+        if not head.data:
+            self.blocks.popleft()
+
+        self.__length -= 1
+
+        return data
+
+    def get(self, index: int):
+        '''
+        Get data at the specified index.
+
+        Args:
+            index (int): The index to get the data.
+
+        Returns:
+            out (Any): The data at the specified index.
+
+        Raises:
+            IndexError: If the index is out of bounds.
+        '''
+
+        node, offset = self._locate(self._preprocess_index(index))
+
+        return node.data[offset]
+
+    def index(self, data: Any):
+        '''
+        Get the index of the first occurrence of the specified data.
+
+        Args:
+            data (Any): The data to search for.
+
+        Returns:
+            out (int): The index of the specified data.
+
+        Raises:
+            ValueError: If the data is not found.
+        '''
+
+        start = 0
+        for block in self.blocks:
+            if data in block:
+                return start + block.index(data)
+
+            start += len(block)
+
+        raise ValueError("Data not found")
+
+    def clear(self):
+        '''
+        Remove all data from the list.
+        '''
+
+        self.blocks.clear()
+        self.__length = 0
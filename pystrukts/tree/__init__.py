@@ -1,7 +1,20 @@
 # pylint: skip-file
 
 from .trie import Trie, TrieNode
+from .frozen_trie import FrozenTrie
+from .aho_corasick import AhoCorasick
 from .generic_tree import GenericTree
+from .ancestor_index import AncestorIndex
+from .aggregate_tree import AggregateTree
+from .flat_tree import FlatTree
 from .binary_tree import BinaryTree
+from .array_binary_tree import ArrayBinaryTree
 from .binary_search_tree import BinarySearchTree
+from .binary_search_tree_map import BinarySearchTreeMap
+from .avl_tree import AVLTree
+from .red_black_tree import RedBlackTree
+from .order_statistic_tree import OrderStatisticTree
+from .persistent_binary_search_tree import PersistentBinarySearchTree
+from .b_plus_tree import BPlusTree
+from .treap import Treap
 from .fenwick_tree import FenwickTree, RUPQ, RURQ
\ No newline at end of file
@@ -0,0 +1,141 @@
+'''
+Aggregate tree module.
+
+This module contains a generic tree that keeps an aggregate of every subtree up to date.
+'''
+
+import operator
+from typing import Any, Callable, Optional
+from .generic_tree import GenericTree
+
+def _recompute(node: 'AggregateTree') -> None:
+    '''
+    Recomputes the aggregate of a node from its data and the aggregates of its children.
+
+    Args:
+        node (AggregateTree): The node.
+    '''
+    value = node.data if node.key is None else node.key(node.data)
+    for child in node.children:
+        value = node.op(value, child.aggregate)
+    node.aggregate = value
+
+def _propagate(node: Optional['AggregateTree']) -> None:
+    '''
+    Recomputes the aggregates of a node and its ancestors.
+
+    Args:
+        node (AggregateTree): The node.
+    '''
+    while node is not None:
+        _recompute(node)
+        node = node.parent
+
+class AggregateTree(GenericTree):
+    '''
+    Aggregate tree class.
+
+    This class represents a generic tree where every node caches the aggregate of its
+    subtree under an associative operation, combining its own value with the aggregates
+    of its children in order. Adding or removing a child and changing the data of a node
+    recompute the aggregates along the path to the root, so reading the aggregate of a
+    subtree takes O(1). Recomputing an ancestor folds the aggregates of all its children,
+    so an update costs O(sum of the degrees of the ancestors), not O(depth); `add_child`
+    folds the new child into its parent in O(1), leaving only the higher ancestors.
+
+    Trees built with `from_parent_array` or `from_edges`, or edited through the
+    `children` lists, must call `rebuild` on the root before reading aggregates.
+
+    Attributes:
+        parent (AggregateTree): The parent of the node, or None for the root.
+        aggregate (Any): The aggregate of the subtree rooted at the node.
+        op (Callable[[Any, Any], Any]): The associative operation.
+        key (Callable[[Any], Any]): The function mapping data to values, or None.
+    '''
+    __slots__ = ('parent', 'aggregate', 'op', 'key', '_data')
+
+    def __init__(self, data: Any, max_children: int = 0,
+                 op: Callable[[Any, Any], Any] = operator.add,
+                 key: Optional[Callable[[Any], Any]] = None):
+        '''
+        Initializes the tree.
+
+        Args:
+            data (Any): The data of the root node.
+            max_children (int): The maximum number of children the node can have.
+            op (Callable[[Any, Any], Any]): The associative operation. Defaults to addition.
+            key (Callable[[Any], Any]): The function mapping data to values. Defaults to none.
+        '''
+        self.op = op
+        self.key = key
+        self.parent = None
+        self.aggregate = None
+        # The data setter, called by the base initializer, needs the children.
+        self.children = []
+        super().__init__(data, max_children)
+
+    @property
+    def data(self) -> Any:
+        '''
+        The data of the node. Setting it updates the aggregates of its ancestors.
+        '''
+        return self._data
+
+    @data.setter
+    def data(self, value: Any) -> None:
+        self._data = value
+        _propagate(self)
+
+    def add_child(self, data: Any) -> None:
+        '''
+        Adds a child to the node and updates the aggregates of its ancestors.
+
+        Args:
+            data (Any): The data of the child.
+        '''
+        n_children = self.n_children()
+        super().add_child(data)
+        if self.n_children() > n_children:
+            child = self.children[-1]
+            child.op, child.key, child.parent = self.op, self.key, self
+            child._data = data
+            _recompute(child)
+            # The child comes last, so it folds into the aggregate of the node in O(1).
+            self.aggregate = self.op(self.aggregate, child.aggregate)
+            _propagate(self.parent)
+
+    def remove_child(self, index: int) -> None:
+        '''
+        Removes a child from the node and updates the aggregates of its ancestors.
+
+        Args:
+            index (int): The index of the child to be removed.
+        '''
+        child = self.children[index]
+        super().remove_child(index)
+        child.parent = None
+        _propagate(self)
+
+    def subtree_aggregate(self) -> Any:
+        '''
+        Returns the aggregate of the subtree rooted at the node.
+
+        Returns:
+            Any: The aggregate of the subtree.
+        '''
+        return self.aggregate
+
+    def rebuild(self) -> None:
+        '''
+        Recomputes every aggregate of the subtree rooted at the node, giving all its
+        nodes the operation and key of the node and fixing their parent links.
+        '''
+        for node in self.preorder():
+            for child in node.children:
+                child.op, child.key, child.parent = self.op, self.key, node
+
+        for node in self.postorder():
+            _recompute(node)
+
+        if self.parent is not None:
+            _propagate(self.parent)
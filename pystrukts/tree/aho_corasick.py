@@ -0,0 +1,129 @@
+'''
+Aho-Corasick Module.
+
+This module implements an Aho-Corasick automaton, which finds all the occurrences
+of a set of words in a text in a single pass. The automaton is compiled from a Trie.
+'''
+
+from collections import deque
+from typing import Generator, Iterable, Iterator, Tuple
+
+class AhoCorasick:
+    '''
+    AhoCorasick Class.
+
+    States are the nodes of the trie, numbered in level order. Each state has its
+    goto transitions, a failure link to the state of its longest proper suffix and
+    an output link to the nearest state on the failure chain that ends a word.
+
+    Attributes:
+        goto (list): The transitions of each state, as dictionaries.
+        fail (list): The failure link of each state.
+        output (list): The output link of each state, or -1 if there is none.
+        words (list): The word ending at each state, or None.
+
+    Methods:
+        `finditer(text: str)`: Find the occurrences of the words in a text.
+        `finditer_chunks(chunks: Iterable[str])`: Find the occurrences of the words
+            in a text given as an iterable of chunks.
+    '''
+
+    def __init__(self, trie):
+        '''
+        Compile the automaton from a trie. The trie is not modified, and later
+        changes to it are not reflected in the automaton. The empty word is ignored.
+
+        Args:
+            trie (Trie): The trie containing the words to search for.
+        '''
+
+        self.goto = [{}]
+        self.words = [None]
+
+        queue = deque([(trie.root, 0, '')])
+        while queue:
+            node, state, word = queue.popleft()
+            for char, child in node.children.items():
+                self.goto[state][char] = len(self.goto)
+                queue.append((child, len(self.goto), word + char))
+                self.goto.append({})
+                self.words.append(word + char if child.is_end_of_word else None)
+
+        self.fail = [0] * len(self.goto)
+        self.output = [-1] * len(self.goto)
+
+        for state, transitions in enumerate(self.goto):
+            for char, target in transitions.items():
+                link = 0
+                if state:
+                    link = self.fail[state]
+                    while link and char not in self.goto[link]:
+                        link = self.fail[link]
+                    link = self.goto[link].get(char, 0)
+
+                self.fail[target] = link
+                self.output[target] = link if self.words[link] is not None else self.output[link]
+
+    def _scan(self, text: str, state: int, offset: int) -> Generator[Tuple[int, str], None, int]:
+        '''
+        Run the automaton over a text. Helper function for the searches.
+
+        Args:
+            text (str): The text.
+            state (int): The state to start from.
+            offset (int): The position of the text in the whole input.
+
+        Yields:
+            out (Tuple[int, str]): The start position of each match and the word.
+
+        Returns:
+            out (int): The state after the last character of the text.
+        '''
+
+        goto, fail, output, words = self.goto, self.fail, self.output, self.words
+
+        for position, char in enumerate(text, offset + 1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            match = state if words[state] is not None else output[state]
+            while match != -1:
+                yield position - len(words[match]), words[match]
+                match = output[match]
+
+        return state
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, str]]:
+        '''
+        Find the occurrences of the words in a text, ordered by end position.
+        Overlapping occurrences are reported.
+
+        Args:
+            text (str): The text.
+
+        Yields:
+            out (Tuple[int, str]): The start position of each occurrence and the word.
+        '''
+
+        yield from self._scan(text, 0, 0)
+
+    def finditer_chunks(self, chunks: Iterable[str]) -> Iterator[Tuple[int, str]]:
+        '''
+        Find the occurrences of the words in a text given as an iterable of chunks,
+        such as the lines of a file. The state of the automaton is kept between
+        chunks, so occurrences spanning several chunks are found too.
+
+        Args:
+            chunks (Iterable[str]): The chunks of the text.
+
+        Yields:
+            out (Tuple[int, str]): The start position of each occurrence in the
+                whole text and the word.
+        '''
+
+        state = 0
+        offset = 0
+        for chunk in chunks:
+            state = yield from self._scan(chunk, state, offset)
+            offset += len(chunk)
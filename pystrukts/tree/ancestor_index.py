@@ -0,0 +1,252 @@
+'''
+Ancestor index module.
+
+This module contains an index over a GenericTree that answers lowest common ancestor
+and other ancestor queries without walking the tree.
+'''
+
+from array import array
+from bisect import bisect_right
+from typing import Dict, List, Optional
+from weakref import WeakSet
+from .generic_tree import GenericTree
+
+def _sparse_table(values: List[int]) -> List[array]:
+    '''
+    Builds a sparse table of range minimums, where the k-th row holds the minimum of
+    each window of 2^k values. The rows are arrays of C ints rather than lists.
+
+    Args:
+        values (List[int]): The values.
+
+    Returns:
+        List[array]: The rows of the table.
+    '''
+    table, row = [array('i', values)], values
+    while 1 << len(table) <= len(values):
+        half = 1 << (len(table) - 1)
+        row = list(map(min, row[:-half], row[half:]))
+        table.append(array('i', row))
+
+    return table
+
+def _cover(node: GenericTree, index: 'AncestorIndex', registries: Dict[int, tuple]) -> None:
+    '''
+    Adds an index to the set of indexes that cover a node. Nodes that shared a set
+    before share the new one, and nodes outside the index keep the old one.
+
+    Args:
+        node (GenericTree): The node.
+        index (AncestorIndex): The index being built.
+        registries (Dict[int, tuple]): The sets already replaced during this build,
+            mapping the id of each old set to the old set and its replacement.
+    '''
+    old = node.ancestor_indexes
+    if old is not None and index in old:
+        return
+
+    if id(old) not in registries:
+        new = WeakSet(old or ())
+        new.add(index)
+        registries[id(old)] = (old, new)
+
+    node.ancestor_indexes = registries[id(old)][1]
+
+class AncestorIndex:
+    '''
+    Ancestor index class.
+
+    The index numbers the nodes in pre-order and stores an Euler tour of the tree with
+    a sparse table of range minimums over it. In pre-order, the lowest common ancestor
+    of two nodes is the node with the smallest number between their positions in the
+    tour, so `lca` runs in O(1); `is_ancestor` and `depth` run in O(1) and
+    `kth_ancestor` in O(log n). Building the index takes O(n log n) time and memory,
+    with the sparse table stored as arrays of C ints.
+
+    The index registers itself in the `ancestor_indexes` set of every node it covers,
+    so several indexes over a tree and its subtrees are all invalidated by `add_child`
+    and `remove_child` on any node they cover. Pre-order numbers shift with every
+    change, so the index is not updated in place: the next query rebuilds it from
+    scratch in O(n log n), about 2 seconds for 200k nodes. The index therefore suits
+    trees that are queried much more often than they change. Changes made directly
+    to the `children` lists must be followed by a call to `invalidate`.
+
+    Attributes:
+        root (GenericTree): The root of the indexed tree.
+        valid (bool): Whether the index reflects the current shape of the tree.
+
+    Methods:
+        `invalidate()`: Marks the index as outdated.
+        `lca(a: GenericTree, b: GenericTree)`: Returns the lowest common ancestor of two nodes.
+        `is_ancestor(a: GenericTree, b: GenericTree)`: Checks if a node is an ancestor of another.
+        `depth(node: GenericTree)`: Returns the depth of a node.
+        `kth_ancestor(node: GenericTree, k: int)`: Returns the k-th ancestor of a node.
+    '''
+    __slots__ = ('root', '_nodes', '_first', '_last', '_depth', '_table', '_levels',
+                 '__weakref__')
+
+    def __init__(self, root: GenericTree):
+        '''
+        Builds the index over a tree.
+
+        Args:
+            root (GenericTree): The root of the tree.
+        '''
+        self.root = root
+        self._nodes: Optional[List[GenericTree]] = None
+        self._first: Dict[int, int] = {}
+        self._last: array = array('i')
+        self._depth: array = array('i')
+        self._table: List[array] = []
+        self._levels: List[array] = []
+        self._build()
+
+    @property
+    def valid(self) -> bool:
+        '''
+        Whether the index reflects the current shape of the tree.
+        '''
+        return self._nodes is not None
+
+    def invalidate(self) -> None:
+        '''
+        Marks the index as outdated, so it is rebuilt by the next query.
+        '''
+        self._nodes = None
+
+    def _build(self) -> None:
+        '''
+        Numbers the nodes in pre-order and builds the Euler tour and its sparse table.
+        '''
+        nodes, depth, last, euler = [self.root], [0], [0], [0]
+        first = {id(self.root): 0}
+        registries = {}
+        _cover(self.root, self, registries)
+
+        stack = [(0, iter(self.root.children))]
+        while stack:
+            parent, children = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                last[parent] = len(nodes) - 1
+                if stack:
+                    euler.append(stack[-1][0])
+                continue
+
+            _cover(child, self, registries)
+            index = len(nodes)
+            first[id(child)] = len(euler)
+            nodes.append(child)
+            depth.append(depth[parent] + 1)
+            last.append(index)
+            euler.append(index)
+            stack.append((index, iter(child.children)))
+
+        levels = [array('i') for _ in range(max(depth) + 1)]
+        for index, level in enumerate(depth):
+            levels[level].append(index)
+
+        self._nodes, self._first, self._last = nodes, first, array('i', last)
+        self._depth, self._levels = array('i', depth), levels
+        self._table = _sparse_table(euler)
+
+    def _index(self, node: GenericTree) -> int:
+        '''
+        Returns the pre-order number of a node, rebuilding the index if it is outdated.
+
+        Args:
+            node (GenericTree): The node.
+
+        Returns:
+            int: The pre-order number of the node.
+
+        Raises:
+            ValueError: If the node is not in the tree.
+        '''
+        if not self.valid:
+            self._build()
+
+        position = self._first.get(id(node))
+        if position is None or self._nodes[self._table[0][position]] is not node:
+            raise ValueError("Node is not in the indexed tree")
+
+        return self._table[0][position]
+
+    def lca(self, a: GenericTree, b: GenericTree) -> GenericTree:
+        '''
+        Returns the lowest common ancestor of two nodes.
+
+        Args:
+            a (GenericTree): The first node.
+            b (GenericTree): The second node.
+
+        Returns:
+            GenericTree: The deepest node that is an ancestor of both nodes.
+
+        Raises:
+            ValueError: If a node is not in the tree.
+        '''
+        self._index(a)
+        self._index(b)
+        lo, hi = sorted((self._first[id(a)], self._first[id(b)]))
+        level = (hi - lo + 1).bit_length() - 1
+        row = self._table[level]
+        return self._nodes[min(row[lo], row[hi - (1 << level) + 1])]
+
+    def is_ancestor(self, a: GenericTree, b: GenericTree) -> bool:
+        '''
+        Checks if a node is an ancestor of another. A node is an ancestor of itself.
+
+        Args:
+            a (GenericTree): The candidate ancestor.
+            b (GenericTree): The candidate descendant.
+
+        Returns:
+            bool: True if `a` is on the path from the root to `b`, False otherwise.
+
+        Raises:
+            ValueError: If a node is not in the tree.
+        '''
+        index = self._index(a)
+        return index <= self._index(b) <= self._last[index]
+
+    def depth(self, node: GenericTree) -> int:
+        '''
+        Returns the depth of a node.
+
+        Args:
+            node (GenericTree): The node.
+
+        Returns:
+            int: The number of edges between the root and the node.
+
+        Raises:
+            ValueError: If the node is not in the tree.
+        '''
+        index = self._index(node)
+        return self._depth[index]
+
+    def kth_ancestor(self, node: GenericTree, k: int) -> GenericTree:
+        '''
+        Returns the k-th ancestor of a node, the node itself being the 0-th.
+
+        Args:
+            node (GenericTree): The node.
+            k (int): The number of levels to go up.
+
+        Returns:
+            GenericTree: The ancestor, or None if `k` is greater than the depth of the node.
+
+        Raises:
+            ValueError: If `k` is negative or the node is not in the tree.
+        '''
+        if k < 0:
+            raise ValueError("k must not be negative")
+
+        index = self._index(node)
+        if k > self._depth[index]:
+            return None
+
+        level = self._levels[self._depth[index] - k]
+        return self._nodes[level[bisect_right(level, index) - 1]]
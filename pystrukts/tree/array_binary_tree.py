@@ -0,0 +1,325 @@
+'''
+Array Binary Tree module.
+
+This module contains the implementation of an implicit binary tree stored in an array,
+where the children of the node at index i are at indices 2i + 1 and 2i + 2.
+'''
+
+from collections import deque
+from typing import Any, Iterable, Iterator
+from .binary_tree import BinaryTree
+
+_EMPTY = object()
+
+class ArrayBinaryTree:
+    '''
+    Array binary tree class.
+
+    This class represents a binary tree stored in level order in a list, without node
+    objects or child pointers. It is meant for complete or nearly complete trees, such as
+    heaps or tournament brackets, since every missing node before the last one takes a slot.
+
+    Attributes:
+        nodes (list): The data of the nodes in level order. Missing nodes hold a sentinel.
+        size (int): The number of nodes in the tree.
+    '''
+    __slots__ = ('nodes', 'size')
+
+    def __init__(self, data: Iterable[Any] = ()):
+        '''
+        Initializes the tree as a complete binary tree.
+
+        Args:
+            data (Iterable[Any]): The data of the nodes, in level order.
+        '''
+        self.nodes = list(data)
+        self.size = len(self.nodes)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.level_order()
+
+    def __getitem__(self, index: int) -> Any:
+        '''
+        Returns the data of a node.
+
+        Args:
+            index (int): The index of the node.
+
+        Returns:
+            Any: The data of the node.
+
+        Raises:
+            IndexError: If there is no node at the index.
+        '''
+        if not self.exists(index):
+            raise IndexError("No node at index")
+
+        return self.nodes[index]
+
+    def __setitem__(self, index: int, data: Any) -> None:
+        '''
+        Sets the data of a node, adding the node if it does not exist.
+
+        Args:
+            index (int): The index of the node.
+            data (Any): The data of the node.
+
+        Raises:
+            IndexError: If the index is negative or the node has no parent.
+        '''
+        if index < 0 or (index > 0 and not self.exists(self.parent(index))):
+            raise IndexError("Node has no parent")
+
+        if index >= len(self.nodes):
+            self.nodes.extend([_EMPTY] * (index + 1 - len(self.nodes)))
+
+        if self.nodes[index] is _EMPTY:
+            self.size += 1
+
+        self.nodes[index] = data
+
+    @staticmethod
+    def left(index: int) -> int:
+        '''
+        Returns the index of the left child of a node.
+
+        Args:
+            index (int): The index of the node.
+
+        Returns:
+            int: The index of the left child.
+        '''
+        return 2 * index + 1
+
+    @staticmethod
+    def right(index: int) -> int:
+        '''
+        Returns the index of the right child of a node.
+
+        Args:
+            index (int): The index of the node.
+
+        Returns:
+            int: The index of the right child.
+        '''
+        return 2 * index + 2
+
+    @staticmethod
+    def parent(index: int) -> int:
+        '''
+        Returns the index of the parent of a node.
+
+        Args:
+            index (int): The index of the node.
+
+        Returns:
+            int: The index of the parent, -1 for the root.
+        '''
+        return (index - 1) // 2
+
+    def exists(self, index: int) -> bool:
+        '''
+        Checks whether there is a node at an index.
+
+        Args:
+            index (int): The index.
+
+        Returns:
+            bool: True if there is a node at the index, False otherwise.
+        '''
+        return 0 <= index < len(self.nodes) and self.nodes[index] is not _EMPTY
+
+    def is_leaf(self, index: int) -> bool:
+        '''
+        Checks whether a node is a leaf.
+
+        Args:
+            index (int): The index of the node.
+
+        Returns:
+            bool: True if the node is a leaf, False otherwise.
+        '''
+        return not self.exists(2 * index + 1) and not self.exists(2 * index + 2)
+
+    def preorder(self) -> Iterator[Any]:
+        '''
+        Lazily iterates over the data of the tree in pre-order.
+
+        Yields:
+            Any: The data of the nodes.
+        '''
+        stack = [0]
+        while stack:
+            index = stack.pop()
+            if self.exists(index):
+                yield self.nodes[index]
+                stack.append(2 * index + 2)
+                stack.append(2 * index + 1)
+
+    def _inorder_indices(self) -> Iterator[int]:
+        '''
+        Lazily iterates over the indices of the nodes in in-order.
+
+        Yields:
+            int: The indices of the nodes.
+        '''
+        stack = []
+        index = 0
+        while stack or self.exists(index):
+            if self.exists(index):
+                stack.append(index)
+                index = 2 * index + 1
+            else:
+                index = stack.pop()
+                yield index
+                index = 2 * index + 2
+
+    def inorder(self) -> Iterator[Any]:
+        '''
+        Lazily iterates over the data of the tree in in-order.
+
+        Yields:
+            Any: The data of the nodes.
+        '''
+        for index in self._inorder_indices():
+            yield self.nodes[index]
+
+    def postorder(self) -> Iterator[Any]:
+        '''
+        Lazily iterates over the data of the tree in post-order.
+
+        Yields:
+            Any: The data of the nodes.
+        '''
+        stack = [(0, False)]
+        while stack:
+            index, expanded = stack.pop()
+            if expanded:
+                yield self.nodes[index]
+            elif self.exists(index):
+                stack.append((index, True))
+                stack.append((2 * index + 2, False))
+                stack.append((2 * index + 1, False))
+
+    def level_order(self) -> Iterator[Any]:
+        '''
+        Lazily iterates over the data of the tree level by level, from left to right.
+        This is a sequential scan of the array.
+
+        Yields:
+            Any: The data of the nodes.
+        '''
+        for data in self.nodes:
+            if data is not _EMPTY:
+                yield data
+
+    @classmethod
+    def from_binary_tree(cls, tree: BinaryTree) -> 'ArrayBinaryTree':
+        '''
+        Builds an array binary tree from a BinaryTree.
+
+        Args:
+            tree (BinaryTree): The root of the tree.
+
+        Returns:
+            ArrayBinaryTree: The array binary tree.
+        '''
+        result = cls()
+        queue = deque([(tree, 0)])
+        while queue:
+            node, index = queue.popleft()
+            result[index] = node.data
+            if node.left is not None:
+                queue.append((node.left, 2 * index + 1))
+            if node.right is not None:
+                queue.append((node.right, 2 * index + 2))
+
+        return result
+
+    def to_binary_tree(self) -> BinaryTree:
+        '''
+        Builds a BinaryTree from the array binary tree.
+
+        Returns:
+            BinaryTree: The root of the tree, or None if the tree is empty.
+        '''
+        nodes = [None] * len(self.nodes)
+        for index, data in enumerate(self.nodes):
+            if data is _EMPTY:
+                continue
+
+            nodes[index] = BinaryTree(data)
+            if index > 0:
+                parent = nodes[(index - 1) // 2]
+                if index % 2 == 1:
+                    parent.left = nodes[index]
+                else:
+                    parent.right = nodes[index]
+
+        return nodes[0] if nodes else None
+
+    @classmethod
+    def from_sorted(cls, data: Iterable[Any]) -> 'ArrayBinaryTree':
+        '''
+        Builds a complete binary search tree from sorted data, using the Eytzinger layout.
+        Searches on this layout only touch one array per level and the top levels share
+        the first cache lines.
+
+        Args:
+            data (Iterable[Any]): The sorted data.
+
+        Returns:
+            ArrayBinaryTree: The binary search tree.
+        '''
+        data = list(data)
+        nodes = [_EMPTY] * len(data)
+
+        stack = []
+        index = 0
+        for value in data:
+            while index < len(nodes):
+                stack.append(index)
+                index = 2 * index + 1
+            index = stack.pop()
+            nodes[index] = value
+            index = 2 * index + 2
+
+        return cls(nodes)
+
+    def lower_bound(self, data: Any) -> int:
+        '''
+        Finds the node with the smallest data greater than or equal to the given data,
+        assuming the tree is a complete binary search tree built with `from_sorted`.
+
+        Args:
+            data (Any): The data to compare with.
+
+        Returns:
+            int: The index of the node, or -1 if all the data is smaller.
+        '''
+        nodes = self.nodes
+        n = len(nodes)
+        index = 0
+        while index < n:
+            index = 2 * index + 1 + (nodes[index] < data)
+
+        index += 1
+        index >>= (~index & (index + 1)).bit_length()
+        return index - 1
+
+    def search(self, data: Any) -> bool:
+        '''
+        Searches for data in the tree, assuming it is a complete binary search tree
+        built with `from_sorted`.
+
+        Args:
+            data (Any): The data to be searched.
+
+        Returns:
+            bool: True if the data is found, False otherwise.
+        '''
+        index = self.lower_bound(data)
+        return index != -1 and self.nodes[index] == data
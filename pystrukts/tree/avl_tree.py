@@ -0,0 +1,159 @@
+'''
+AVL Tree.
+
+This module contains the implementation of an AVL tree, a self-balancing binary search tree.
+'''
+
+from typing import Any, Optional
+from .binary_search_tree import BinarySearchTree, _rotate_left, _rotate_right
+
+def _height(node: 'AVLTree') -> int:
+    '''
+    Returns the height of a node.
+
+    Args:
+        node (AVLTree): The node, possibly None.
+
+    Returns:
+        int: The height of the node, 0 if it is None.
+    '''
+    return node.height if node is not None else 0
+
+def _update_height(node: 'AVLTree') -> None:
+    '''
+    Updates the height of a node from the heights of its children.
+
+    Args:
+        node (AVLTree): The node.
+    '''
+    node.height = 1 + max(_height(node.left), _height(node.right))
+
+def _rotate(node: 'AVLTree', left: bool) -> None:
+    '''
+    Rotates a subtree in place and updates the heights of the moved nodes.
+
+    Args:
+        node (AVLTree): The root of the subtree.
+        left (bool): Whether to rotate to the left or to the right.
+    '''
+    pivot = _rotate_left(node) if left else _rotate_right(node)
+    _update_height(pivot)
+    _update_height(node)
+
+def _rebalance(node: 'AVLTree') -> None:
+    '''
+    Restores the AVL property of a node after one of its subtrees changed.
+
+    Args:
+        node (AVLTree): The node.
+    '''
+    _update_height(node)
+    balance = _height(node.left) - _height(node.right)
+
+    if balance > 1:
+        if _height(node.left.left) < _height(node.left.right):
+            _rotate(node.left, left=True)
+        _rotate(node, left=False)
+    elif balance < -1:
+        if _height(node.right.right) < _height(node.right.left):
+            _rotate(node.right, left=False)
+        _rotate(node, left=True)
+
+class AVLTree(BinarySearchTree):
+    '''
+    AVL tree class.
+
+    This class represents an AVL tree. The heights of the two subtrees of every node
+    differ by at most one, so the height of the tree is O(log n). Rotations swap the
+    data of the nodes, so the root node stays the same after an insertion.
+    '''
+    __slots__ = ('height',)
+
+    def __init__(self, data: Any):
+        '''
+        Initializes the tree.
+
+        Args:
+            data (Any): The data of the root node.
+        '''
+        super().__init__(data)
+        self.height = 1
+
+    def insert(self, data: Any) -> None:
+        '''
+        Inserts a new node in the tree.
+
+        Args:
+            data (Any): The data of the new node.
+        '''
+        if data < self.data:
+            if self.left is None:
+                self.left = type(self)(data)
+            else:
+                self.left.insert(data)
+        elif data > self.data:
+            if self.right is None:
+                self.right = type(self)(data)
+            else:
+                self.right.insert(data)
+        else:
+            return
+
+        _rebalance(self)
+
+    def delete(self, data: Any) -> 'AVLTree':
+        '''
+        Returns the root of the tree after deleting a node.
+
+        Args:
+            data (Any): The data of the node to be deleted.
+
+        Returns:
+            AVLTree: The root of the tree after the deletion.
+        '''
+        if data == self.data:
+            if self.left is None or self.right is None:
+                return self.left or self.right
+
+            self.data = self._find_successor().data
+            self.right = self.right.delete(self.data)
+        elif data < self.data:
+            if self.left is not None:
+                self.left = self.left.delete(data)
+        elif self.right is not None:
+            self.right = self.right.delete(data)
+
+        _rebalance(self)
+        return self
+
+    @classmethod
+    def _join(cls, left: Optional['AVLTree'], node: 'AVLTree',
+              right: Optional['AVLTree']) -> 'AVLTree':
+        '''
+        Joins two trees with a detached node, assuming every data in `left` is less
+        than the data of the node and every data in `right` is greater. The node is
+        hung from the spine of the taller tree and rebalanced on the way up, in
+        O(|height(left) - height(right)|).
+
+        Args:
+            left (AVLTree): The left tree, possibly None.
+            node (AVLTree): The detached node.
+            right (AVLTree): The right tree, possibly None.
+
+        Returns:
+            AVLTree: The root of the joined tree.
+        '''
+        if _height(left) > _height(right) + 1:
+            left.right = cls._join(left.right, node, right)
+            _rebalance(left)
+            return left
+
+        if _height(right) > _height(left) + 1:
+            right.left = cls._join(left, node, right.left)
+            _rebalance(right)
+            return right
+
+        node.left = left
+        node.right = right
+        _update_height(node)
+        return node
@@ -0,0 +1,373 @@
+'''
+B+ Tree.
+
+This module contains the implementation of an in-memory B+ tree that maps keys to values.
+'''
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+@dataclass
+class BPlusNode:
+    '''
+    B+ tree node class.
+
+    Internal nodes have children and no values; leaves have values and a link
+    to the next leaf.
+
+    Attributes:
+        keys (List[Any]): The keys of the node, sorted.
+        children (List[BPlusNode]): The children of the node, or None for a leaf.
+        values (List[Any]): The values of the keys, or None for an internal node.
+        next (BPlusNode): The next leaf, or None.
+    '''
+    __slots__ = ('keys', 'children', 'values', 'next')
+
+    keys: List[Any]
+    children: Optional[List['BPlusNode']]
+    values: Optional[List[Any]]
+    next: Optional['BPlusNode']
+
+    def __init__(self, keys: List[Any], children: Optional[List['BPlusNode']] = None,
+                 values: Optional[List[Any]] = None):
+        '''
+        Initializes the node.
+
+        Args:
+            keys (List[Any]): The keys of the node, sorted.
+            children (List[BPlusNode]): The children of the node, or None for a leaf.
+            values (List[Any]): The values of the keys, or None for an internal node.
+        '''
+        self.keys = keys
+        self.children = children
+        self.values = values
+        self.next = None
+
+    @property
+    def is_leaf(self) -> bool:
+        '''
+        Checks if the node is a leaf.
+
+        Returns:
+            bool: True if the node is a leaf, False otherwise.
+        '''
+        return self.children is None
+
+def _chunks(items: List[Any], size: int) -> List[List[Any]]:
+    '''
+    Splits a list into the fewest chunks of at most `size` items, with sizes
+    differing by at most one.
+
+    Args:
+        items (List[Any]): The list to split.
+        size (int): The maximum size of a chunk.
+
+    Returns:
+        List[List[Any]]: The chunks.
+    '''
+    count = -(-len(items) // size)
+    quotient, remainder = divmod(len(items), count)
+    chunks = []
+    start = 0
+    for i in range(count):
+        end = start + quotient + (i < remainder)
+        chunks.append(items[start:end])
+        start = end
+
+    return chunks
+
+class BPlusTree:
+    '''
+    B+ tree class.
+
+    All values are stored in the leaves, which are linked in key order so range scans
+    walk the leaves sequentially. Every node holds at most `order - 1` keys in a flat
+    list, which keeps the tree shallow and the keys contiguous in memory.
+    There are no duplicate keys in the tree.
+
+    Attributes:
+        order (int): The maximum number of children of an internal node.
+        root (BPlusNode): The root node.
+        size (int): The number of keys in the tree.
+    '''
+    __slots__ = ('order', 'root', 'size')
+
+    def __init__(self, order: int = 64):
+        '''
+        Initializes the tree.
+
+        Args:
+            order (int): The maximum number of children of an internal node.
+
+        Raises:
+            ValueError: If the order is less than 3.
+        '''
+        if order < 3:
+            raise ValueError("Order must be at least 3")
+
+        self.order = order
+        self.root = BPlusNode([], values=[])
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, key: Any) -> bool:
+        leaf = self._find_leaf(key)
+        i = bisect_left(leaf.keys, key)
+        return i < len(leaf.keys) and leaf.keys[i] == key
+
+    def __iter__(self) -> Iterator[Any]:
+        for key, _ in self.items():
+            yield key
+
+    @property
+    def _min_keys(self) -> int:
+        '''
+        The minimum number of keys of a node other than the root.
+        '''
+        return (self.order - 1) // 2
+
+    @classmethod
+    def from_sorted(cls, items: Iterable[Tuple[Any, Any]], order: int = 64) -> 'BPlusTree':
+        '''
+        Builds a tree from (key, value) pairs sorted by key, bottom-up and in O(n).
+
+        Args:
+            items (Iterable[Tuple[Any, Any]]): The pairs, sorted by key and without duplicates.
+            order (int): The maximum number of children of an internal node.
+
+        Returns:
+            BPlusTree: The tree.
+
+        Raises:
+            ValueError: If the items are not sorted by key or have duplicate keys.
+        '''
+        tree = cls(order)
+        items = list(items)
+        if not items:
+            return tree
+
+        for i in range(1, len(items)):
+            if not items[i - 1][0] < items[i][0]:
+                raise ValueError("Items must be sorted by key without duplicates")
+
+        level = []
+        for chunk in _chunks(items, order - 1):
+            leaf = BPlusNode([key for key, _ in chunk], values=[value for _, value in chunk])
+            if level:
+                level[-1][0].next = leaf
+            level.append((leaf, chunk[0][0]))
+
+        while len(level) > 1:
+            level = [(BPlusNode([low for _, low in chunk[1:]], [node for node, _ in chunk]),
+                      chunk[0][1]) for chunk in _chunks(level, order)]
+
+        tree.root = level[0][0]
+        tree.size = len(items)
+        return tree
+
+    def _find_leaf(self, key: Any) -> BPlusNode:
+        '''
+        Finds the leaf where a key is or would be stored.
+
+        Args:
+            key (Any): The key.
+
+        Returns:
+            BPlusNode: The leaf.
+        '''
+        node = self.root
+        while not node.is_leaf:
+            node = node.children[bisect_right(node.keys, key)]
+
+        return node
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        '''
+        Gets the value of a key.
+
+        Args:
+            key (Any): The key.
+            default (Any): The value to return if the key is not in the tree.
+
+        Returns:
+            Any: The value of the key, or the default value.
+        '''
+        leaf = self._find_leaf(key)
+        i = bisect_left(leaf.keys, key)
+        if i < len(leaf.keys) and leaf.keys[i] == key:
+            return leaf.values[i]
+
+        return default
+
+    def _split(self, node: BPlusNode) -> Tuple[Any, BPlusNode]:
+        '''
+        Splits an overflowing node in two halves.
+
+        Args:
+            node (BPlusNode): The node, which keeps the lower half.
+
+        Returns:
+            Tuple[Any, BPlusNode]: The separator key and the new node with the upper half.
+        '''
+        mid = len(node.keys) // 2
+        if node.is_leaf:
+            right = BPlusNode(node.keys[mid:], values=node.values[mid:])
+            right.next = node.next
+            node.next = right
+            del node.keys[mid:], node.values[mid:]
+            return right.keys[0], right
+
+        separator = node.keys[mid]
+        right = BPlusNode(node.keys[mid + 1:], node.children[mid + 1:])
+        del node.keys[mid:], node.children[mid + 1:]
+        return separator, right
+
+    def _insert(self, node: BPlusNode, key: Any, value: Any) -> Optional[Tuple[Any, BPlusNode]]:
+        '''
+        Inserts a key into a subtree. Helper function for `insert`.
+
+        Args:
+            node (BPlusNode): The root of the subtree.
+            key (Any): The key.
+            value (Any): The value of the key.
+
+        Returns:
+            Tuple[Any, BPlusNode]: The separator and new sibling if the node was split, or None.
+        '''
+        if node.is_leaf:
+            i = bisect_left(node.keys, key)
+            if i < len(node.keys) and node.keys[i] == key:
+                node.values[i] = value
+                return None
+            node.keys.insert(i, key)
+            node.values.insert(i, value)
+            self.size += 1
+        else:
+            i = bisect_right(node.keys, key)
+            split = self._insert(node.children[i], key, value)
+            if split is None:
+                return None
+            node.keys.insert(i, split[0])
+            node.children.insert(i + 1, split[1])
+
+        return self._split(node) if len(node.keys) >= self.order else None
+
+    def insert(self, key: Any, value: Any = None) -> None:
+        '''
+        Inserts a key into the tree, or updates its value if it is already there.
+
+        Args:
+            key (Any): The key.
+            value (Any): The value of the key.
+        '''
+        split = self._insert(self.root, key, value)
+        if split is not None:
+            self.root = BPlusNode([split[0]], [self.root, split[1]])
+
+    def _rebalance(self, node: BPlusNode, i: int) -> None:
+        '''
+        Fixes an underflowing child by borrowing a key from a sibling, or by merging
+        it with one.
+
+        Args:
+            node (BPlusNode): The parent node.
+            i (int): The index of the underflowing child.
+        '''
+        child = node.children[i]
+        left = node.children[i - 1] if i > 0 else None
+        right = node.children[i + 1] if i + 1 < len(node.children) else None
+
+        if left is not None and len(left.keys) > self._min_keys:
+            if child.is_leaf:
+                child.keys.insert(0, left.keys.pop())
+                child.values.insert(0, left.values.pop())
+                node.keys[i - 1] = child.keys[0]
+            else:
+                child.keys.insert(0, node.keys[i - 1])
+                child.children.insert(0, left.children.pop())
+                node.keys[i - 1] = left.keys.pop()
+        elif right is not None and len(right.keys) > self._min_keys:
+            if child.is_leaf:
+                child.keys.append(right.keys.pop(0))
+                child.values.append(right.values.pop(0))
+                node.keys[i] = right.keys[0]
+            else:
+                child.keys.append(node.keys[i])
+                child.children.append(right.children.pop(0))
+                node.keys[i] = right.keys.pop(0)
+        else:
+            if left is None:
+                i += 1
+                left, child = child, right
+            if child.is_leaf:
+                left.keys.extend(child.keys)
+                left.values.extend(child.values)
+                left.next = child.next
+            else:
+                left.keys.append(node.keys[i - 1])
+                left.keys.extend(child.keys)
+                left.children.extend(child.children)
+            del node.keys[i - 1], node.children[i]
+
+    def _delete(self, node: BPlusNode, key: Any) -> None:
+        '''
+        Deletes a key from a subtree. Helper function for `delete`.
+
+        Args:
+            node (BPlusNode): The root of the subtree.
+            key (Any): The key.
+        '''
+        if node.is_leaf:
+            i = bisect_left(node.keys, key)
+            if i < len(node.keys) and node.keys[i] == key:
+                del node.keys[i], node.values[i]
+                self.size -= 1
+            return
+
+        i = bisect_right(node.keys, key)
+        self._delete(node.children[i], key)
+        if len(node.children[i].keys) < self._min_keys:
+            self._rebalance(node, i)
+
+    def delete(self, key: Any) -> None:
+        '''
+        Deletes a key from the tree, if it is there.
+
+        Args:
+            key (Any): The key.
+        '''
+        self._delete(self.root, key)
+        if not self.root.is_leaf and not self.root.keys:
+            self.root = self.root.children[0]
+
+    def items(self, lo: Any = None, hi: Any = None) -> Iterator[Tuple[Any, Any]]:
+        '''
+        Lazily iterates over the (key, value) pairs with keys in [lo, hi], in order,
+        walking the linked leaves.
+
+        Args:
+            lo (Any): The lower bound, or None for no lower bound.
+            hi (Any): The upper bound, or None for no upper bound.
+
+        Yields:
+            Tuple[Any, Any]: The (key, value) pairs in the range.
+        '''
+        if lo is None:
+            leaf = self.root
+            while not leaf.is_leaf:
+                leaf = leaf.children[0]
+            i = 0
+        else:
+            leaf = self._find_leaf(lo)
+            i = bisect_left(leaf.keys, lo)
+
+        while leaf is not None:
+            for j in range(i, len(leaf.keys)):
+                if hi is not None and leaf.keys[j] > hi:
+                    return
+                yield leaf.keys[j], leaf.values[j]
+            leaf = leaf.next
+            i = 0
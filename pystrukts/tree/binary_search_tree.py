@@ -4,15 +4,88 @@ Binary Search Tree.
 This module contains the implementation of a binary search tree.
 '''
 
-from typing import Any
+from typing import Any, Callable, Iterator, Optional
 from .binary_tree import BinaryTree
 
+def _rotate_left(node: 'BinarySearchTree') -> 'BinarySearchTree':
+    '''
+    Rotates a subtree to the left, in place. The data of the node and its right child
+    are swapped, so the node stays at the root of the subtree.
+
+    Args:
+        node (BinarySearchTree): The root of the subtree.
+
+    Returns:
+        BinarySearchTree: The node that was moved down to the left.
+    '''
+    pivot = node.right
+    node.data, pivot.data = pivot.data, node.data
+    node.right = pivot.right
+    pivot.right = pivot.left
+    pivot.left = node.left
+    node.left = pivot
+    return pivot
+
+def _rotate_right(node: 'BinarySearchTree') -> 'BinarySearchTree':
+    '''
+    Rotates a subtree to the right, in place. The data of the node and its left child
+    are swapped, so the node stays at the root of the subtree.
+
+    Args:
+        node (BinarySearchTree): The root of the subtree.
+
+    Returns:
+        BinarySearchTree: The node that was moved down to the right.
+    '''
+    pivot = node.left
+    node.data, pivot.data = pivot.data, node.data
+    node.left = pivot.left
+    pivot.left = pivot.right
+    pivot.right = node.right
+    node.right = pivot
+    return pivot
+
+def _solve(step: Callable, first: Any, second: Any) -> Any:
+    '''
+    Evaluates a divide and conquer operation on two trees with an explicit stack, so
+    that it does not recurse once per level of an unbalanced tree.
+
+    Args:
+        step (Callable): Takes the two trees of a subproblem and returns either its
+            result and None, or None and a tuple with the arguments of the left and
+            right subproblems and a function that merges their results.
+        first (Any): The first tree of the problem.
+        second (Any): The second tree of the problem.
+
+    Returns:
+        Any: The result of the problem.
+    '''
+    stack = [(first, second)]
+    results = []
+    while stack:
+        task = stack.pop()
+        if callable(task):
+            right = results.pop()
+            left = results.pop()
+            results.append(task(left, right))
+            continue
+
+        result, subproblems = step(*task)
+        if subproblems is None:
+            results.append(result)
+        else:
+            left, right, merge = subproblems
+            stack.extend((merge, right, left))
+
+    return results.pop()
+
 class BinarySearchTree(BinaryTree):
     '''
     Binary search tree class.
 
     This class represents a binary search tree. There are no duplicate nodes in the tree.
     '''
+    __slots__ = ()
 
     def insert(self, data: Any) -> None:
         '''
@@ -21,16 +94,21 @@ class BinarySearchTree(BinaryTree):
         Args:
             data (Any): The data of the new node.
         '''
-        if data < self.data:
-            if self.left is None:
-                self.left = BinarySearchTree(data)
-            else:
-                self.left.insert(data)
-        elif data > self.data:
-            if self.right is None:
-                self.right = BinarySearchTree(data)
+        node = self
+        while True:
+            if data < node.data:
+                child = node.left
+                if child is None:
+                    node.left = type(self)(data)
+                    return
+            elif data > node.data:
+                child = node.right
+                if child is None:
+                    node.right = type(self)(data)
+                    return
             else:
-                self.right.insert(data)
+                return
+            node = child
 
     def search(self, data: Any) -> bool:
         '''
@@ -42,15 +120,13 @@ class BinarySearchTree(BinaryTree):
         Returns:
             bool: True if the data is found, False otherwise.
         '''
-        if self.data == data:
-            return True
-
-        child = self.left if data < self.data else self.right
-
-        if child is None:
-            return False
+        node = self
+        while node is not None:
+            if node.data == data:
+                return True
+            node = node.left if data < node.data else node.right
 
-        return child.search(data)
+        return False
 
     def _find_successor(self) -> 'BinarySearchTree':
         '''
@@ -76,20 +152,402 @@ class BinarySearchTree(BinaryTree):
         Returns:
             BinarySearchTree: The root of the tree after the deletion.
         '''
-        if data < self.data:
-            if self.left is not None:
-                self.left = self.left.delete(data)
-        elif data > self.data:
-            if self.right is not None:
-                self.right = self.right.delete(data)
-        else:
-            if self.left is None:
-                return self.right
-            if self.right is None:
-                return self.left
+        parent, node = None, self
+        while node is not None:
+            if data < node.data:
+                parent, node = node, node.left
+            elif data > node.data:
+                parent, node = node, node.right
+            else:
+                break
+
+        if node is None:
+            return self
 
-            temp = self._find_successor()
-            self.data = temp.data
-            self.right = self.right.delete(temp.data)
+        if node.left is not None and node.right is not None:
+            parent, successor = node, node.right
+            while successor.left is not None:
+                parent, successor = successor, successor.left
+            node.data = successor.data
+            node = successor
+
+        child = node.left if node.left is not None else node.right
+
+        if parent is None:
+            return child
+        if parent.left is node:
+            parent.left = child
+        else:
+            parent.right = child
 
         return self
+
+    def min(self) -> Any:
+        '''
+        Returns the smallest data in the tree.
+
+        Returns:
+            Any: The smallest data in the tree.
+        '''
+        node = self
+        while node.left is not None:
+            node = node.left
+
+        return node.data
+
+    def max(self) -> Any:
+        '''
+        Returns the largest data in the tree.
+
+        Returns:
+            Any: The largest data in the tree.
+        '''
+        node = self
+        while node.right is not None:
+            node = node.right
+
+        return node.data
+
+    def floor(self, data: Any) -> Any:
+        '''
+        Returns the largest data in the tree that is less than or equal to the given data.
+
+        Args:
+            data (Any): The data to compare with.
+
+        Returns:
+            Any: The floor of the data, or None if there is none.
+        '''
+        result = None
+        node = self
+        while node is not None:
+            if data < node.data:
+                node = node.left
+            elif data > node.data:
+                result = node.data
+                node = node.right
+            else:
+                return node.data
+
+        return result
+
+    def ceiling(self, data: Any) -> Any:
+        '''
+        Returns the smallest data in the tree that is greater than or equal to the given data.
+
+        Args:
+            data (Any): The data to compare with.
+
+        Returns:
+            Any: The ceiling of the data, or None if there is none.
+        '''
+        result = None
+        node = self
+        while node is not None:
+            if data < node.data:
+                result = node.data
+                node = node.left
+            elif data > node.data:
+                node = node.right
+            else:
+                return node.data
+
+        return result
+
+    def _irange_nodes(self, lo: Any, hi: Any) -> Iterator['BinarySearchTree']:
+        '''
+        Lazily iterates over the nodes with data in the range [lo, hi], in order.
+        Helper function for `irange`.
+
+        Args:
+            lo (Any): The lower bound of the range, or None for no lower bound.
+            hi (Any): The upper bound of the range, or None for no upper bound.
+
+        Yields:
+            BinarySearchTree: The nodes in the range, in increasing order.
+        '''
+        stack = []
+        node = self
+        while stack or node is not None:
+            if node is not None:
+                if lo is not None and node.data < lo:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            else:
+                node = stack.pop()
+                if hi is not None and node.data > hi:
+                    return
+                yield node
+                node = node.right
+
+    def irange(self, lo: Any = None, hi: Any = None) -> Iterator[Any]:
+        '''
+        Lazily iterates over the data in the range [lo, hi], in order.
+        Subtrees outside the range are not visited.
+
+        Args:
+            lo (Any): The lower bound of the range, or None for no lower bound.
+            hi (Any): The upper bound of the range, or None for no upper bound.
+
+        Yields:
+            Any: The data in the range, in increasing order.
+        '''
+        for node in self._irange_nodes(lo, hi):
+            yield node.data
+
+    @classmethod
+    def _join(cls, left: Optional['BinarySearchTree'], node: 'BinarySearchTree',
+              right: Optional['BinarySearchTree']) -> 'BinarySearchTree':
+        '''
+        Joins two trees with a detached node, assuming every data in `left` is less
+        than the data of the node and every data in `right` is greater. Subclasses
+        override this to keep their balance information.
+
+        Args:
+            left (BinarySearchTree): The left tree, possibly None.
+            node (BinarySearchTree): The detached node.
+            right (BinarySearchTree): The right tree, possibly None.
+
+        Returns:
+            BinarySearchTree: The root of the joined tree.
+        '''
+        node.left = left
+        node.right = right
+        return node
+
+    @classmethod
+    def _split(cls, tree: Optional['BinarySearchTree'], data: Any) -> tuple:
+        '''
+        Splits a tree by some data. Helper function for the set operations.
+
+        Args:
+            tree (BinarySearchTree): The tree, possibly None.
+            data (Any): The data to split by.
+
+        Returns:
+            tuple: The tree with the smaller data, the detached node with the data
+                if it was in the tree, and the tree with the greater data.
+        '''
+        smaller = node = greater = None
+        path = []
+        while tree is not None:
+            left, right = tree.left, tree.right
+            tree.left = tree.right = None
+
+            if data < tree.data:
+                path.append((tree, True, right))
+                tree = left
+            elif data > tree.data:
+                path.append((tree, False, left))
+                tree = right
+            else:
+                smaller, node, greater = left, cls._join(None, tree, None), right
+                break
+
+        for parent, went_left, other in reversed(path):
+            if went_left:
+                greater = cls._join(greater, parent, other)
+            else:
+                smaller = cls._join(other, parent, smaller)
+        return smaller, node, greater
+
+    @classmethod
+    def _split_last(cls, tree: 'BinarySearchTree') -> tuple:
+        '''
+        Detaches the node with the largest data of a tree.
+
+        Args:
+            tree (BinarySearchTree): The tree.
+
+        Returns:
+            tuple: The rest of the tree and the detached node.
+        '''
+        path = []
+        while True:
+            left, right = tree.left, tree.right
+            tree.left = tree.right = None
+            if right is None:
+                break
+            path.append((tree, left))
+            tree = right
+
+        rest, last = left, cls._join(None, tree, None)
+        for parent, other in reversed(path):
+            rest = cls._join(other, parent, rest)
+        return rest, last
+
+    @classmethod
+    def _concat(cls, left: Optional['BinarySearchTree'],
+                right: Optional['BinarySearchTree']) -> Optional['BinarySearchTree']:
+        '''
+        Joins two trees, assuming every data in `left` is less than every data in `right`.
+
+        Args:
+            left (BinarySearchTree): The left tree, possibly None.
+            right (BinarySearchTree): The right tree, possibly None.
+
+        Returns:
+            BinarySearchTree: The root of the joined tree, or None if both are empty.
+        '''
+        if left is None:
+            return right
+        if right is None:
+            return left
+
+        rest, last = cls._split_last(left)
+        return cls._join(rest, last, right)
+
+    @classmethod
+    def _union(cls, first: Optional['BinarySearchTree'],
+               second: Optional['BinarySearchTree']) -> Optional['BinarySearchTree']:
+        '''
+        Returns the union of two trees, keeping the nodes of the first one.
+        Helper function for `union`.
+
+        Args:
+            first (BinarySearchTree): The first tree, possibly None.
+            second (BinarySearchTree): The second tree, possibly None.
+
+        Returns:
+            BinarySearchTree: The root of the union, or None if it is empty.
+        '''
+        def step(first, second):
+            if first is None:
+                return second, None
+            if second is None:
+                return first, None
+
+            left, right = first.left, first.right
+            first.left = first.right = None
+            smaller, _, greater = cls._split(second, first.data)
+            return None, ((left, smaller), (right, greater),
+                          lambda left, right: cls._join(left, first, right))
+
+        return _solve(step, first, second)
+
+    @classmethod
+    def _intersection(cls, first: Optional['BinarySearchTree'],
+                      second: Optional['BinarySearchTree']) -> Optional['BinarySearchTree']:
+        '''
+        Returns the intersection of two trees, keeping the nodes of the first one.
+        Helper function for `intersection`.
+
+        Args:
+            first (BinarySearchTree): The first tree, possibly None.
+            second (BinarySearchTree): The second tree, possibly None.
+
+        Returns:
+            BinarySearchTree: The root of the intersection, or None if it is empty.
+        '''
+        def step(first, second):
+            if first is None or second is None:
+                return None, None
+
+            left, right = first.left, first.right
+            first.left = first.right = None
+            smaller, node, greater = cls._split(second, first.data)
+            if node is None:
+                return None, ((left, smaller), (right, greater), cls._concat)
+            return None, ((left, smaller), (right, greater),
+                          lambda left, right: cls._join(left, first, right))
+
+        return _solve(step, first, second)
+
+    @classmethod
+    def _difference(cls, first: Optional['BinarySearchTree'],
+                    second: Optional['BinarySearchTree']) -> Optional['BinarySearchTree']:
+        '''
+        Returns the nodes of the first tree whose data is not in the second one.
+        Helper function for `difference`.
+
+        Args:
+            first (BinarySearchTree): The first tree, possibly None.
+            second (BinarySearchTree): The second tree, possibly None.
+
+        Returns:
+            BinarySearchTree: The root of the difference, or None if it is empty.
+        '''
+        def step(first, second):
+            if first is None or second is None:
+                return first, None
+
+            left, right = second.left, second.right
+            second.left = second.right = None
+            smaller, _, greater = cls._split(first, second.data)
+            return None, ((smaller, left), (greater, right), cls._concat)
+
+        return _solve(step, first, second)
+
+    def split(self, data: Any) -> tuple:
+        '''
+        Splits the tree by some data. The tree is consumed.
+
+        Args:
+            data (Any): The data to split by.
+
+        Returns:
+            tuple: The tree with the smaller data, the detached node with the data
+                if it was in the tree, and the tree with the greater data. Empty trees are None.
+        '''
+        return self._split(self, data)
+
+    def join(self, other: Optional['BinarySearchTree']) -> 'BinarySearchTree':
+        '''
+        Joins the tree with a tree whose data is all greater. Both trees are consumed.
+
+        Args:
+            other (BinarySearchTree): The tree with the greater data, possibly None.
+
+        Returns:
+            BinarySearchTree: The root of the joined tree.
+
+        Raises:
+            ValueError: If some data in the other tree is not greater than the data in the tree.
+        '''
+        if other is not None and not self.max() < other.min():
+            raise ValueError("Data in the other tree must be greater")
+
+        return self._concat(self, other)
+
+    def union(self, other: Optional['BinarySearchTree']) -> 'BinarySearchTree':
+        '''
+        Returns the union of the tree and another tree of the same class, in
+        O(m log(n / m + 1)) on balanced trees. Both trees are consumed, and for data
+        in both of them the node of this tree is kept.
+
+        Args:
+            other (BinarySearchTree): The other tree, possibly None.
+
+        Returns:
+            BinarySearchTree: The root of the union.
+        '''
+        return self._union(self, other)
+
+    def intersection(self, other: Optional['BinarySearchTree']) -> Optional['BinarySearchTree']:
+        '''
+        Returns the intersection of the tree and another tree of the same class, in
+        O(m log(n / m + 1)) on balanced trees. Both trees are consumed, and the nodes
+        of this tree are kept.
+
+        Args:
+            other (BinarySearchTree): The other tree, possibly None.
+
+        Returns:
+            BinarySearchTree: The root of the intersection, or None if it is empty.
+        '''
+        return self._intersection(self, other)
+
+    def difference(self, other: Optional['BinarySearchTree']) -> Optional['BinarySearchTree']:
+        '''
+        Returns the data of the tree that is not in another tree of the same class, in
+        O(m log(n / m + 1)) on balanced trees. Both trees are consumed.
+
+        Args:
+            other (BinarySearchTree): The other tree, possibly None.
+
+        Returns:
+            BinarySearchTree: The root of the difference, or None if it is empty.
+        '''
+        return self._difference(self, other)
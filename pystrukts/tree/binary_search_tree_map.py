@@ -0,0 +1,190 @@
+'''
+Binary Search Tree Map.
+
+This module contains the implementation of a binary search tree that maps keys to values.
+'''
+
+from typing import Any, Iterable, Iterator, List, Tuple
+from .binary_search_tree import BinarySearchTree
+
+class BinarySearchTreeMap(BinarySearchTree):
+    '''
+    Binary search tree map class.
+
+    This class represents a binary search tree where every node stores a value along
+    with its data, which is used as the key. There are no duplicate keys in the tree.
+    '''
+    __slots__ = ('value',)
+
+    def __init__(self, data: Any, value: Any = None):
+        '''
+        Initializes the tree.
+
+        Args:
+            data (Any): The key of the root node.
+            value (Any): The value of the root node.
+        '''
+        super().__init__(data)
+        self.value = value
+
+    @classmethod
+    def _build(cls, items: List[Tuple[Any, Any]], lo: int, hi: int) -> 'BinarySearchTreeMap':
+        '''
+        Builds a perfectly balanced tree from a slice of sorted items.
+        Helper function for `from_sorted`.
+
+        Args:
+            items (List[Tuple[Any, Any]]): The sorted (key, value) pairs.
+            lo (int): The first index of the slice.
+            hi (int): The last index of the slice, inclusive.
+
+        Returns:
+            BinarySearchTreeMap: The root of the tree, or None if the slice is empty.
+        '''
+        if lo > hi:
+            return None
+
+        mid = (lo + hi) // 2
+        node = cls(*items[mid])
+        node.left = cls._build(items, lo, mid - 1)
+        node.right = cls._build(items, mid + 1, hi)
+        return node
+
+    @classmethod
+    def from_sorted(cls, items: Iterable[Tuple[Any, Any]]) -> 'BinarySearchTreeMap':
+        '''
+        Builds a perfectly balanced tree from (key, value) pairs sorted by key,
+        in O(n) and without comparing the keys.
+
+        Args:
+            items (Iterable[Tuple[Any, Any]]): The pairs, sorted by key and without duplicates.
+
+        Returns:
+            BinarySearchTreeMap: The root of the tree, or None if there are no items.
+        '''
+        items = list(items)
+        return cls._build(items, 0, len(items) - 1)
+
+    def _find(self, data: Any) -> 'BinarySearchTreeMap':
+        '''
+        Finds the node with the given key.
+
+        Args:
+            data (Any): The key to be searched.
+
+        Returns:
+            BinarySearchTreeMap: The node, or None if the key is not in the tree.
+        '''
+        node = self
+        while node is not None and node.data != data:
+            node = node.left if data < node.data else node.right
+
+        return node
+
+    def insert(self, data: Any, value: Any = None) -> None:
+        '''
+        Inserts a new node in the tree. If the key is already in the tree, its value is replaced.
+
+        Args:
+            data (Any): The key of the new node.
+            value (Any): The value of the new node.
+        '''
+        parent, node = None, self
+        while node is not None and node.data != data:
+            parent, node = node, node.left if data < node.data else node.right
+
+        if node is not None:
+            node.value = value
+        elif data < parent.data:
+            parent.left = type(self)(data, value)
+        else:
+            parent.right = type(self)(data, value)
+
+    def get(self, data: Any, default: Any = None) -> Any:
+        '''
+        Returns the value associated with a key.
+
+        Args:
+            data (Any): The key.
+            default (Any): The value returned if the key is not in the tree.
+
+        Returns:
+            Any: The value of the key, or the default value.
+        '''
+        node = self._find(data)
+        return node.value if node is not None else default
+
+    def delete(self, data: Any) -> 'BinarySearchTreeMap':
+        '''
+        Returns the root of the tree after deleting a node.
+
+        Args:
+            data (Any): The key of the node to be deleted.
+
+        Returns:
+            BinarySearchTreeMap: The root of the tree after the deletion.
+        '''
+        node = self._find(data)
+        if node is not None and node.left is not None and node.right is not None:
+            successor = node.right
+            while successor.left is not None:
+                successor = successor.left
+            node.value = successor.value
+
+        return super().delete(data)
+
+    def items(self, lo: Any = None, hi: Any = None) -> Iterator[Tuple[Any, Any]]:
+        '''
+        Lazily iterates over the (key, value) pairs with keys in the range [lo, hi], in order.
+
+        Args:
+            lo (Any): The lower bound of the range, or None for no lower bound.
+            hi (Any): The upper bound of the range, or None for no upper bound.
+
+        Yields:
+            Tuple[Any, Any]: The pairs in the range, in increasing order of key.
+        '''
+        for node in self._irange_nodes(lo, hi):
+            yield node.data, node.value
+
+    def update(self, items: Iterable[Tuple[Any, Any]]) -> None:
+        '''
+        Inserts a batch of (key, value) pairs sorted by key. The batch is merged with the
+        contents of the tree and the tree is rebuilt perfectly balanced, in O(n + m).
+        Existing keys take the value from the batch, and for repeated keys in the batch
+        the last value is kept.
+
+        Args:
+            items (Iterable[Tuple[Any, Any]]): The pairs, sorted by key.
+
+        Raises:
+            ValueError: If the batch is not sorted.
+        '''
+        batch = []
+        for key, value in items:
+            if batch and key < batch[-1][0]:
+                raise ValueError("Items must be sorted by key")
+            if batch and not batch[-1][0] < key:
+                batch[-1] = (key, value)
+            else:
+                batch.append((key, value))
+
+        current = list(self.items())
+        merged = []
+        i = j = 0
+        while i < len(current) and j < len(batch):
+            if batch[j][0] < current[i][0]:
+                merged.append(batch[j])
+                j += 1
+            elif current[i][0] < batch[j][0]:
+                merged.append(current[i])
+                i += 1
+            else:
+                merged.append(batch[j])
+                i += 1
+                j += 1
+        merged.extend(current[i:])
+        merged.extend(batch[j:])
+
+        root = self._build(merged, 0, len(merged) - 1)
+        self.data, self.value, self.left, self.right = root.data, root.value, root.left, root.right
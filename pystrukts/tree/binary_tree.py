@@ -4,7 +4,33 @@ Binary Tree module.
 This module contains the implementation of a binary tree.
 '''
 
-from typing import Any
+from collections import deque
+from typing import Any, Iterator, Optional, Tuple
+
+def _morris_step(node: 'BinaryTree') -> Tuple[Optional['BinaryTree'], Optional['BinaryTree']]:
+    '''
+    Advances a Morris in-order traversal by one step, threading or unthreading
+    the in-order predecessor of the node.
+
+    Args:
+        node (BinaryTree): The current node.
+
+    Returns:
+        Tuple[BinaryTree, BinaryTree]: The next node and the visited node, if any.
+    '''
+    if node.left is None:
+        return node.right, node
+
+    predecessor = node.left
+    while predecessor.right is not None and predecessor.right is not node:
+        predecessor = predecessor.right
+
+    if predecessor.right is None:
+        predecessor.right = node
+        return node.left, None
+
+    predecessor.right = None
+    return node.right, node
 
 class BinaryTree():
     '''
@@ -12,6 +38,8 @@ class BinaryTree():
 
     This class represents a binary tree.
     '''
+    __slots__ = ('data', '__left', '__right')
+
     def __init__(self, data: Any):
         '''
         Initializes the tree.
@@ -85,3 +113,93 @@ class BinaryTree():
             bool: True if the node is a leaf, False otherwise.
         '''
         return self.__left is None and self.__right is None
+
+    def preorder(self) -> Iterator['BinaryTree']:
+        '''
+        Lazily iterates over the nodes of the tree in pre-order.
+
+        Yields:
+            BinaryTree: The nodes of the tree.
+        '''
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
+
+    def inorder(self) -> Iterator['BinaryTree']:
+        '''
+        Lazily iterates over the nodes of the tree in in-order.
+
+        Yields:
+            BinaryTree: The nodes of the tree.
+        '''
+        stack = []
+        node = self
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node.left
+            else:
+                node = stack.pop()
+                yield node
+                node = node.right
+
+    def postorder(self) -> Iterator['BinaryTree']:
+        '''
+        Lazily iterates over the nodes of the tree in post-order.
+
+        Yields:
+            BinaryTree: The nodes of the tree.
+        '''
+        stack = []
+        last = None
+        node = self
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node.left
+            elif stack[-1].right is not None and stack[-1].right is not last:
+                node = stack[-1].right
+            else:
+                last = stack.pop()
+                yield last
+
+    def level_order(self) -> Iterator['BinaryTree']:
+        '''
+        Lazily iterates over the nodes of the tree level by level, from left to right.
+
+        Yields:
+            BinaryTree: The nodes of the tree.
+        '''
+        queue = deque([self])
+        while queue:
+            node = queue.popleft()
+            yield node
+            if node.left is not None:
+                queue.append(node.left)
+            if node.right is not None:
+                queue.append(node.right)
+
+    def morris_inorder(self) -> Iterator['BinaryTree']:
+        '''
+        Lazily iterates over the nodes of the tree in in-order using O(1) extra memory.
+        The traversal temporarily links nodes to their in-order successors, so the
+        tree must not be modified or inspected until the iteration ends. If the
+        iterator is closed early, the tree is restored.
+
+        Yields:
+            BinaryTree: The nodes of the tree.
+        '''
+        node = self
+        try:
+            while node is not None:
+                node, visited = _morris_step(node)
+                if visited is not None:
+                    yield visited
+        finally:
+            while node is not None:
+                node, _ = _morris_step(node)
@@ -0,0 +1,220 @@
+'''
+Flat tree module.
+
+This module contains the implementation of a generic tree stored as parallel arrays,
+which uses far less memory than one object per node.
+'''
+
+from array import array
+from collections import deque
+from warnings import warn
+from typing import Any, Iterator
+from .generic_tree import GenericTree
+
+class FlatTree:
+    '''
+    Flat tree class.
+
+    This class represents a generic tree with an optional number of children, stored
+    in columns: node `i` is described by the i-th entry of each array, and its children
+    form a linked list through `first_child` and `next_sibling`. Nodes are identified by
+    their index; the root is node 0.
+
+    Attributes:
+        data (list): The data of each node.
+        parent (array): The parent of each node, or -1 for the root.
+        first_child (array): The first child of each node, or -1.
+        last_child (array): The last child of each node, or -1.
+        next_sibling (array): The next sibling of each node, or -1.
+        counts (array): The number of children of each node.
+        max_children (int): The maximum number of children of a node, or None.
+
+    Methods:
+        `add_child(node: int, data: Any)`: Adds a child to a node.
+        `get_child(node: int, index: int)`: Returns a child of a node.
+        `children(node: int)`: Iterates over the children of a node.
+        `n_children(node: int)`: Returns the number of children of a node.
+        `is_leaf(node: int)`: Returns whether a node is a leaf.
+        `preorder(node: int)`: Iterates over the nodes of a subtree in pre-order.
+        `from_generic_tree(tree: GenericTree)`: Builds a flat tree from a GenericTree.
+        `to_generic_tree()`: Converts the flat tree to a GenericTree.
+    '''
+    __slots__ = ('data', 'parent', 'first_child', 'last_child', 'next_sibling', 'counts',
+                 'max_children')
+
+    def __init__(self, data: Any, max_children: int = 0):
+        '''
+        Initializes the tree with a root node. If max_children is less than 2,
+        there are no restrictions on the number of children.
+
+        Args:
+            data (Any): The data of the root node.
+            max_children (int): The maximum number of children a node can have.
+        '''
+        self.data = [data]
+        self.parent = array('q', [-1])
+        self.first_child = array('q', [-1])
+        self.last_child = array('q', [-1])
+        self.next_sibling = array('q', [-1])
+        self.counts = array('q', [0])
+        self.max_children = int(max_children) if max_children > 1 else None
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, node: int) -> Any:
+        return self.data[node]
+
+    def __setitem__(self, node: int, data: Any) -> None:
+        self.data[node] = data
+
+    def add_child(self, node: int, data: Any) -> int:
+        '''
+        Adds a child to a node, after its other children.
+
+        Args:
+            node (int): The parent node.
+            data (Any): The data of the child.
+
+        Returns:
+            int: The new node, or -1 if the node already has the maximum number of children.
+        '''
+        if self.max_children is not None and self.counts[node] >= self.max_children:
+            warn(f"Child not appended as node already has {self.max_children} children.")
+            return -1
+
+        child = len(self.data)
+        self.data.append(data)
+        self.parent.append(node)
+        self.first_child.append(-1)
+        self.last_child.append(-1)
+        self.next_sibling.append(-1)
+        self.counts.append(0)
+
+        if self.last_child[node] == -1:
+            self.first_child[node] = child
+        else:
+            self.next_sibling[self.last_child[node]] = child
+        self.last_child[node] = child
+        self.counts[node] += 1
+
+        return child
+
+    def n_children(self, node: int) -> int:
+        '''
+        Returns the number of children of a node.
+
+        Args:
+            node (int): The node.
+
+        Returns:
+            int: The number of children of the node.
+        '''
+        return self.counts[node]
+
+    def children(self, node: int) -> Iterator[int]:
+        '''
+        Lazily iterates over the children of a node.
+
+        Args:
+            node (int): The node.
+
+        Yields:
+            int: The children of the node, in order.
+        '''
+        child = self.first_child[node]
+        while child != -1:
+            yield child
+            child = self.next_sibling[child]
+
+    def get_child(self, node: int, index: int) -> int:
+        '''
+        Returns a child of a node, walking its siblings in O(index).
+
+        Args:
+            node (int): The node.
+            index (int): The index of the child, which may be negative.
+
+        Returns:
+            int: The child of the node.
+
+        Raises:
+            IndexError: If the index is out of range.
+        '''
+        if index < 0:
+            index += self.counts[node]
+        if not 0 <= index < self.counts[node]:
+            raise IndexError("Child index out of range")
+
+        child = self.first_child[node]
+        for _ in range(index):
+            child = self.next_sibling[child]
+
+        return child
+
+    def is_leaf(self, node: int) -> bool:
+        '''
+        Returns whether a node is a leaf or not.
+
+        Args:
+            node (int): The node.
+
+        Returns:
+            bool: True if the node is a leaf, False otherwise.
+        '''
+        return self.counts[node] == 0
+
+    def preorder(self, node: int = 0) -> Iterator[int]:
+        '''
+        Lazily iterates over the nodes of a subtree in pre-order.
+
+        Args:
+            node (int): The root of the subtree. Defaults to the root of the tree.
+
+        Yields:
+            int: The nodes of the subtree.
+        '''
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(list(self.children(node))))
+
+    @classmethod
+    def from_generic_tree(cls, tree: GenericTree) -> 'FlatTree':
+        '''
+        Builds a flat tree from a GenericTree, numbering the nodes level by level.
+
+        Args:
+            tree (GenericTree): The root of the tree.
+
+        Returns:
+            FlatTree: The flat tree.
+
+        Raises:
+            ValueError: If a node has more children than the maximum of the root.
+        '''
+        flat = cls(tree.data, tree.max_children or 0)
+        queue = deque([(tree, 0)])
+        while queue:
+            node, index = queue.popleft()
+            if flat.max_children is not None and len(node.children) > flat.max_children:
+                raise ValueError(f"Node {node.data!r} has more than {flat.max_children} children")
+            for child in node.children:
+                queue.append((child, flat.add_child(index, child.data)))
+
+        return flat
+
+    def to_generic_tree(self) -> GenericTree:
+        '''
+        Converts the flat tree to a GenericTree.
+
+        Returns:
+            GenericTree: The root of the tree.
+        '''
+        nodes = [GenericTree(self.data[0], self.max_children or 0)]
+        for node in range(1, len(self)):
+            nodes.append(GenericTree(self.data[node], self.max_children or 0))
+            nodes[self.parent[node]].children.append(nodes[node])
+
+        return nodes[0]
@@ -0,0 +1,353 @@
+'''
+Frozen Trie Module.
+
+This module implements an immutable, succinct Trie encoded as a LOUDS
+(Level-Order Unary Degree Sequence) bitvector. A FrozenTrie can be saved to
+a file and reopened with `mmap`, so several processes can share the same pages.
+'''
+
+import mmap
+import struct
+from array import array
+from bisect import bisect_left
+from collections import deque
+from typing import Iterator, Tuple
+
+_MAGIC = b'PSTRIE\x00\x01'
+_BYTEORDER = 0x0102030405060708
+_HEADER = struct.Struct('=8sQQQQ')
+_WORD_MASK = (1 << 64) - 1
+
+
+def _pad(data: bytes) -> bytes:
+    '''
+    Pad a byte string to a multiple of 8 bytes.
+
+    Args:
+        data (bytes): The data to pad.
+
+    Returns:
+        out (bytes): The padded data.
+    '''
+    return data + b'\x00' * (-len(data) % 8)
+
+
+class FrozenTrie:
+    '''
+    FrozenTrie Class.
+
+    The structure of the trie is stored as a LOUDS bitvector: a `10` prefix for a
+    super-root, followed by `d` ones and a zero for each node of degree `d` in
+    level order. Nodes are identified by their level-order index, and the
+    children of a node are always contiguous, so navigation only needs `select0`.
+
+    Attributes:
+        _bits (memoryview): The LOUDS bitvector, as 64-bit words.
+        _ranks (memoryview): The number of ones before each word of `_bits`.
+        _labels (memoryview): The code point of the edge leading to each node.
+        _terminal (memoryview): Bitvector marking the nodes that end a word.
+
+    Methods:
+        `__len__()`: Return the number of words in the trie.
+        `__contains__(word: str)`: Check if a word is in the trie.
+        `__iter__()`: Return an iterator over the words of the trie.
+        `from_trie(trie: Trie)`: Build a frozen trie from a Trie.
+        `load(path: str)`: Open a frozen trie saved to a file using `mmap`.
+        `save(path: str)`: Save the frozen trie to a file.
+        `to_bytes()`: Return the serialised frozen trie.
+        `close()`: Release the underlying buffer.
+        `search(word: str)`: Search for a word in the trie.
+        `startswith(prefix: str)`: Check if the trie contains a prefix.
+        `keys(prefix: str)`: Iterate over the words starting with a prefix.
+    '''
+
+    def __init__(self, buffer):
+        '''
+        Initialize the FrozenTrie from a serialised buffer. No data is copied.
+
+        Args:
+            buffer (bytes-like): The serialised trie, as returned by `to_bytes`.
+
+        Raises:
+            ValueError: If the buffer does not contain a valid frozen trie.
+        '''
+
+        if len(buffer) < _HEADER.size:
+            raise ValueError("Buffer too small to contain a frozen trie")
+
+        magic, byteorder, n_nodes, n_bits, n_words = _HEADER.unpack_from(buffer)
+        if magic != _MAGIC:
+            raise ValueError("Buffer does not contain a frozen trie")
+        if byteorder != _BYTEORDER:
+            raise ValueError("Frozen trie was saved on a platform with a different byte order")
+
+        n_bit_words = (n_bits + 63) // 64
+        layout = []
+        offset = _HEADER.size
+        for fmt, count in (('Q', n_bit_words), ('I', n_bit_words + 1),
+                           ('I', n_nodes), ('Q', (n_nodes + 63) // 64)):
+            size = count * struct.calcsize(fmt)
+            layout.append((fmt, offset, size))
+            offset += size + (-size % 8)
+
+        if offset > len(buffer):
+            raise ValueError("Buffer is truncated")
+
+        self._mmap = None
+        self._buffer = memoryview(buffer)
+        sections = [self._buffer[start:start + size].cast(fmt) for fmt, start, size in layout]
+
+        self._bits, self._ranks, self._labels, self._terminal = sections
+        self._n_words = n_words
+
+    def __len__(self):
+        return self._n_words
+
+    def __contains__(self, word: str):
+        return self.search(word)
+
+    def __iter__(self):
+        return self.keys()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @classmethod
+    def from_trie(cls, trie) -> 'FrozenTrie':
+        '''
+        Build a frozen trie from a Trie.
+
+        Args:
+            trie (Trie): The trie to freeze.
+
+        Returns:
+            out (FrozenTrie): The frozen trie.
+        '''
+
+        bits = array('Q', [1])
+        n_bits = 2
+        labels = array('I', [0])
+        terminal = array('Q')
+        n_nodes = 0
+        n_words = 0
+
+        queue = deque([trie.root])
+        while queue:
+            node = queue.popleft()
+
+            if n_nodes % 64 == 0:
+                terminal.append(0)
+            if node.is_end_of_word:
+                terminal[-1] |= 1 << (n_nodes % 64)
+                n_words += 1
+            n_nodes += 1
+
+            for char in sorted(node.children):
+                if n_bits % 64 == 0:
+                    bits.append(0)
+                bits[-1] |= 1 << (n_bits % 64)
+                n_bits += 1
+                labels.append(ord(char))
+                queue.append(node.children[char])
+
+            if n_bits % 64 == 0:
+                bits.append(0)
+            n_bits += 1
+
+        ranks = array('I', [0])
+        for word in bits:
+            ranks.append(ranks[-1] + bin(word).count('1'))
+
+        header = _HEADER.pack(_MAGIC, _BYTEORDER, n_nodes, n_bits, n_words)
+        return cls(header + b''.join(_pad(section.tobytes())
+                                     for section in (bits, ranks, labels, terminal)))
+
+    @classmethod
+    def load(cls, path: str) -> 'FrozenTrie':
+        '''
+        Open a frozen trie saved to a file. The file is mapped in memory, so
+        opening is instantaneous and pages are shared between processes.
+
+        Args:
+            path (str): The path of the file.
+
+        Returns:
+            out (FrozenTrie): The frozen trie.
+        '''
+
+        with open(path, 'rb') as file:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            frozen = cls(mapping)
+        except ValueError:
+            mapping.close()
+            raise
+
+        frozen._mmap = mapping
+        return frozen
+
+    def save(self, path: str) -> None:
+        '''
+        Save the frozen trie to a file.
+
+        Args:
+            path (str): The path of the file.
+        '''
+
+        with open(path, 'wb') as file:
+            file.write(self._buffer)
+
+    def to_bytes(self) -> bytes:
+        '''
+        Return the serialised frozen trie.
+
+        Returns:
+            out (bytes): The serialised frozen trie.
+        '''
+
+        return self._buffer.tobytes()
+
+    def close(self) -> None:
+        '''
+        Release the underlying buffer, closing the file mapping if there is one.
+        '''
+
+        for view in (self._bits, self._ranks, self._labels, self._terminal, self._buffer):
+            view.release()
+
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def _select0(self, k: int) -> int:
+        '''
+        Find the position of the k-th zero of the LOUDS bitvector.
+
+        Args:
+            k (int): The rank of the zero, starting at 1.
+
+        Returns:
+            out (int): The position of the k-th zero.
+        '''
+
+        bits, ranks = self._bits, self._ranks
+
+        lo, hi = 0, len(bits) - 1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if 64 * mid - ranks[mid] < k:
+                lo = mid
+            else:
+                hi = mid - 1
+
+        word = ~bits[lo] & _WORD_MASK
+        for _ in range(k - (64 * lo - ranks[lo]) - 1):
+            word &= word - 1
+
+        return 64 * lo + (word & -word).bit_length() - 1
+
+    def _children(self, node: int) -> Tuple[int, int]:
+        '''
+        Return the range of the children of a node.
+
+        Args:
+            node (int): The node.
+
+        Returns:
+            out (Tuple[int, int]): The first child and the end of the range.
+        '''
+
+        start = self._select0(node + 1)
+        end = self._select0(node + 2)
+        return start - node, end - node - 1
+
+    def _is_terminal(self, node: int) -> bool:
+        '''
+        Check if a node ends a word.
+
+        Args:
+            node (int): The node.
+
+        Returns:
+            out (bool): Whether the node ends a word.
+        '''
+
+        return (self._terminal[node >> 6] >> (node & 63)) & 1 == 1
+
+    def _find(self, prefix: str) -> int:
+        '''
+        Find the node reached by a prefix.
+
+        Args:
+            prefix (str): The prefix.
+
+        Returns:
+            out (int): The node, or -1 if the prefix is not in the trie.
+        '''
+
+        labels = self._labels
+        node = 0
+        for char in prefix:
+            first, end = self._children(node)
+            code = ord(char)
+            node = bisect_left(labels, code, first, end)
+            if node == end or labels[node] != code:
+                return -1
+        return node
+
+    def search(self, word: str) -> bool:
+        '''
+        Search for a word in the trie.
+
+        Args:
+            word (str): The word to search.
+
+        Returns:
+            out (bool): Whether the word is in the trie.
+        '''
+
+        node = self._find(word)
+        return node != -1 and self._is_terminal(node)
+
+    def startswith(self, prefix: str) -> bool:
+        '''
+        Check if the trie contains a prefix.
+
+        Args:
+            prefix (str): The prefix to check.
+
+        Returns:
+            out (bool): Whether the trie contains the prefix.
+        '''
+
+        return self._find(prefix) != -1
+
+    def keys(self, prefix: str = '') -> Iterator[str]:
+        '''
+        Iterate over the words starting with a prefix, in lexicographic order.
+
+        Args:
+            prefix (str): The prefix of the words.
+
+        Yields:
+            out (str): The words starting with the prefix.
+        '''
+
+        node = self._find(prefix)
+        if node == -1:
+            return
+
+        labels = self._labels
+        stack = [(node, prefix)]
+        while stack:
+            node, word = stack.pop()
+            if self._is_terminal(node):
+                yield word
+
+            first, end = self._children(node)
+            for child in range(end - 1, first - 1, -1):
+                stack.append((child, word + chr(labels[child])))
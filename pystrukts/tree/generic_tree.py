@@ -4,9 +4,55 @@ Generic tree module.
 This module contains the implementation of a generic tree with an optional number of children.
 '''
 
+from collections import deque
 from dataclasses import dataclass
 from warnings import warn
-from typing import Any
+from typing import Any, Hashable, Iterable, Iterator, Optional, Sequence, Tuple
+
+def _attach(parent: 'GenericTree', child: 'GenericTree') -> None:
+    '''
+    Appends an existing node to the children of a node.
+
+    Args:
+        parent (GenericTree): The parent node.
+        child (GenericTree): The node to be appended.
+
+    Raises:
+        ValueError: If the parent already has the maximum number of children.
+    '''
+    if parent.max_children is not None and parent.n_children() >= parent.max_children:
+        raise ValueError(f"Node {parent.data!r} has more than {parent.max_children} children")
+
+    parent.children.append(child)
+
+def _invalidate(node: 'GenericTree') -> None:
+    '''
+    Invalidates every AncestorIndex that covers a node.
+
+    Args:
+        node (GenericTree): The node whose children changed.
+    '''
+    for index in node.ancestor_indexes or ():
+        index.invalidate()
+
+def _check_connected(root: 'GenericTree', n_nodes: int) -> 'GenericTree':
+    '''
+    Checks that every node that was created is reachable from the root.
+
+    Args:
+        root (GenericTree): The root of the tree.
+        n_nodes (int): The number of nodes that were created.
+
+    Returns:
+        GenericTree: The root of the tree.
+
+    Raises:
+        ValueError: If some node is not reachable from the root.
+    '''
+    if sum(1 for _ in root.preorder()) != n_nodes:
+        raise ValueError("Nodes are not connected to the root")
+
+    return root
 
 @dataclass
 class GenericTree:
@@ -14,7 +60,12 @@ class GenericTree:
     Generic tree class.
 
     This class represents a generic tree with an optional number of children.
+    If AncestorIndex objects have been built over the tree or its subtrees,
+    `ancestor_indexes` holds the ones that cover the node, shared by the nodes
+    covered by the same indexes, so that adding or removing children invalidates them.
     '''
+    __slots__ = ('data', 'children', 'max_children', 'ancestor_indexes')
+
     def __init__(self, data: Any, max_children: int = 0):
         '''
         Initializes the tree. If max_children is less than 2,
@@ -26,12 +77,86 @@ class GenericTree:
         '''
         self.data = data
         self.children = []
+        self.ancestor_indexes = None
 
         if max_children == 2:
             warn("Binary trees are better represented using the BinaryTree class.")
 
         self.max_children = int(max_children) if max_children > 1 else None
 
+    @classmethod
+    def from_parent_array(cls, parents: Sequence[int], data: Optional[Sequence[Any]] = None,
+                          max_children: int = 0) -> 'GenericTree':
+        '''
+        Builds a tree from a parent array, where `parents[i]` is the index of the
+        parent of the i-th node, or -1 for the root. Children keep the order of
+        their indices.
+
+        Args:
+            parents (Sequence[int]): The index of the parent of each node.
+            data (Sequence[Any]): The data of each node. Defaults to the indices.
+            max_children (int): The maximum number of children of each node.
+
+        Returns:
+            GenericTree: The root of the tree.
+
+        Raises:
+            ValueError: If the array does not describe a tree, or a node has too many children.
+        '''
+        if data is None:
+            data = range(len(parents))
+        if len(data) != len(parents):
+            raise ValueError("Parents and data must have the same length")
+
+        nodes = [cls(value, max_children) for value in data]
+        root = None
+        for node, parent in zip(nodes, parents):
+            if parent == -1:
+                if root is not None:
+                    raise ValueError("Parent array has more than one root")
+                root = node
+            elif 0 <= parent < len(nodes):
+                _attach(nodes[parent], node)
+            else:
+                raise ValueError(f"Parent index {parent} out of range")
+
+        if root is None:
+            raise ValueError("Parent array has no root")
+
+        return _check_connected(root, len(nodes))
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Tuple[Hashable, Hashable]], root: Hashable,
+                   max_children: int = 0) -> 'GenericTree':
+        '''
+        Builds a tree from (parent, child) pairs of node data, which must be unique
+        and hashable. Children keep the order of the edges.
+
+        Args:
+            edges (Iterable[Tuple[Hashable, Hashable]]): The (parent, child) pairs.
+            root (Hashable): The data of the root.
+            max_children (int): The maximum number of children of each node.
+
+        Returns:
+            GenericTree: The root of the tree.
+
+        Raises:
+            ValueError: If the edges do not describe a tree, or a node has too many children.
+        '''
+        nodes = {root: cls(root, max_children)}
+        has_parent = {root}
+        for parent, child in edges:
+            if child in has_parent:
+                raise ValueError(f"Node {child!r} has more than one parent or is the root")
+            has_parent.add(child)
+
+            for value in (parent, child):
+                if value not in nodes:
+                    nodes[value] = cls(value, max_children)
+            _attach(nodes[parent], nodes[child])
+
+        return _check_connected(nodes[root], len(nodes))
+
     def n_children(self) -> int:
         '''
         Returns the number of children of the node.
@@ -52,8 +177,10 @@ class GenericTree:
         if self.max_children is not None and self.n_children() >= self.max_children:
             warn(f"Child not appended as node already has {self.max_children} children.")
         else:
-            new_node = GenericTree(data, self.max_children)
+            new_node = type(self)(data, self.max_children or 0)
+            new_node.ancestor_indexes = self.ancestor_indexes
             self.children.append(new_node)
+            _invalidate(self)
 
     def remove_child(self, index: int) -> None:
         '''
@@ -63,6 +190,7 @@ class GenericTree:
             index (int): The index of the child to be removed.
         '''
         self.children.pop(index)
+        _invalidate(self)
 
     def get_children(self) -> list:
         '''
@@ -93,3 +221,55 @@ class GenericTree:
             bool: True if the node is a leaf, False otherwise.
         '''
         return self.n_children() == 0
+
+    def iter_children(self) -> Iterator['GenericTree']:
+        '''
+        Iterates over the children of the node without copying them.
+
+        Returns:
+            Iterator[GenericTree]: An iterator over the children of the node.
+        '''
+        return iter(self.children)
+
+    def preorder(self) -> Iterator['GenericTree']:
+        '''
+        Lazily iterates over the nodes of the tree in pre-order (depth-first).
+
+        Yields:
+            GenericTree: The nodes of the tree.
+        '''
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+    def postorder(self) -> Iterator['GenericTree']:
+        '''
+        Lazily iterates over the nodes of the tree in post-order.
+
+        Yields:
+            GenericTree: The nodes of the tree.
+        '''
+        stack = [(self, iter(self.children))]
+        while stack:
+            node, children = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                yield node
+            else:
+                stack.append((child, iter(child.children)))
+
+    def level_order(self) -> Iterator['GenericTree']:
+        '''
+        Lazily iterates over the nodes of the tree level by level (breadth-first).
+
+        Yields:
+            GenericTree: The nodes of the tree.
+        '''
+        queue = deque([self])
+        while queue:
+            node = queue.popleft()
+            yield node
+            queue.extend(node.children)
@@ -0,0 +1,155 @@
+'''
+Order Statistic Tree.
+
+This module contains the implementation of a binary search tree augmented with subtree sizes.
+'''
+
+from typing import Any, Optional
+from .binary_search_tree import BinarySearchTree
+
+def _size(node: 'OrderStatisticTree') -> int:
+    '''
+    Returns the size of a subtree.
+
+    Args:
+        node (OrderStatisticTree): The root of the subtree, possibly None.
+
+    Returns:
+        int: The number of nodes in the subtree, 0 if it is None.
+    '''
+    return node.size if node is not None else 0
+
+class OrderStatisticTree(BinarySearchTree):
+    '''
+    Order statistic tree class.
+
+    This class represents a binary search tree where every node stores the size of its
+    subtree, so the rank of a data and the data with a given rank are found in O(h).
+    '''
+    __slots__ = ('size',)
+
+    def __init__(self, data: Any):
+        '''
+        Initializes the tree.
+
+        Args:
+            data (Any): The data of the root node.
+        '''
+        super().__init__(data)
+        self.size = 1
+
+    def __len__(self) -> int:
+        return self.size
+
+    def insert(self, data: Any) -> None:
+        '''
+        Inserts a new node in the tree.
+
+        Args:
+            data (Any): The data of the new node.
+        '''
+        if self.search(data):
+            return
+
+        node = self
+        while node is not None:
+            node.size += 1
+            node = node.left if data < node.data else node.right
+
+        super().insert(data)
+
+    def delete(self, data: Any) -> 'OrderStatisticTree':
+        '''
+        Returns the root of the tree after deleting a node.
+
+        Args:
+            data (Any): The data of the node to be deleted.
+
+        Returns:
+            OrderStatisticTree: The root of the tree after the deletion.
+        '''
+        if not self.search(data):
+            return self
+
+        node = self
+        while node.data != data:
+            node.size -= 1
+            node = node.left if data < node.data else node.right
+
+        if node.left is not None and node.right is not None:
+            node.size -= 1
+            node = node.right
+            while node is not None:
+                node.size -= 1
+                node = node.left
+
+        return super().delete(data)
+
+    def rank(self, data: Any) -> int:
+        '''
+        Returns the number of nodes in the tree with data less than the given data.
+
+        Args:
+            data (Any): The data to compare with.
+
+        Returns:
+            int: The rank of the data.
+        '''
+        rank = 0
+        node = self
+        while node is not None and node.data != data:
+            if data < node.data:
+                node = node.left
+            else:
+                rank += _size(node.left) + 1
+                node = node.right
+
+        return rank + _size(node.left) if node is not None else rank
+
+    def select(self, k: int) -> Any:
+        '''
+        Returns the data with the given rank, that is, the k-th smallest data starting at 0.
+
+        Args:
+            k (int): The rank of the data. Negative values count from the end.
+
+        Returns:
+            Any: The data with rank k.
+
+        Raises:
+            IndexError: If k is out of bounds.
+        '''
+        if k < 0:
+            k += self.size
+
+        if k < 0 or k >= self.size:
+            raise IndexError("Index out of bounds")
+
+        node = self
+        while True:
+            left = _size(node.left)
+            if k < left:
+                node = node.left
+            elif k > left:
+                k -= left + 1
+                node = node.right
+            else:
+                return node.data
+
+    @classmethod
+    def _join(cls, left: Optional['OrderStatisticTree'], node: 'OrderStatisticTree',
+              right: Optional['OrderStatisticTree']) -> 'OrderStatisticTree':
+        '''
+        Joins two trees with a detached node and updates the size of the node.
+
+        Args:
+            left (OrderStatisticTree): The left tree, possibly None.
+            node (OrderStatisticTree): The detached node.
+            right (OrderStatisticTree): The right tree, possibly None.
+
+        Returns:
+            OrderStatisticTree: The root of the joined tree.
+        '''
+        node = super()._join(left, node, right)
+        node.size = 1 + _size(left) + _size(right)
+        return node
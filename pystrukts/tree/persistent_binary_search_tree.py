@@ -0,0 +1,272 @@
+'''
+Persistent Binary Search Tree.
+
+This module contains the implementation of a persistent binary search tree, where
+updates return a new version of the tree and leave the previous one untouched.
+'''
+
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator, Optional, Tuple
+
+@dataclass(eq=False)
+class PersistentNode:
+    '''
+    Persistent node class.
+
+    Nodes are never modified once created, so they can be shared between versions.
+
+    Attributes:
+        data (Any): The data of the node.
+        left (PersistentNode): The left child of the node.
+        right (PersistentNode): The right child of the node.
+        height (int): The height of the subtree rooted at the node.
+    '''
+    __slots__ = ('data', 'left', 'right', 'height')
+
+    data: Any
+    left: Optional['PersistentNode']
+    right: Optional['PersistentNode']
+    height: int
+
+    def __init__(self, data: Any, left: Optional['PersistentNode'] = None,
+                 right: Optional['PersistentNode'] = None):
+        '''
+        Initializes the node.
+
+        Args:
+            data (Any): The data of the node.
+            left (PersistentNode): The left child of the node.
+            right (PersistentNode): The right child of the node.
+        '''
+        self.data = data
+        self.left = left
+        self.right = right
+        self.height = 1 + max(_height(left), _height(right))
+
+def _height(node: Optional[PersistentNode]) -> int:
+    '''
+    Returns the height of a node.
+
+    Args:
+        node (PersistentNode): The node, possibly None.
+
+    Returns:
+        int: The height of the node, 0 if it is None.
+    '''
+    return node.height if node is not None else 0
+
+def _balance(data: Any, left: Optional[PersistentNode],
+             right: Optional[PersistentNode]) -> PersistentNode:
+    '''
+    Creates a node from its data and children, rotating if the heights of the
+    children differ by more than one.
+
+    Args:
+        data (Any): The data of the node.
+        left (PersistentNode): The left child of the node.
+        right (PersistentNode): The right child of the node.
+
+    Returns:
+        PersistentNode: The root of the balanced subtree.
+    '''
+    if _height(left) > _height(right) + 1:
+        if _height(left.left) >= _height(left.right):
+            return PersistentNode(left.data, left.left, PersistentNode(data, left.right, right))
+        pivot = left.right
+        return PersistentNode(pivot.data, PersistentNode(left.data, left.left, pivot.left),
+                              PersistentNode(data, pivot.right, right))
+
+    if _height(right) > _height(left) + 1:
+        if _height(right.right) >= _height(right.left):
+            return PersistentNode(right.data, PersistentNode(data, left, right.left), right.right)
+        pivot = right.left
+        return PersistentNode(pivot.data, PersistentNode(data, left, pivot.left),
+                              PersistentNode(right.data, pivot.right, right.right))
+
+    return PersistentNode(data, left, right)
+
+def _insert(node: Optional[PersistentNode], data: Any) -> PersistentNode:
+    '''
+    Returns the root of a subtree with some data inserted, copying the search path.
+
+    Args:
+        node (PersistentNode): The root of the subtree, possibly None.
+        data (Any): The data to insert.
+
+    Returns:
+        PersistentNode: The new root, or the same root if the data was already there.
+    '''
+    if node is None:
+        return PersistentNode(data)
+
+    if data < node.data:
+        left = _insert(node.left, data)
+        return node if left is node.left else _balance(node.data, left, node.right)
+    if data > node.data:
+        right = _insert(node.right, data)
+        return node if right is node.right else _balance(node.data, node.left, right)
+
+    return node
+
+def _delete_min(node: PersistentNode) -> Tuple[Optional[PersistentNode], Any]:
+    '''
+    Returns the root of a subtree without its smallest data, copying the search path.
+
+    Args:
+        node (PersistentNode): The root of the subtree.
+
+    Returns:
+        Tuple[PersistentNode, Any]: The new root and the removed data.
+    '''
+    if node.left is None:
+        return node.right, node.data
+
+    left, data = _delete_min(node.left)
+    return _balance(node.data, left, node.right), data
+
+def _delete(node: Optional[PersistentNode], data: Any) -> Optional[PersistentNode]:
+    '''
+    Returns the root of a subtree with some data deleted, copying the search path.
+
+    Args:
+        node (PersistentNode): The root of the subtree, possibly None.
+        data (Any): The data to delete.
+
+    Returns:
+        PersistentNode: The new root, or the same root if the data was not there.
+    '''
+    if node is None:
+        return None
+
+    if data < node.data:
+        left = _delete(node.left, data)
+        return node if left is node.left else _balance(node.data, left, node.right)
+    if data > node.data:
+        right = _delete(node.right, data)
+        return node if right is node.right else _balance(node.data, node.left, right)
+
+    if node.left is None or node.right is None:
+        return node.left or node.right
+
+    right, successor = _delete_min(node.right)
+    return _balance(successor, node.left, right)
+
+class PersistentBinarySearchTree:
+    '''
+    Persistent binary search tree class.
+
+    This class represents a version of a balanced (AVL) binary search tree. Updates copy
+    only the O(log n) nodes on the search path and return a new version that shares every
+    other node with the previous one, so old versions stay valid and cost nothing to keep.
+    There are no duplicate nodes in the tree.
+
+    Attributes:
+        root (PersistentNode): The root node, or None if the tree is empty.
+        size (int): The number of nodes in the tree.
+    '''
+    __slots__ = ('root', 'size')
+
+    def __init__(self, data: Iterable[Any] = ()):
+        '''
+        Initializes the tree.
+
+        Args:
+            data (Iterable[Any]): The initial data of the tree.
+        '''
+        self.root = None
+        self.size = 0
+
+        for value in data:
+            updated = _insert(self.root, value)
+            if updated is not self.root:
+                self.root = updated
+                self.size += 1
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, data: Any) -> bool:
+        return self.search(data)
+
+    def __iter__(self) -> Iterator[Any]:
+        '''
+        Lazily iterates over the data of the tree, in order.
+
+        Yields:
+            Any: The data of the tree.
+        '''
+        stack = []
+        node = self.root
+        while True:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            yield node.data
+            node = node.right
+
+    @classmethod
+    def _version(cls, root: Optional[PersistentNode], size: int) -> 'PersistentBinarySearchTree':
+        '''
+        Creates a version of the tree from a root node.
+
+        Args:
+            root (PersistentNode): The root node.
+            size (int): The number of nodes in the tree.
+
+        Returns:
+            PersistentBinarySearchTree: The new version.
+        '''
+        version = cls()
+        version.root = root
+        version.size = size
+        return version
+
+    def search(self, data: Any) -> bool:
+        '''
+        Searches for data in the tree.
+
+        Args:
+            data (Any): The data to be searched.
+
+        Returns:
+            bool: True if the data is found, False otherwise.
+        '''
+        node = self.root
+        while node is not None:
+            if data < node.data:
+                node = node.left
+            elif data > node.data:
+                node = node.right
+            else:
+                return True
+
+        return False
+
+    def insert(self, data: Any) -> 'PersistentBinarySearchTree':
+        '''
+        Returns a new version of the tree with some data inserted.
+
+        Args:
+            data (Any): The data to insert.
+
+        Returns:
+            PersistentBinarySearchTree: The new version, or this one if the data was already there.
+        '''
+        root = _insert(self.root, data)
+        return self if root is self.root else self._version(root, self.size + 1)
+
+    def delete(self, data: Any) -> 'PersistentBinarySearchTree':
+        '''
+        Returns a new version of the tree with some data deleted.
+
+        Args:
+            data (Any): The data to delete.
+
+        Returns:
+            PersistentBinarySearchTree: The new version, or this one if the data was not there.
+        '''
+        root = _delete(self.root, data)
+        return self if root is self.root else self._version(root, self.size - 1)
@@ -0,0 +1,272 @@
+'''
+Red-Black Tree.
+
+This module contains the implementation of a left-leaning red-black tree,
+a self-balancing binary search tree.
+'''
+
+from typing import Any, Optional
+from .binary_search_tree import BinarySearchTree, _rotate_left, _rotate_right
+
+def _is_red(node: 'RedBlackTree') -> bool:
+    '''
+    Checks whether a node is red.
+
+    Args:
+        node (RedBlackTree): The node, possibly None.
+
+    Returns:
+        bool: True if the node is red, False if it is black or None.
+    '''
+    return node is not None and node.red
+
+def _rotate(node: 'RedBlackTree', left: bool) -> None:
+    '''
+    Rotates a subtree in place. The node keeps its color and the moved node becomes red.
+
+    Args:
+        node (RedBlackTree): The root of the subtree.
+        left (bool): Whether to rotate to the left or to the right.
+    '''
+    pivot = _rotate_left(node) if left else _rotate_right(node)
+    pivot.red = True
+
+def _flip_colors(node: 'RedBlackTree') -> None:
+    '''
+    Flips the colors of a node and its children.
+
+    Args:
+        node (RedBlackTree): The node.
+    '''
+    node.red = not node.red
+    node.left.red = not node.left.red
+    node.right.red = not node.right.red
+
+def _balance(node: 'RedBlackTree') -> None:
+    '''
+    Restores the left-leaning red-black properties of a node.
+
+    Args:
+        node (RedBlackTree): The node.
+    '''
+    if _is_red(node.right) and not _is_red(node.left):
+        _rotate(node, left=True)
+    if _is_red(node.left) and _is_red(node.left.left):
+        _rotate(node, left=False)
+    if _is_red(node.left) and _is_red(node.right):
+        _flip_colors(node)
+
+def _move_red_left(node: 'RedBlackTree') -> None:
+    '''
+    Makes the left child of a node or one of its children red, assuming the node
+    is red and both its left child and left grandchild are black.
+
+    Args:
+        node (RedBlackTree): The node.
+    '''
+    _flip_colors(node)
+    if _is_red(node.right.left):
+        _rotate(node.right, left=False)
+        _rotate(node, left=True)
+        _flip_colors(node)
+
+def _move_red_right(node: 'RedBlackTree') -> None:
+    '''
+    Makes the right child of a node or one of its children red, assuming the node
+    is red and both its right child and right-left grandchild are black.
+
+    Args:
+        node (RedBlackTree): The node.
+    '''
+    _flip_colors(node)
+    if _is_red(node.left.left):
+        _rotate(node, left=False)
+        _flip_colors(node)
+
+def _insert(node: 'RedBlackTree', data: Any) -> None:
+    '''
+    Inserts a new red node in a subtree.
+
+    Args:
+        node (RedBlackTree): The root of the subtree.
+        data (Any): The data of the new node.
+    '''
+    if data < node.data:
+        if node.left is None:
+            node.left = type(node)(data)
+            node.left.red = True
+        else:
+            _insert(node.left, data)
+    elif data > node.data:
+        if node.right is None:
+            node.right = type(node)(data)
+            node.right.red = True
+        else:
+            _insert(node.right, data)
+    else:
+        return
+
+    _balance(node)
+
+def _delete_min(node: 'RedBlackTree') -> 'RedBlackTree':
+    '''
+    Returns the root of a subtree after deleting its minimum node.
+
+    Args:
+        node (RedBlackTree): The root of the subtree.
+
+    Returns:
+        RedBlackTree: The root of the subtree after the deletion.
+    '''
+    if node.left is None:
+        return None
+
+    if not _is_red(node.left) and not _is_red(node.left.left):
+        _move_red_left(node)
+
+    node.left = _delete_min(node.left)
+    _balance(node)
+    return node
+
+def _delete(node: 'RedBlackTree', data: Any) -> 'RedBlackTree':
+    '''
+    Returns the root of a subtree after deleting a node that is known to be in it.
+
+    Args:
+        node (RedBlackTree): The root of the subtree.
+        data (Any): The data of the node to be deleted.
+
+    Returns:
+        RedBlackTree: The root of the subtree after the deletion.
+    '''
+    if data < node.data:
+        if not _is_red(node.left) and not _is_red(node.left.left):
+            _move_red_left(node)
+        node.left = _delete(node.left, data)
+    else:
+        if _is_red(node.left):
+            _rotate(node, left=False)
+        if data == node.data and node.right is None:
+            return None
+        if not _is_red(node.right) and not _is_red(node.right.left):
+            _move_red_right(node)
+        if data == node.data:
+            temp = node.right
+            while temp.left is not None:
+                temp = temp.left
+            node.data = temp.data
+            node.right = _delete_min(node.right)
+        else:
+            node.right = _delete(node.right, data)
+
+    _balance(node)
+    return node
+
+def _unsupported(operation: str) -> None:
+    '''
+    Rejects a join-based operation, which left-leaning red-black trees do not support.
+
+    Args:
+        operation (str): The name of the operation.
+
+    Raises:
+        TypeError: Always.
+    '''
+    raise TypeError(f"RedBlackTree does not support {operation}, use AVLTree instead")
+
+class RedBlackTree(BinarySearchTree):
+    '''
+    Red-black tree class.
+
+    This class represents a left-leaning red-black tree. Red links always lean left and
+    every path from the root to a leaf has the same number of black nodes, so the height
+    of the tree is O(log n). Rotations swap the data of the nodes, so the root node stays
+    the same after an insertion.
+    '''
+    __slots__ = ('red',)
+
+    def __init__(self, data: Any):
+        '''
+        Initializes the tree.
+
+        Args:
+            data (Any): The data of the root node.
+        '''
+        super().__init__(data)
+        self.red = False
+
+    def insert(self, data: Any) -> None:
+        '''
+        Inserts a new node in the tree.
+
+        Args:
+            data (Any): The data of the new node.
+        '''
+        _insert(self, data)
+        self.red = False
+
+    def delete(self, data: Any) -> 'RedBlackTree':
+        '''
+        Returns the root of the tree after deleting a node.
+
+        Args:
+            data (Any): The data of the node to be deleted.
+
+        Returns:
+            RedBlackTree: The root of the tree after the deletion.
+        '''
+        if not self.search(data):
+            return self
+
+        if not _is_red(self.left) and not _is_red(self.right):
+            self.red = True
+
+        root = _delete(self, data)
+        if root is not None:
+            root.red = False
+        return root
+
+    def split(self, data: Any) -> tuple:
+        '''
+        Splitting is not supported by left-leaning red-black trees. Use AVLTree instead.
+
+        Raises:
+            TypeError: Always, before either tree is modified.
+        '''
+        _unsupported('split')
+
+    def join(self, other: Optional['RedBlackTree']) -> 'RedBlackTree':
+        '''
+        Joining is not supported by left-leaning red-black trees. Use AVLTree instead.
+
+        Raises:
+            TypeError: Always, before either tree is modified.
+        '''
+        _unsupported('join')
+
+    def union(self, other: Optional['RedBlackTree']) -> 'RedBlackTree':
+        '''
+        Union is not supported by left-leaning red-black trees. Use AVLTree instead.
+
+        Raises:
+            TypeError: Always, before either tree is modified.
+        '''
+        _unsupported('union')
+
+    def intersection(self, other: Optional['RedBlackTree']) -> Optional['RedBlackTree']:
+        '''
+        Intersection is not supported by left-leaning red-black trees. Use AVLTree instead.
+
+        Raises:
+            TypeError: Always, before either tree is modified.
+        '''
+        _unsupported('intersection')
+
+    def difference(self, other: Optional['RedBlackTree']) -> Optional['RedBlackTree']:
+        '''
+        Difference is not supported by left-leaning red-black trees. Use AVLTree instead.
+
+        Raises:
+            TypeError: Always, before either tree is modified.
+        '''
+        _unsupported('difference')
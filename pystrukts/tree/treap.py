@@ -0,0 +1,349 @@
+'''
+Treap.
+
+This module contains the implementation of a sorted container backed by a treap,
+a binary search tree balanced with random priorities.
+'''
+
+import random
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator, Optional, Tuple, Union
+
+@dataclass
+class TreapNode:
+    '''
+    Treap node class.
+
+    Attributes:
+        data (Any): The data of the node.
+        priority (float): The random priority of the node; parents have higher priorities.
+        size (int): The number of nodes in the subtree rooted at the node.
+        left (TreapNode): The left child of the node.
+        right (TreapNode): The right child of the node.
+    '''
+    __slots__ = ('data', 'priority', 'size', 'left', 'right')
+
+    data: Any
+    priority: float
+    size: int
+    left: Optional['TreapNode']
+    right: Optional['TreapNode']
+
+    def __init__(self, data: Any, priority: float):
+        '''
+        Initializes the node.
+
+        Args:
+            data (Any): The data of the node.
+            priority (float): The priority of the node.
+        '''
+        self.data = data
+        self.priority = priority
+        self.size = 1
+        self.left = None
+        self.right = None
+
+def _size(node: Optional[TreapNode]) -> int:
+    '''
+    Returns the size of a subtree.
+
+    Args:
+        node (TreapNode): The root of the subtree, possibly None.
+
+    Returns:
+        int: The number of nodes in the subtree.
+    '''
+    return node.size if node is not None else 0
+
+def _update(node: TreapNode) -> TreapNode:
+    '''
+    Recomputes the size of a node from its children.
+
+    Args:
+        node (TreapNode): The node.
+
+    Returns:
+        TreapNode: The node.
+    '''
+    node.size = 1 + _size(node.left) + _size(node.right)
+    return node
+
+def _split(node: Optional[TreapNode], data: Any,
+           inclusive: bool) -> Tuple[Optional[TreapNode], Optional[TreapNode]]:
+    '''
+    Splits a treap by value.
+
+    Args:
+        node (TreapNode): The root of the treap.
+        data (Any): The value to split by.
+        inclusive (bool): Whether the values equal to `data` go to the left treap.
+
+    Returns:
+        Tuple[TreapNode, TreapNode]: The treaps with the values before and after the split.
+    '''
+    if node is None:
+        return None, None
+
+    if node.data < data or (inclusive and node.data == data):
+        node.right, right = _split(node.right, data, inclusive)
+        return _update(node), right
+
+    left, node.left = _split(node.left, data, inclusive)
+    return left, _update(node)
+
+def _merge(left: Optional[TreapNode], right: Optional[TreapNode]) -> Optional[TreapNode]:
+    '''
+    Merges two treaps, where every value of `left` is before every value of `right`.
+
+    Args:
+        left (TreapNode): The root of the left treap.
+        right (TreapNode): The root of the right treap.
+
+    Returns:
+        TreapNode: The root of the merged treap.
+    '''
+    if left is None or right is None:
+        return left if right is None else right
+
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        return _update(left)
+
+    right.left = _merge(left, right.left)
+    return _update(right)
+
+def _pop(node: TreapNode, index: int) -> Tuple[Optional[TreapNode], Any]:
+    '''
+    Removes the value at a position of a treap.
+
+    Args:
+        node (TreapNode): The root of the treap.
+        index (int): The position, which must be in range.
+
+    Returns:
+        Tuple[TreapNode, Any]: The new root and the removed value.
+    '''
+    rank = _size(node.left)
+    if index == rank:
+        return _merge(node.left, node.right), node.data
+
+    if index < rank:
+        node.left, data = _pop(node.left, index)
+    else:
+        node.right, data = _pop(node.right, index - rank - 1)
+
+    return _update(node), data
+
+class Treap:
+    '''
+    Treap class.
+
+    This class represents a sorted container that allows duplicate values. Nodes get
+    random priorities and are kept in heap order, so the tree is balanced in expectation
+    and every operation, including positional access, runs in expected O(log n).
+
+    Attributes:
+        root (TreapNode): The root node, or None if the treap is empty.
+
+    Methods:
+        `add(data: Any)`: Adds a value to the treap.
+        `remove(data: Any)`: Removes one occurrence of a value from the treap.
+        `pop(index: int)`: Removes and returns the value at a position.
+        `bisect_left(data: Any)`: Returns the position of the first value not less than `data`.
+        `bisect_right(data: Any)`: Returns the position of the first value greater than `data`.
+        `count(data: Any)`: Returns the number of occurrences of a value.
+    '''
+    __slots__ = ('root', '_random')
+
+    def __init__(self, data: Iterable[Any] = (), seed: Any = None):
+        '''
+        Initializes the treap.
+
+        Args:
+            data (Iterable[Any]): The initial values of the treap.
+            seed (Any): The seed of the random priorities, for reproducible shapes.
+        '''
+        self.root = None
+        self._random = random.Random(seed)
+
+        for value in data:
+            self.add(value)
+
+    def __len__(self) -> int:
+        return _size(self.root)
+
+    def __contains__(self, data: Any) -> bool:
+        index = self.bisect_left(data)
+        return index < len(self) and self[index] == data
+
+    def __iter__(self) -> Iterator[Any]:
+        return self._iter_from(0)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        '''
+        Returns the value at a position, or a list with the values of a slice.
+
+        Args:
+            index (Union[int, slice]): The position, which may be negative, or a slice.
+
+        Returns:
+            Any: The value at the position, or the list of values of the slice.
+
+        Raises:
+            IndexError: If the position is out of range.
+        '''
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                values = self._iter_from(start)
+                return [next(values) for _ in range(max(stop - start, 0))]
+            return [self[i] for i in range(start, stop, step)]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Treap index out of range")
+
+        node = self.root
+        while index != _size(node.left):
+            if index < _size(node.left):
+                node = node.left
+            else:
+                index -= _size(node.left) + 1
+                node = node.right
+
+        return node.data
+
+    def _iter_from(self, index: int) -> Iterator[Any]:
+        '''
+        Lazily iterates over the values from a position onwards, in order.
+
+        Args:
+            index (int): The first position, which must not be negative.
+
+        Yields:
+            Any: The values of the treap.
+        '''
+        stack = []
+        node = self.root
+        while node is not None:
+            if index <= _size(node.left):
+                stack.append(node)
+                node = node.left
+            else:
+                index -= _size(node.left) + 1
+                node = node.right
+
+        while stack:
+            node = stack.pop()
+            yield node.data
+            node = node.right
+            while node is not None:
+                stack.append(node)
+                node = node.left
+
+    def _bisect(self, data: Any, inclusive: bool) -> int:
+        '''
+        Counts the values before `data`, or up to and including it.
+        Helper function for `bisect_left` and `bisect_right`.
+
+        Args:
+            data (Any): The value.
+            inclusive (bool): Whether to count the values equal to `data`.
+
+        Returns:
+            int: The number of values.
+        '''
+        index = 0
+        node = self.root
+        while node is not None:
+            if node.data < data or (inclusive and node.data == data):
+                index += _size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+
+        return index
+
+    def bisect_left(self, data: Any) -> int:
+        '''
+        Returns the position where a value would be inserted before its equal values.
+
+        Args:
+            data (Any): The value.
+
+        Returns:
+            int: The position of the first value not less than `data`.
+        '''
+        return self._bisect(data, False)
+
+    def bisect_right(self, data: Any) -> int:
+        '''
+        Returns the position where a value would be inserted after its equal values.
+
+        Args:
+            data (Any): The value.
+
+        Returns:
+            int: The position of the first value greater than `data`.
+        '''
+        return self._bisect(data, True)
+
+    def count(self, data: Any) -> int:
+        '''
+        Returns the number of occurrences of a value.
+
+        Args:
+            data (Any): The value.
+
+        Returns:
+            int: The number of occurrences.
+        '''
+        return self.bisect_right(data) - self.bisect_left(data)
+
+    def add(self, data: Any) -> None:
+        '''
+        Adds a value to the treap, after any equal values.
+
+        Args:
+            data (Any): The value.
+        '''
+        left, right = _split(self.root, data, True)
+        node = TreapNode(data, self._random.random())
+        self.root = _merge(_merge(left, node), right)
+
+    def remove(self, data: Any) -> None:
+        '''
+        Removes one occurrence of a value from the treap.
+
+        Args:
+            data (Any): The value.
+
+        Raises:
+            ValueError: If the value is not in the treap.
+        '''
+        if data not in self:
+            raise ValueError("Value not found in treap")
+
+        self.pop(self.bisect_left(data))
+
+    def pop(self, index: int = -1) -> Any:
+        '''
+        Removes and returns the value at a position.
+
+        Args:
+            index (int): The position, which may be negative. Defaults to the last one.
+
+        Returns:
+            Any: The removed value.
+
+        Raises:
+            IndexError: If the position is out of range.
+        '''
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Treap index out of range")
+
+        self.root, data = _pop(self.root, index)
+        return data
@@ -4,8 +4,11 @@ Trie Module.
 This module implements a Trie (Prefix Tree) and TrieNode data structures.
 '''
 
+import sys
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Iterable, List, Tuple
+from .frozen_trie import FrozenTrie
 
 @dataclass
 class TrieNode:
@@ -27,7 +30,7 @@ class TrieNode:
         self.children = defaultdict(TrieNode)
         self.is_end_of_word = False
 
-@dataclass
+@dataclass(eq=False)
 class Trie:
     '''
     Trie Class.
@@ -39,9 +42,17 @@ class Trie:
         `insert(word: str)`: Insert a word into the trie.
         `search(word: str)`: Search for a word in the trie.
         `delete(word: str)`: Delete a word from the trie.
+        `delete_prefix(prefix: str)`: Delete all the words starting with a prefix.
+        `delete_many(words: Iterable[str])`: Delete several words from the trie.
         `startswith(prefix: str)`: Check if the trie contains a prefix.
+        `search_fuzzy(word: str, max_distance: int)`: Find the words within an edit distance.
+        `search_pattern(pattern: str)`: Find the words matching a wildcard pattern.
+        `freeze()`: Build an immutable, serialisable copy of the trie.
+        `clear()`: Remove all the words from the trie.
+        `node_count()`: Return the number of nodes in the trie.
+        `estimate_memory()`: Estimate the memory used by the nodes of the trie.
     '''
-    root = TrieNode()
+    root: TrieNode = field(default_factory=TrieNode, repr=False, compare=False)
 
     def insert(self, word: str) -> None:
         '''
@@ -74,40 +85,94 @@ class Trie:
             node = node.children[char]
         return node.is_end_of_word
 
-    def _delete(self, node: TrieNode, word: str, depth: int) -> bool:
+    def _prune(self, path: list, depth: int = 0) -> None:
         '''
-        Delete a node from the trie. Helper function for `delete`.
+        Pop a path down to a given depth, removing the dead nodes bottom-up. A node
+        is dead when it neither ends a word nor has children. Helper function for
+        the deletions.
+
+        Args:
+            path (list): The (parent, char) pairs from the root to the last node.
+            depth (int): The length of the path after pruning.
+        '''
+        while len(path) > depth:
+            parent, char = path.pop()
+            child = parent.children[char]
+            if not child.is_end_of_word and not child.children:
+                del parent.children[char]
+
+    def delete(self, word: str) -> None:
+        '''
+        Delete a word from the trie.
 
         Args:
-            node (TrieNode): The current node.
             word (str): The word to delete.
-            depth (int): The current depth.
+        '''
+        node = self.root
+        path = []
+        for char in word:
+            if char not in node.children:
+                return
+            path.append((node, char))
+            node = node.children[char]
 
-        Returns:
-            out (bool): Whether the node should be deleted.
+        node.is_end_of_word = False
+        self._prune(path)
+
+    def delete_prefix(self, prefix: str) -> None:
         '''
-        if depth == len(word):
-            node.is_end_of_word = False
-            return len(node.children) == 0
+        Delete all the words starting with a prefix. The whole subtree is
+        detached at once.
 
-        char = word[depth]
-        if char not in node.children:
-            return False
+        Args:
+            prefix (str): The prefix of the words to delete.
+        '''
+        if not prefix:
+            self.root.children.clear()
+            self.root.is_end_of_word = False
+            return
 
-        if self._delete(node.children[char], word, depth + 1):
-            del node.children[char]
-            return len(node.children) == 0
+        node = self.root
+        path = []
+        for char in prefix[:-1]:
+            if char not in node.children:
+                return
+            path.append((node, char))
+            node = node.children[char]
 
-        return False
+        if prefix[-1] in node.children:
+            del node.children[prefix[-1]]
+            self._prune(path)
 
-    def delete(self, word: str) -> None:
+    def delete_many(self, words: Iterable[str]) -> None:
         '''
-        Delete a word from the trie.
+        Delete several words from the trie. Words are processed in sorted order,
+        so the path shared with the previous word is not walked again.
 
         Args:
-            word (str): The word to delete.
+            words (Iterable[str]): The words to delete.
         '''
-        self._delete(self.root, word, 0)
+        path = []
+        previous = ''
+        for word in sorted(set(words)):
+            common = 0
+            limit = min(len(previous), len(word), len(path))
+            while common < limit and previous[common] == word[common]:
+                common += 1
+            self._prune(path, common)
+
+            node = path[-1][0].children[path[-1][1]] if path else self.root
+            for char in word[common:]:
+                if char not in node.children:
+                    break
+                path.append((node, char))
+                node = node.children[char]
+            else:
+                node.is_end_of_word = False
+
+            previous = word
+
+        self._prune(path)
 
     def startswith(self, prefix: str) -> bool:
         '''
@@ -125,3 +190,122 @@ class Trie:
                 return False
             node = node.children[char]
         return True
+
+    def search_fuzzy(self, word: str, max_distance: int) -> List[Tuple[str, int]]:
+        '''
+        Find the words whose Levenshtein distance to a word is at most `max_distance`.
+        The trie is walked once, keeping a row of the edit distance table per node,
+        and branches whose row minimum exceeds the bound are pruned.
+
+        Args:
+            word (str): The word to search.
+            max_distance (int): The maximum edit distance.
+
+        Returns:
+            out (List[Tuple[str, int]]): The matching words and their distances,
+                in lexicographic order.
+        '''
+        results = []
+        stack = [(self.root, '', list(range(len(word) + 1)))]
+        while stack:
+            node, prefix, row = stack.pop()
+            if node.is_end_of_word and row[-1] <= max_distance:
+                results.append((prefix, row[-1]))
+
+            if min(row) > max_distance:
+                continue
+
+            for char in sorted(node.children, reverse=True):
+                new_row = [row[0] + 1]
+                for j, target in enumerate(word, 1):
+                    new_row.append(min(new_row[j - 1] + 1, row[j] + 1,
+                                       row[j - 1] + (target != char)))
+                stack.append((node.children[char], prefix + char, new_row))
+
+        return results
+
+    def search_pattern(self, pattern: str) -> List[str]:
+        '''
+        Find the words matching a wildcard pattern, where `?` matches any single
+        character and `*` matches any sequence of characters, including an empty one.
+
+        Args:
+            pattern (str): The pattern to match.
+
+        Returns:
+            out (List[str]): The matching words, in lexicographic order.
+        '''
+        results = []
+        visited = set()
+        stack = [(self.root, '', 0)]
+        while stack:
+            node, prefix, index = stack.pop()
+            if (id(node), index) in visited:
+                continue
+            visited.add((id(node), index))
+
+            if index == len(pattern):
+                if node.is_end_of_word:
+                    results.append(prefix)
+                continue
+
+            char = pattern[index]
+            if char == '*':
+                stack.append((node, prefix, index + 1))
+                stack.extend((child, prefix + key, index) for key, child in node.children.items())
+            elif char == '?':
+                stack.extend((child, prefix + key, index + 1)
+                             for key, child in node.children.items())
+            elif char in node.children:
+                stack.append((node.children[char], prefix + char, index + 1))
+
+        return sorted(results)
+
+    def freeze(self) -> FrozenTrie:
+        '''
+        Build an immutable, succinct copy of the trie, which can be saved to a file
+        and reopened with `FrozenTrie.load`.
+
+        Returns:
+            out (FrozenTrie): The frozen trie.
+        '''
+        return FrozenTrie.from_trie(self)
+
+    def clear(self) -> None:
+        '''
+        Remove all the words from the trie. The old nodes are released at once
+        by replacing the root.
+        '''
+        self.root = TrieNode()
+
+    def node_count(self) -> int:
+        '''
+        Return the number of nodes in the trie, including the root.
+
+        Returns:
+            out (int): The number of nodes.
+        '''
+        count = 0
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            count += 1
+            stack.extend(node.children.values())
+        return count
+
+    def estimate_memory(self) -> int:
+        '''
+        Estimate the memory used by the nodes of the trie, counting each node
+        object, its attribute dictionary and its children dictionary.
+
+        Returns:
+            out (int): The estimated memory, in bytes.
+        '''
+        total = 0
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            total += sys.getsizeof(node) + sys.getsizeof(node.__dict__)
+            total += sys.getsizeof(node.children)
+            stack.extend(node.children.values())
+        return total
@@ -0,0 +1,106 @@
+import pytest
+from pystrukts.tree import AggregateTree
+
+def _naive(node):
+    value = node.data if node.key is None else node.key(node.data)
+    for child in node.children:
+        value = node.op(value, _naive(child))
+    return value
+
+def test_initialization():
+    tree = AggregateTree(5)
+    assert tree.data == 5
+    assert tree.parent is None
+    assert tree.subtree_aggregate() == 5
+    assert not hasattr(tree, "__dict__")
+
+def test_add_child():
+    tree = AggregateTree(1)
+    tree.add_child(2)
+    tree.add_child(3)
+    tree.get_child(0).add_child(4)
+
+    assert tree.subtree_aggregate() == 10
+    assert tree.get_child(0).subtree_aggregate() == 6
+    assert tree.get_child(0).parent is tree
+    assert tree.get_child(0).get_child(0).op is tree.op
+
+def test_add_child_limit():
+    tree = AggregateTree(1, 3)
+    for i in range(3):
+        tree.add_child(i)
+
+    with pytest.warns(UserWarning):
+        tree.add_child(10)
+    assert tree.subtree_aggregate() == 4
+
+def test_remove_child():
+    tree = AggregateTree(1)
+    tree.add_child(2)
+    tree.add_child(3)
+    child = tree.get_child(0)
+    child.add_child(4)
+
+    tree.remove_child(0)
+    assert tree.subtree_aggregate() == 4
+    assert child.parent is None
+    assert child.subtree_aggregate() == 6
+
+def test_data_change():
+    tree = AggregateTree(1)
+    tree.add_child(2)
+    tree.get_child(0).add_child(3)
+
+    tree.get_child(0).get_child(0).data = 30
+    assert tree.subtree_aggregate() == 33
+    assert tree.get_child(0).subtree_aggregate() == 32
+
+def test_key_and_op():
+    sizes = AggregateTree('root', key=lambda _: 1)
+    sizes.add_child('a')
+    sizes.add_child('b')
+    sizes.get_child(1).add_child('c')
+    assert sizes.subtree_aggregate() == 4
+    assert sizes.get_child(1).subtree_aggregate() == 2
+
+    minimum = AggregateTree(5, op=min)
+    minimum.add_child(7)
+    minimum.get_child(0).add_child(2)
+    assert minimum.subtree_aggregate() == 2
+    minimum.get_child(0).get_child(0).data = 9
+    assert minimum.subtree_aggregate() == 5
+
+def test_non_commutative_order():
+    tree = AggregateTree('a')
+    tree.add_child('b')
+    tree.add_child('d')
+    tree.get_child(0).add_child('c')
+    assert tree.subtree_aggregate() == 'abcd'
+
+def test_rebuild():
+    tree = AggregateTree.from_parent_array([-1, 0, 0, 1, 1], data=[1, 2, 3, 4, 5])
+    tree.op = max
+    tree.rebuild()
+    assert tree.subtree_aggregate() == 5
+    for node in tree.preorder():
+        assert node.op is max
+        assert node.subtree_aggregate() == _naive(node)
+        for child in node.children:
+            assert child.parent is node
+
+    child = tree.get_child(0)
+    child.children.append(AggregateTree(10))
+    child.rebuild()
+    assert tree.subtree_aggregate() == 10
+
+def test_wide_node():
+    tree = AggregateTree('', op=lambda a, b: a + b)
+    tree.add_child('a')
+    hub = tree.get_child(0)
+    for i in range(5000):
+        hub.add_child(str(i % 10))
+    assert hub.subtree_aggregate() == _naive(hub)
+
+    tree.add_child('z')
+    assert tree.subtree_aggregate() == _naive(tree)
+    assert tree.subtree_aggregate().endswith('789z')
@@ -0,0 +1,56 @@
+import pytest
+from pystrukts.tree import Trie, AhoCorasick
+
+def _build_automaton(words):
+    trie = Trie()
+    for word in words:
+        trie.insert(word)
+    return AhoCorasick(trie)
+
+def _naive(words, text):
+    return sorted((i, word) for word in set(words) if word
+                  for i in range(len(text)) if text.startswith(word, i))
+
+def test_finditer():
+    automaton = _build_automaton(["he", "she", "his", "hers"])
+
+    assert list(automaton.finditer("ushers")) == [(1, "she"), (2, "he"), (2, "hers")]
+    assert list(automaton.finditer("ahishers")) == [(1, "his"), (3, "she"), (4, "he"), (4, "hers")]
+    assert list(automaton.finditer("xyz")) == []
+    assert list(automaton.finditer("")) == []
+
+def test_finditer_overlapping():
+    automaton = _build_automaton(["a", "aa", "aaa"])
+
+    assert sorted(automaton.finditer("aaaa")) == _naive(["a", "aa", "aaa"], "aaaa")
+
+def test_finditer_matches_naive():
+    words = ["error", "err", "warn", "warning", "fail", "ail", "il", "timeout", "out"]
+    text = "warning: request failed with error timeout; retrying after err-out warn" * 3
+    automaton = _build_automaton(words)
+
+    assert sorted(automaton.finditer(text)) == _naive(words, text)
+
+def test_finditer_chunks():
+    words = ["error", "err", "warning", "fail", "ail", "timeout"]
+    text = "warning: request failed with error timeout; err"
+    automaton = _build_automaton(words)
+    chunks = [text[i:i + 5] for i in range(0, len(text), 5)]
+
+    assert list(automaton.finditer_chunks(chunks)) == list(automaton.finditer(text))
+    assert list(automaton.finditer_chunks(["war", "n", "ing"])) == [(0, "warning")]
+    assert list(automaton.finditer_chunks([])) == []
+
+def test_empty_word_ignored():
+    automaton = _build_automaton(["", "ab"])
+
+    assert list(automaton.finditer("abab")) == [(0, "ab"), (2, "ab")]
+
+def test_trie_not_modified():
+    trie = Trie()
+    trie.insert("abc")
+    automaton = AhoCorasick(trie)
+    trie.insert("xyz")
+
+    assert list(automaton.finditer("abcxyz")) == [(0, "abc")]
+    assert trie.search("abc") == True
@@ -0,0 +1,137 @@
+import random
+import pytest
+from pystrukts.tree import AncestorIndex, GenericTree
+
+def _path(root, target):
+    stack = [(root, [root])]
+    while stack:
+        node, path = stack.pop()
+        if node is target:
+            return path
+        for child in node.children:
+            stack.append((child, path + [child]))
+    return None
+
+def _naive_lca(root, a, b):
+    common = None
+    for x, y in zip(_path(root, a), _path(root, b)):
+        if x is not y:
+            break
+        common = x
+    return common
+
+def _random_tree(n, seed):
+    rng = random.Random(seed)
+    return GenericTree.from_parent_array([-1] + [rng.randrange(i) for i in range(1, n)])
+
+def test_lca_matches_naive():
+    tree = _random_tree(200, 0)
+    nodes = list(tree.preorder())
+    index = AncestorIndex(tree)
+    rng = random.Random(1)
+    for _ in range(500):
+        a, b = rng.choice(nodes), rng.choice(nodes)
+        assert index.lca(a, b) is _naive_lca(tree, a, b)
+
+def test_single_node():
+    tree = GenericTree('root')
+    index = AncestorIndex(tree)
+    assert index.lca(tree, tree) is tree
+    assert index.depth(tree) == 0
+    assert index.is_ancestor(tree, tree)
+    assert index.kth_ancestor(tree, 0) is tree
+    assert index.kth_ancestor(tree, 1) is None
+
+def test_is_ancestor_and_depth():
+    tree = _random_tree(100, 2)
+    nodes = list(tree.preorder())
+    index = AncestorIndex(tree)
+    for node in nodes:
+        path = _path(tree, node)
+        assert index.depth(node) == len(path) - 1
+        ancestors = {id(ancestor) for ancestor in path}
+        for other in nodes:
+            assert index.is_ancestor(other, node) == (id(other) in ancestors)
+
+def test_kth_ancestor():
+    tree = _random_tree(100, 3)
+    index = AncestorIndex(tree)
+    for node in tree.preorder():
+        path = _path(tree, node)
+        for k in range(len(path)):
+            assert index.kth_ancestor(node, k) is path[-1 - k]
+        assert index.kth_ancestor(node, len(path)) is None
+
+    with pytest.raises(ValueError):
+        index.kth_ancestor(tree, -1)
+
+def test_node_not_in_tree():
+    tree = _random_tree(10, 4)
+    index = AncestorIndex(tree)
+    with pytest.raises(ValueError):
+        index.depth(GenericTree('stranger'))
+
+def test_invalidation():
+    tree = GenericTree('a')
+    tree.add_child('b')
+    index = AncestorIndex(tree)
+    b = tree.get_child(0)
+    assert index.valid
+    assert set(tree.ancestor_indexes) == {index}
+    assert b.ancestor_indexes is tree.ancestor_indexes
+
+    b.add_child('c')
+    assert not index.valid
+    c = b.get_child(0)
+    assert index.depth(c) == 2
+    assert index.valid
+    assert index.lca(c, b) is b
+
+    tree.add_child('d')
+    d = tree.get_child(1)
+    assert index.lca(c, d) is tree
+
+    tree.remove_child(0)
+    assert not index.valid
+    with pytest.raises(ValueError):
+        index.depth(c)
+    assert index.kth_ancestor(d, 1) is tree
+
+def test_manual_invalidation():
+    tree = GenericTree('a')
+    index = AncestorIndex(tree)
+    tree.children.append(GenericTree('b'))
+    index.invalidate()
+    assert index.depth(tree.get_child(0)) == 1
+
+def test_overlapping_indexes():
+    tree = GenericTree.from_parent_array([-1, 0, 0, 1, 1])
+    b = tree.get_child(0)
+    leaf = b.get_child(0)
+    full = AncestorIndex(tree)
+    sub = AncestorIndex(b)
+    assert set(b.ancestor_indexes) == {full, sub}
+    assert set(tree.ancestor_indexes) == {full}
+
+    b.remove_child(0)
+    assert not full.valid
+    assert not sub.valid
+    with pytest.raises(ValueError):
+        full.is_ancestor(tree, leaf)
+    with pytest.raises(ValueError):
+        sub.depth(leaf)
+
+    b.add_child('x')
+    x = b.get_child(1)
+    assert full.depth(x) == 2
+    assert sub.depth(x) == 1
+
+    tree.add_child('y')
+    assert not full.valid
+    assert sub.valid
+
+    x.add_child('z')
+    assert not full.valid
+    assert not sub.valid
+    assert full.lca(x.get_child(0), tree.get_child(1)) is tree
+    assert sub.kth_ancestor(x.get_child(0), 2) is b
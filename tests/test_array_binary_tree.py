@@ -0,0 +1,120 @@
+import pytest
+from pystrukts.tree import ArrayBinaryTree, BinaryTree
+
+def _structure(tree):
+    if tree is None:
+        return None
+
+    return (tree.data, _structure(tree.left), _structure(tree.right))
+
+def test_initialization():
+    tree = ArrayBinaryTree([1, 2, 3, 4])
+
+    assert len(tree) == 4
+    assert tree[0] == 1
+    assert tree[3] == 4
+    assert list(tree) == [1, 2, 3, 4]
+
+    assert len(ArrayBinaryTree()) == 0
+
+def test_index_arithmetic():
+    assert ArrayBinaryTree.left(0) == 1
+    assert ArrayBinaryTree.right(0) == 2
+    assert ArrayBinaryTree.left(2) == 5
+    assert ArrayBinaryTree.right(2) == 6
+    assert ArrayBinaryTree.parent(5) == 2
+    assert ArrayBinaryTree.parent(6) == 2
+    assert ArrayBinaryTree.parent(0) == -1
+
+def test_exists_is_leaf():
+    tree = ArrayBinaryTree([1, 2, 3, 4])
+
+    assert tree.exists(3) == True
+    assert tree.exists(4) == False
+    assert tree.exists(-1) == False
+    assert tree.is_leaf(1) == False
+    assert tree.is_leaf(2) == True
+    assert tree.is_leaf(3) == True
+
+def test_setitem():
+    tree = ArrayBinaryTree([1])
+    tree[2] = 3
+    tree[6] = 7
+
+    assert len(tree) == 3
+    assert tree[6] == 7
+    assert tree.exists(1) == False
+    assert list(tree) == [1, 3, 7]
+
+    tree[0] = 0
+    assert len(tree) == 3
+
+    with pytest.raises(IndexError):
+        tree[3] = 4
+
+    with pytest.raises(IndexError):
+        tree[1]
+
+def test_setitem_none():
+    tree = ArrayBinaryTree([None])
+    tree[1] = None
+
+    assert len(tree) == 2
+    assert tree.exists(1) == True
+    assert tree[1] is None
+
+def test_traversals():
+    tree = ArrayBinaryTree([1, 2, 3, 4, 5])
+    tree[6] = 6
+
+    assert list(tree.preorder()) == [1, 2, 4, 5, 3, 6]
+    assert list(tree.inorder()) == [4, 2, 5, 1, 3, 6]
+    assert list(tree.postorder()) == [4, 5, 2, 6, 3, 1]
+    assert list(tree.level_order()) == [1, 2, 3, 4, 5, 6]
+
+def test_traversals_empty():
+    tree = ArrayBinaryTree()
+
+    assert list(tree.preorder()) == []
+    assert list(tree.inorder()) == []
+    assert list(tree.postorder()) == []
+
+def test_binary_tree_conversion():
+    root = BinaryTree(1)
+    root.left = BinaryTree(2)
+    root.right = BinaryTree(3)
+    root.left.right = BinaryTree(5)
+    root.right.right = BinaryTree(7)
+
+    tree = ArrayBinaryTree.from_binary_tree(root)
+    assert len(tree) == 5
+    assert tree[4] == 5
+    assert tree[6] == 7
+    assert tree.exists(3) == False
+
+    assert _structure(tree.to_binary_tree()) == _structure(root)
+    assert ArrayBinaryTree().to_binary_tree() is None
+
+def test_from_sorted():
+    tree = ArrayBinaryTree.from_sorted(range(0, 20, 2))
+
+    assert len(tree) == 10
+    assert list(tree.inorder()) == list(range(0, 20, 2))
+    assert tree[0] == 12
+
+def test_search():
+    tree = ArrayBinaryTree.from_sorted(range(0, 200, 2))
+
+    assert all(tree.search(i) for i in range(0, 200, 2))
+    assert not any(tree.search(i) for i in range(1, 200, 2))
+    assert tree.search(-1) == False
+    assert ArrayBinaryTree().search(1) == False
+
+def test_lower_bound():
+    tree = ArrayBinaryTree.from_sorted(range(0, 200, 2))
+
+    for value in range(-1, 199):
+        index = tree.lower_bound(value)
+        assert tree[index] == value + (value % 2 != 0)
+
+    assert tree.lower_bound(199) == -1
@@ -0,0 +1,137 @@
+import random
+import pytest
+from pystrukts.tree import AVLTree
+
+def _inorder(tree: 'AVLTree'):
+    if tree is None:
+        return []
+
+    return _inorder(tree.left) + [tree.data] + _inorder(tree.right)
+
+def _check_balanced(tree: 'AVLTree'):
+    if tree is None:
+        return 0
+
+    left = _check_balanced(tree.left)
+    right = _check_balanced(tree.right)
+    assert abs(left - right) <= 1
+    assert tree.height == 1 + max(left, right)
+    return tree.height
+
+def test_initialization():
+    tree = AVLTree(1)
+    assert tree.data == 1
+    assert tree.left is None
+    assert tree.right is None
+    assert tree.height == 1
+
+def test_insert_sorted():
+    tree = AVLTree(0)
+    for i in range(1, 1000):
+        tree.insert(i)
+
+    assert _inorder(tree) == list(range(1000))
+    assert _check_balanced(tree) <= 11
+
+def test_insert_reverse_sorted():
+    tree = AVLTree(999)
+    for i in range(998, -1, -1):
+        tree.insert(i)
+
+    assert _inorder(tree) == list(range(1000))
+    assert _check_balanced(tree) <= 11
+
+def test_insert_duplicate():
+    tree = AVLTree(1)
+    tree.insert(2)
+    tree.insert(2)
+    tree.insert(1)
+
+    assert _inorder(tree) == [1, 2]
+
+def test_search():
+    tree = AVLTree(5)
+    for i in [3, 8, 1, 4, 7, 9]:
+        tree.insert(i)
+
+    assert all(tree.search(i) for i in [1, 3, 4, 5, 7, 8, 9])
+    assert tree.search(2) == False
+    assert tree.search(10) == False
+
+def test_delete():
+    tree = AVLTree(1)
+    for i in [5, 0, -1, 4, 3]:
+        tree.insert(i)
+
+    tree = tree.delete(1)
+    assert _inorder(tree) == [-1, 0, 3, 4, 5]
+
+    tree = tree.delete(42)
+    assert _inorder(tree) == [-1, 0, 3, 4, 5]
+
+    for i in [0, 5, 3, 4]:
+        tree = tree.delete(i)
+        _check_balanced(tree)
+
+    assert _inorder(tree) == [-1]
+    assert tree.delete(-1) is None
+
+def test_random_operations():
+    rng = random.Random(0)
+    tree = AVLTree(500)
+    expected = {500}
+
+    for _ in range(3000):
+        value = rng.randrange(1000)
+        if rng.random() < 0.6:
+            tree.insert(value)
+            expected.add(value)
+        elif len(expected) > 1:
+            tree = tree.delete(value)
+            expected.discard(value)
+
+    assert _inorder(tree) == sorted(expected)
+    _check_balanced(tree)
+
+def _build(values):
+    tree = AVLTree(values[0])
+    for value in values[1:]:
+        tree.insert(value)
+    return tree
+
+def test_split_join():
+    tree = _build(list(range(100)))
+    smaller, node, greater = tree.split(37)
+
+    assert _inorder(smaller) == list(range(37))
+    assert node.data == 37 and node.height == 1
+    assert _inorder(greater) == list(range(38, 100))
+    _check_balanced(smaller)
+    _check_balanced(greater)
+
+    tree = smaller.join(greater)
+    assert _inorder(tree) == [i for i in range(100) if i != 37]
+    _check_balanced(tree)
+
+def test_join_unbalanced_heights():
+    tree = _build(list(range(1000))).join(_build([1000, 1001]))
+
+    assert _inorder(tree) == list(range(1002))
+    _check_balanced(tree)
+
+    tree = _build([-2, -1]).join(_build(list(range(1000))))
+    assert _inorder(tree) == list(range(-2, 1000))
+    _check_balanced(tree)
+
+def test_set_operations():
+    rng = random.Random(1)
+    for _ in range(20):
+        first = set(rng.sample(range(500), rng.randint(1, 200)))
+        second = set(rng.sample(range(500), rng.randint(1, 200)))
+
+        for operation, expected in [("union", first | second),
+                                    ("intersection", first & second),
+                                    ("difference", first - second)]:
+            tree = getattr(_build(list(first)), operation)(_build(list(second)))
+            assert _inorder(tree) == sorted(expected)
+            _check_balanced(tree)
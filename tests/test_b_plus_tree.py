@@ -0,0 +1,122 @@
+import random
+import pytest
+from pystrukts.tree import BPlusTree
+
+def _check(tree: BPlusTree):
+    min_keys = (tree.order - 1) // 2
+    leaves = []
+
+    def visit(node, depth, lo, hi):
+        assert len(node.keys) < tree.order
+        assert node.keys == sorted(node.keys)
+        assert all((lo is None or key >= lo) and (hi is None or key < hi) for key in node.keys)
+        if node is not tree.root:
+            assert len(node.keys) >= min_keys
+        if node.is_leaf:
+            assert len(node.values) == len(node.keys)
+            leaves.append((node, depth))
+            return
+        assert len(node.children) == len(node.keys) + 1
+        bounds = [lo] + node.keys + [hi]
+        for i, child in enumerate(node.children):
+            visit(child, depth + 1, bounds[i], bounds[i + 1])
+
+    visit(tree.root, 0, None, None)
+    assert len({depth for _, depth in leaves}) == 1
+    for (leaf, _), (following, _) in zip(leaves, leaves[1:]):
+        assert leaf.next is following
+    assert leaves[-1][0].next is None
+    assert sum(len(leaf.keys) for leaf, _ in leaves) == len(tree)
+
+def test_initialization():
+    tree = BPlusTree(4)
+    assert tree.order == 4
+    assert len(tree) == 0
+    assert list(tree) == []
+    assert tree.get(1) is None
+
+    with pytest.raises(ValueError):
+        BPlusTree(2)
+
+def test_insert_and_get():
+    tree = BPlusTree(3)
+    for i in range(100):
+        tree.insert(i, str(i))
+        _check(tree)
+
+    assert len(tree) == 100
+    assert tree.get(42) == '42'
+    assert tree.get(100, 'missing') == 'missing'
+    assert 99 in tree
+    assert -1 not in tree
+    assert list(tree) == list(range(100))
+
+    tree.insert(42, 'updated')
+    assert tree.get(42) == 'updated'
+    assert len(tree) == 100
+
+def test_delete():
+    tree = BPlusTree(4)
+    for i in range(50):
+        tree.insert(i, i)
+
+    for i in range(0, 50, 2):
+        tree.delete(i)
+        _check(tree)
+
+    tree.delete(100)
+    assert len(tree) == 25
+    assert list(tree) == list(range(1, 50, 2))
+
+    for i in range(1, 50, 2):
+        tree.delete(i)
+        _check(tree)
+
+    assert len(tree) == 0
+    assert tree.root.is_leaf
+
+def test_items_range():
+    tree = BPlusTree(5)
+    for i in range(0, 100, 3):
+        tree.insert(i, -i)
+
+    assert list(tree.items(10, 20)) == [(12, -12), (15, -15), (18, -18)]
+    assert list(tree.items(hi=6)) == [(0, 0), (3, -3), (6, -6)]
+    assert list(tree.items(lo=95)) == [(96, -96), (99, -99)]
+    assert list(tree.items(200)) == []
+
+@pytest.mark.parametrize('n', [0, 1, 2, 3, 10, 100, 1000])
+@pytest.mark.parametrize('order', [3, 4, 7, 64])
+def test_from_sorted(n, order):
+    tree = BPlusTree.from_sorted(((i, i * i) for i in range(n)), order)
+    _check(tree)
+    assert len(tree) == n
+    assert list(tree.items()) == [(i, i * i) for i in range(n)]
+
+    tree.insert(n, 0)
+    tree.delete(0)
+    _check(tree)
+
+def test_from_sorted_unsorted():
+    with pytest.raises(ValueError):
+        BPlusTree.from_sorted([(1, 'a'), (1, 'b')])
+
+    with pytest.raises(ValueError):
+        BPlusTree.from_sorted([(2, 'a'), (1, 'b')])
+
+@pytest.mark.parametrize('order', [3, 4, 5, 16])
+def test_random_operations(order):
+    rng = random.Random(order)
+    tree = BPlusTree(order)
+    expected = {}
+    for _ in range(2000):
+        key = rng.randrange(300)
+        if rng.random() < 0.6:
+            tree.insert(key, key * 2)
+            expected[key] = key * 2
+        else:
+            tree.delete(key)
+            expected.pop(key, None)
+
+    _check(tree)
+    assert list(tree.items()) == sorted(expected.items())
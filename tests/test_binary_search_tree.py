@@ -123,3 +123,136 @@ def test_delete():
     tree = tree.delete(-1)
     assert _inorder(tree) == []
 
+def test_deep_tree():
+    tree = BinarySearchTree(0)
+    for i in range(1, 2000):
+        tree.insert(i)
+
+    assert tree.search(1999) == True
+    assert tree.search(2000) == False
+
+    tree = tree.delete(1500)
+    assert tree.search(1500) == False
+    assert tree.search(1999) == True
+
+    tree = tree.delete(0)
+    assert tree.data == 1
+
+def _build(values):
+    tree = BinarySearchTree(values[0])
+    for value in values[1:]:
+        tree.insert(value)
+    return tree
+
+def test_min_max():
+    tree = _build([5, 3, 8, 1, 4, 7, 9])
+
+    assert tree.min() == 1
+    assert tree.max() == 9
+    assert BinarySearchTree(2).min() == 2
+    assert BinarySearchTree(2).max() == 2
+
+def test_floor():
+    tree = _build([10, 5, 15, 2, 7, 12, 20])
+
+    assert tree.floor(7) == 7
+    assert tree.floor(8) == 7
+    assert tree.floor(11) == 10
+    assert tree.floor(100) == 20
+    assert tree.floor(1) is None
+
+def test_ceiling():
+    tree = _build([10, 5, 15, 2, 7, 12, 20])
+
+    assert tree.ceiling(7) == 7
+    assert tree.ceiling(8) == 10
+    assert tree.ceiling(13) == 15
+    assert tree.ceiling(1) == 2
+    assert tree.ceiling(21) is None
+
+def test_irange():
+    tree = _build([10, 5, 15, 2, 7, 12, 20])
+
+    assert list(tree.irange()) == [2, 5, 7, 10, 12, 15, 20]
+    assert list(tree.irange(5, 12)) == [5, 7, 10, 12]
+    assert list(tree.irange(6, 11)) == [7, 10]
+    assert list(tree.irange(lo=13)) == [15, 20]
+    assert list(tree.irange(hi=6)) == [2, 5]
+    assert list(tree.irange(21, 30)) == []
+    assert list(tree.irange(12, 5)) == []
+
+def test_irange_lazy():
+    tree = BinarySearchTree(0)
+    for i in range(1, 2000):
+        tree.insert(i)
+
+    iterator = tree.irange(1000)
+    assert next(iterator) == 1000
+    assert next(iterator) == 1001
+
+def test_split():
+    tree = _build([10, 5, 15, 2, 7, 12, 20])
+
+    smaller, node, greater = tree.split(10)
+    assert _inorder(smaller) == [2, 5, 7]
+    assert node.data == 10 and node.is_leaf()
+    assert _inorder(greater) == [12, 15, 20]
+
+    tree = _build([10, 5, 15, 2, 7, 12, 20])
+    smaller, node, greater = tree.split(11)
+    assert _inorder(smaller) == [2, 5, 7, 10]
+    assert node is None
+    assert _inorder(greater) == [12, 15, 20]
+
+    smaller, node, greater = BinarySearchTree(1).split(0)
+    assert smaller is None and node is None
+    assert _inorder(greater) == [1]
+
+def test_join():
+    tree = _build([5, 3, 8]).join(_build([10, 9, 12]))
+    assert _inorder(tree) == [3, 5, 8, 9, 10, 12]
+
+    tree = _build([5, 3, 8]).join(None)
+    assert _inorder(tree) == [3, 5, 8]
+
+    with pytest.raises(ValueError):
+        _build([5, 3, 8]).join(_build([8, 9]))
+
+def test_union():
+    tree = _build([5, 3, 8, 1]).union(_build([4, 8, 10, 1, 0]))
+    assert _inorder(tree) == [0, 1, 3, 4, 5, 8, 10]
+
+    tree = _build([5, 3]).union(None)
+    assert _inorder(tree) == [3, 5]
+
+def test_intersection():
+    tree = _build([5, 3, 8, 1]).intersection(_build([4, 8, 10, 1, 0]))
+    assert _inorder(tree) == [1, 8]
+
+    assert _build([5, 3]).intersection(_build([4, 6])) is None
+    assert _build([5, 3]).intersection(None) is None
+
+def test_difference():
+    tree = _build([5, 3, 8, 1]).difference(_build([4, 8, 10, 1, 0]))
+    assert _inorder(tree) == [3, 5]
+
+    assert _build([5, 3]).difference(_build([3, 5])) is None
+    assert _inorder(_build([5, 3]).difference(None)) == [3, 5]
+
+def test_deep_set_operations():
+    smaller, node, greater = _build(range(3000)).split(2500)
+    assert list(smaller.irange()) == list(range(2500))
+    assert node.data == 2500
+    assert list(greater.irange()) == list(range(2501, 3000))
+
+    tree = _build(range(3000)).join(BinarySearchTree(5000))
+    assert list(tree.irange()) == list(range(3000)) + [5000]
+
+    tree = _build(range(0, 3000, 2)).union(_build(range(0, 3000, 3)))
+    assert list(tree.irange()) == sorted(set(range(0, 3000, 2)) | set(range(0, 3000, 3)))
+
+    tree = _build(range(0, 3000, 2)).intersection(_build(range(0, 3000, 3)))
+    assert list(tree.irange()) == list(range(0, 3000, 6))
+
+    tree = _build(range(0, 3000, 2)).difference(_build(range(0, 3000, 3)))
+    assert list(tree.irange()) == sorted(set(range(0, 3000, 2)) - set(range(0, 3000, 3)))
@@ -0,0 +1,98 @@
+import pytest
+from pystrukts.tree import BinarySearchTreeMap
+
+def _height(tree: 'BinarySearchTreeMap'):
+    if tree is None:
+        return 0
+
+    return 1 + max(_height(tree.left), _height(tree.right))
+
+def test_initialization():
+    tree = BinarySearchTreeMap(1, "one")
+    assert tree.data == 1
+    assert tree.value == "one"
+    assert tree.left is None
+    assert tree.right is None
+
+    assert BinarySearchTreeMap(1).value is None
+
+def test_insert_get():
+    tree = BinarySearchTreeMap(5, "five")
+    tree.insert(3, "three")
+    tree.insert(8, "eight")
+    tree.insert(3, "THREE")
+
+    assert tree.get(5) == "five"
+    assert tree.get(3) == "THREE"
+    assert tree.get(8) == "eight"
+    assert tree.get(4) is None
+    assert tree.get(4, "missing") == "missing"
+    assert tree.search(8) == True
+    assert list(tree.items()) == [(3, "THREE"), (5, "five"), (8, "eight")]
+
+def test_delete():
+    tree = BinarySearchTreeMap(5, "five")
+    for key in [3, 8, 1, 4, 7, 9]:
+        tree.insert(key, str(key))
+
+    tree = tree.delete(5)
+    assert tree.get(5) is None
+    assert list(tree.items()) == [(1, "1"), (3, "3"), (4, "4"), (7, "7"), (8, "8"), (9, "9")]
+
+    tree = tree.delete(3)
+    tree = tree.delete(42)
+    assert list(tree.items()) == [(1, "1"), (4, "4"), (7, "7"), (8, "8"), (9, "9")]
+
+def test_items_range():
+    tree = BinarySearchTreeMap.from_sorted((i, i * i) for i in range(10))
+
+    assert list(tree.items(3, 5)) == [(3, 9), (4, 16), (5, 25)]
+    assert list(tree.irange(8)) == [8, 9]
+
+def test_from_sorted():
+    tree = BinarySearchTreeMap.from_sorted((i, str(i)) for i in range(1000))
+
+    assert list(tree.items()) == [(i, str(i)) for i in range(1000)]
+    assert _height(tree) == 10
+    assert tree.get(999) == "999"
+
+def test_from_sorted_empty():
+    assert BinarySearchTreeMap.from_sorted([]) is None
+
+def test_update():
+    tree = BinarySearchTreeMap.from_sorted([(1, "a"), (3, "c"), (5, "e")])
+    root = tree
+    tree.update([(0, "z"), (3, "C"), (4, "d"), (4, "D"), (9, "i")])
+
+    assert tree is root
+    assert list(tree.items()) == [(0, "z"), (1, "a"), (3, "C"), (4, "D"), (5, "e"), (9, "i")]
+    assert _height(tree) == 3
+
+def test_update_large():
+    tree = BinarySearchTreeMap(0, 0)
+    tree.update((i, i) for i in range(1, 1000, 2))
+    tree.update((i, -i) for i in range(0, 1000, 2))
+
+    assert list(tree.items()) == [(i, i if i % 2 else -i) for i in range(1000)]
+    assert _height(tree) == 10
+
+def test_update_unsorted():
+    tree = BinarySearchTreeMap(0, 0)
+
+    with pytest.raises(ValueError):
+        tree.update([(2, "b"), (1, "a")])
+
+def test_union_keeps_values():
+    first = BinarySearchTreeMap.from_sorted([(1, "a"), (2, "b"), (3, "c")])
+    second = BinarySearchTreeMap.from_sorted([(2, "B"), (4, "D")])
+
+    tree = first.union(second)
+    assert list(tree.items()) == [(1, "a"), (2, "b"), (3, "c"), (4, "D")]
+
+def test_split_value():
+    tree = BinarySearchTreeMap.from_sorted([(1, "a"), (2, "b"), (3, "c")])
+
+    smaller, node, greater = tree.split(2)
+    assert (node.data, node.value) == (2, "b")
+    assert list(smaller.items()) == [(1, "a")]
+    assert list(greater.items()) == [(3, "c")]
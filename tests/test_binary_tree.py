@@ -52,4 +52,82 @@ def test_is_leaf():
     assert tree.is_leaf() == False
 
     tree.left = None
-    assert tree.is_leaf() == True
\ No newline at end of file
+    assert tree.is_leaf() == True
+
+def test_slots():
+    tree = BinaryTree(1)
+
+    assert not hasattr(tree, "__dict__")
+    with pytest.raises(AttributeError):
+        tree.color = "red"
+
+def _build():
+    #         1
+    #       /   \
+    #      2     3
+    #     / \     \
+    #    4   5     6
+    #       /
+    #      7
+    tree = BinaryTree(1)
+    tree.left = BinaryTree(2)
+    tree.right = BinaryTree(3)
+    tree.left.left = BinaryTree(4)
+    tree.left.right = BinaryTree(5)
+    tree.left.right.left = BinaryTree(7)
+    tree.right.right = BinaryTree(6)
+    return tree
+
+def _structure(tree):
+    if tree is None:
+        return None
+
+    return (tree.data, _structure(tree.left), _structure(tree.right))
+
+def test_preorder():
+    assert [node.data for node in _build().preorder()] == [1, 2, 4, 5, 7, 3, 6]
+    assert [node.data for node in BinaryTree(1).preorder()] == [1]
+
+def test_inorder():
+    assert [node.data for node in _build().inorder()] == [4, 2, 7, 5, 1, 3, 6]
+    assert [node.data for node in BinaryTree(1).inorder()] == [1]
+
+def test_postorder():
+    assert [node.data for node in _build().postorder()] == [4, 7, 5, 2, 6, 3, 1]
+    assert [node.data for node in BinaryTree(1).postorder()] == [1]
+
+def test_level_order():
+    assert [node.data for node in _build().level_order()] == [1, 2, 3, 4, 5, 6, 7]
+    assert [node.data for node in BinaryTree(1).level_order()] == [1]
+
+def test_morris_inorder():
+    tree = _build()
+    structure = _structure(tree)
+
+    assert [node.data for node in tree.morris_inorder()] == [4, 2, 7, 5, 1, 3, 6]
+    assert _structure(tree) == structure
+
+def test_morris_inorder_closed_early():
+    tree = _build()
+    structure = _structure(tree)
+
+    iterator = tree.morris_inorder()
+    assert next(iterator).data == 4
+    assert next(iterator).data == 2
+    iterator.close()
+
+    assert _structure(tree) == structure
+
+def test_traversals_deep_tree():
+    tree = BinaryTree(0)
+    node = tree
+    for i in range(1, 5000):
+        node.left = BinaryTree(i)
+        node = node.left
+
+    expected = list(range(5000))
+    assert [node.data for node in tree.preorder()] == expected
+    assert [node.data for node in tree.inorder()] == expected[::-1]
+    assert [node.data for node in tree.postorder()] == expected[::-1]
+    assert [node.data for node in tree.level_order()] == expected
+    assert [node.data for node in tree.morris_inorder()] == expected[::-1]
@@ -0,0 +1,192 @@
+import random
+import threading
+import pytest
+from pystrukts import LRUCache, LFUCache
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr('pystrukts.cache.monotonic', lambda: now[0])
+    return now
+
+@pytest.mark.parametrize('cls', [LRUCache, LFUCache])
+def test_initialization(cls):
+    cache = cls(3)
+    assert cache.capacity == 3
+    assert cache.ttl is None
+    assert len(cache) == 0
+    assert cache.size == 0
+    assert cache.stats['hits'] == 0
+
+    with pytest.raises(ValueError):
+        cls(0)
+
+@pytest.mark.parametrize('cls', [LRUCache, LFUCache])
+def test_get_and_put(cls):
+    cache = cls(3)
+    cache.put('a', 1)
+    cache['b'] = 2
+
+    assert cache['a'] == 1
+    assert cache.get('b') == 2
+    assert cache.get('c', 'missing') == 'missing'
+    assert 'a' in cache
+    assert 'c' not in cache
+    assert cache.stats['hits'] == 2
+    assert cache.stats['misses'] == 1
+
+    with pytest.raises(KeyError):
+        cache['c']
+
+    cache['a'] = 10
+    assert cache['a'] == 10
+    assert len(cache) == 2
+
+@pytest.mark.parametrize('cls', [LRUCache, LFUCache])
+def test_delete_and_clear(cls):
+    cache = cls(3)
+    cache['a'] = 1
+    cache['b'] = 2
+
+    del cache['a']
+    assert 'a' not in cache
+    assert len(cache) == 1
+
+    with pytest.raises(KeyError):
+        del cache['a']
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.size == 0
+    cache['c'] = 3
+    assert cache['c'] == 3
+
+def test_lru_eviction():
+    cache = LRUCache(3)
+    for key in 'abc':
+        cache[key] = key
+
+    cache['a']
+    cache['d'] = 'd'
+    assert 'b' not in cache
+    assert all(key in cache for key in 'acd')
+
+    cache['c'] = 'C'
+    cache['e'] = 'e'
+    assert 'a' not in cache
+    assert cache.stats['evictions'] == 2
+
+def test_lfu_update_keeps_entry():
+    cache = LFUCache(10, weight=lambda key, value: value)
+    cache['a'] = 2
+    cache['a']
+    cache['a']
+    cache['b'] = 3
+    cache['b'] = 9
+    assert 'a' not in cache
+    assert cache['b'] == 9
+    assert cache.size == 9
+
+def test_lfu_eviction():
+    cache = LFUCache(3)
+    for key in 'abc':
+        cache[key] = key
+
+    cache['a']
+    cache['a']
+    cache['b']
+    assert cache.frequency('a') == 3
+    assert cache.frequency('c') == 1
+
+    cache['d'] = 'd'
+    assert 'c' not in cache
+    cache['e'] = 'e'
+    assert 'd' not in cache
+    assert all(key in cache for key in 'abe')
+
+    cache['e']
+    cache['f'] = 'f'
+    assert 'b' not in cache
+    assert 'e' in cache
+
+    with pytest.raises(KeyError):
+        cache.frequency('z')
+
+@pytest.mark.parametrize('cls', [LRUCache, LFUCache])
+def test_weight(cls):
+    cache = cls(10, weight=lambda key, value: len(value))
+    cache['a'] = 'xxxx'
+    cache['b'] = 'xxxx'
+    assert cache.size == 8
+
+    cache['c'] = 'xxxxxx'
+    assert 'a' not in cache
+    assert 'b' in cache
+    assert cache.size == 10
+
+    cache['c'] = 'xx'
+    assert cache.size == 6
+
+    with pytest.raises(ValueError):
+        cache['d'] = 'x' * 11
+
+@pytest.mark.parametrize('cls', [LRUCache, LFUCache])
+def test_ttl(cls, clock):
+    cache = cls(3, ttl=10)
+    cache['a'] = 1
+    clock[0] = 5
+    cache['b'] = 2
+    assert cache['a'] == 1
+
+    clock[0] = 10
+    assert 'a' not in cache
+    assert cache['b'] == 2
+    assert cache.stats['expirations'] == 1
+
+    cache['b'] = 3
+    clock[0] = 16
+    assert cache['b'] == 3
+
+    cache['c'] = 4
+    clock[0] = 100
+    cache.expire()
+    assert len(cache) == 0
+    assert cache.stats['expirations'] == 3
+
+@pytest.mark.parametrize('cls', [LRUCache, LFUCache])
+def test_random_against_reference(cls):
+    rng = random.Random(0)
+    cache = cls(20)
+    reference = {}
+    for _ in range(5000):
+        key = rng.randrange(40)
+        if rng.random() < 0.5:
+            cache[key] = key * 3
+            reference[key] = key * 3
+        else:
+            value = cache.get(key)
+            assert value is None or value == reference[key]
+
+        assert len(cache) <= 20
+        assert cache.size == len(cache)
+
+@pytest.mark.parametrize('cls', [LRUCache, LFUCache])
+def test_thread_safe(cls):
+    cache = cls(50, thread_safe=True)
+
+    def work(seed):
+        rng = random.Random(seed)
+        for _ in range(2000):
+            key = rng.randrange(100)
+            if cache.get(key) is None:
+                cache[key] = key
+
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(cache) == 50
+    assert cache.size == 50
+    assert cache.stats['hits'] + cache.stats['misses'] == 8000
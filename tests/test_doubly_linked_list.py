@@ -379,4 +379,226 @@ def test_popleft_circular():
     assert linked_list._LinkedList__head.data == 2
     assert linked_list._LinkedList__tail.data == 3
     assert linked_list._LinkedList__tail.next == linked_list._LinkedList__head
-    assert linked_list._LinkedList__head.prev == linked_list._LinkedList__tail
\ No newline at end of file
+    assert linked_list._LinkedList__head.prev == linked_list._LinkedList__tail
+
+def _check_links(linked_list):
+    nodes = []
+    node = linked_list._LinkedList__head
+    for _ in range(len(linked_list)):
+        nodes.append(node)
+        node = node.next
+
+    assert nodes[0].prev is None
+    for prev, node in zip(nodes, nodes[1:]):
+        assert node.prev is prev
+    assert linked_list._LinkedList__tail is nodes[-1]
+    assert nodes[-1].next is None
+
+def test_pop_uses_prev():
+    linked_list = DoublyLinkedList()
+    for i in range(10):
+        linked_list.append(i)
+
+    for i in range(9, 0, -1):
+        assert linked_list.pop() == i
+        _check_links(linked_list)
+
+    assert linked_list.pop() == 0
+    assert len(linked_list) == 0
+
+def test_popleft_clears_prev():
+    linked_list = DoublyLinkedList()
+    linked_list.append(1)
+    linked_list.append(2)
+
+    linked_list.popleft()
+    assert linked_list._LinkedList__head.prev is None
+    assert linked_list.pop() == 2
+
+def test_get_from_both_ends():
+    linked_list = DoublyLinkedList()
+    for i in range(11):
+        linked_list.append(i)
+
+    assert [linked_list.get(i) for i in range(11)] == list(range(11))
+    assert [linked_list.get(-i) for i in range(1, 12)] == list(range(10, -1, -1))
+
+def test_insert_and_remove_near_tail():
+    linked_list = DoublyLinkedList()
+    for i in range(10):
+        linked_list.append(i)
+
+    linked_list.insert(100, 8)
+    linked_list.insert(200, -2)
+    assert list(linked_list) == [0, 1, 2, 3, 4, 5, 6, 7, 100, 8, 200, 9]
+    _check_links(linked_list)
+
+    assert linked_list.remove(9) == 8
+    assert linked_list.remove(-3) == 100
+    assert list(linked_list) == [0, 1, 2, 3, 4, 5, 6, 7, 200, 9]
+    _check_links(linked_list)
+
+def test_deque_workload():
+    linked_list = DoublyLinkedList()
+    for i in range(10000):
+        linked_list.append(i)
+        linked_list.appendleft(-i)
+
+    for i in range(9999, -1, -1):
+        assert linked_list.pop() == i
+        assert linked_list.popleft() == -i
+
+    assert len(linked_list) == 0
+
+def test_pop_circular_uses_prev():
+    linked_list = DoublyLinkedList(circular=True)
+    for i in range(5):
+        linked_list.append(i)
+
+    assert linked_list.pop() == 4
+    assert linked_list.pop() == 3
+    assert linked_list.get(-1) == 2
+    assert linked_list._LinkedList__tail.next is linked_list._LinkedList__head
+    assert linked_list._LinkedList__head.prev is linked_list._LinkedList__tail
+
+def test_append_returns_node():
+    linked_list = DoublyLinkedList()
+    node = linked_list.append(1)
+    first = linked_list.appendleft(0)
+    middle = linked_list.insert(5, 1)
+
+    assert node.data == 1
+    assert first is linked_list._LinkedList__head
+    assert node is linked_list._LinkedList__tail
+    assert middle.data == 5
+    assert list(linked_list) == [0, 5, 1]
+
+def test_insert_after_node():
+    linked_list = DoublyLinkedList()
+    first = linked_list.append(1)
+    last = linked_list.append(3)
+
+    assert linked_list.insert_after(first, 2).data == 2
+    tail = linked_list.insert_after(last, 4)
+    assert tail is linked_list._LinkedList__tail
+    assert list(linked_list) == [1, 2, 3, 4]
+    assert len(linked_list) == 4
+
+def test_insert_before_node():
+    linked_list = DoublyLinkedList()
+    first = linked_list.append(2)
+    last = linked_list.append(4)
+
+    head = linked_list.insert_before(first, 1)
+    assert head is linked_list._LinkedList__head
+    linked_list.insert_before(last, 3)
+    assert list(linked_list) == [1, 2, 3, 4]
+    assert linked_list.pop() == 4
+    assert len(linked_list) == 3
+
+def test_remove_node():
+    linked_list = DoublyLinkedList()
+    nodes = [linked_list.append(i) for i in range(5)]
+
+    assert linked_list.remove_node(nodes[2]) == 2
+    assert linked_list.remove_node(nodes[0]) == 0
+    assert linked_list.remove_node(nodes[4]) == 4
+    assert list(linked_list) == [1, 3]
+    assert len(linked_list) == 2
+    assert linked_list._LinkedList__tail is nodes[3]
+    assert linked_list.pop() == 3
+    assert linked_list.pop() == 1
+
+def test_move_to_front():
+    linked_list = DoublyLinkedList()
+    nodes = [linked_list.append(i) for i in range(4)]
+
+    linked_list.move_to_front(nodes[2])
+    assert list(linked_list) == [2, 0, 1, 3]
+    linked_list.move_to_front(nodes[3])
+    assert list(linked_list) == [3, 2, 0, 1]
+    assert linked_list._LinkedList__tail is nodes[1]
+    linked_list.move_to_front(nodes[3])
+    assert list(linked_list) == [3, 2, 0, 1]
+    assert linked_list._LinkedList__head is nodes[3]
+    assert [linked_list.pop() for _ in range(4)] == [1, 0, 2, 3]
+
+def test_move_to_front_circular():
+    linked_list = DoublyLinkedList(circular=True)
+    nodes = [linked_list.append(i) for i in range(3)]
+
+    linked_list.move_to_front(nodes[2])
+    assert linked_list._LinkedList__head is nodes[2]
+    assert linked_list._LinkedList__tail is nodes[1]
+    assert linked_list._LinkedList__tail.next is nodes[2]
+    assert [linked_list.get(i) for i in range(3)] == [2, 0, 1]
+
+    assert linked_list.remove_node(nodes[0]) == 0
+    assert linked_list._LinkedList__tail.next is linked_list._LinkedList__head
+    assert [linked_list.get(i) for i in range(2)] == [2, 1]
+
+def test_node_handles_keep_prev():
+    linked_list = DoublyLinkedList()
+    nodes = [linked_list.append(i) for i in range(5)]
+
+    linked_list.move_to_front(nodes[4])
+    linked_list.remove_node(nodes[2])
+    linked_list.insert_before(nodes[3], 'x')
+    _check_links(linked_list)
+    assert list(linked_list) == [4, 0, 1, 'x', 3]
+    assert nodes[2].prev is None and nodes[2].next is None
+
+def test_stale_node_handles():
+    linked_list = DoublyLinkedList()
+    linked_list.append(1)
+    linked_list.append(2)
+    node = linked_list.append(3)
+    linked_list.pop()
+
+    assert node.prev is None and node.next is None
+    with pytest.raises(ValueError):
+        linked_list.remove_node(node)
+    with pytest.raises(ValueError):
+        linked_list.insert_before(node, 0)
+    with pytest.raises(ValueError):
+        linked_list.insert_after(node, 0)
+    with pytest.raises(ValueError):
+        linked_list.move_to_front(node)
+    assert list(linked_list) == [1, 2]
+    assert len(linked_list) == 2
+
+    nodes = [linked_list.append(i) for i in range(3, 6)]
+    assert linked_list.remove_node(nodes[1]) == 4
+    with pytest.raises(ValueError):
+        linked_list.remove_node(nodes[1])
+    assert linked_list.remove(0) == 1
+    assert linked_list.popleft() == 2
+    assert list(linked_list) == [3, 5]
+    assert len(linked_list) == 2
+    _check_links(linked_list)
+
+def test_foreign_node_handles():
+    linked_list = DoublyLinkedList()
+    for i in range(3):
+        linked_list.append(i)
+
+    other = DoublyLinkedList()
+    first = other.append(10)
+    other.append(11)
+    last = other.append(12)
+
+    for node in (first, last, DoublyLinkedNode(13)):
+        with pytest.raises(ValueError):
+            linked_list.remove_node(node)
+        with pytest.raises(ValueError):
+            linked_list.move_to_front(node)
+
+    assert list(linked_list) == [0, 1, 2] and len(linked_list) == 3
+    assert list(other) == [10, 11, 12] and len(other) == 3
+
+def test_node_slots():
+    node = DoublyLinkedNode(1)
+    assert not hasattr(node, "__dict__")
+
+    with pytest.raises(AttributeError):
+        node.extra = 1
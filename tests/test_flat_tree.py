@@ -0,0 +1,81 @@
+import pytest
+from pystrukts.tree import FlatTree, GenericTree
+
+def _sample_tree():
+    # 'a' -> ('b' -> ('e'), 'c', 'd')
+    tree = FlatTree('a')
+    b = tree.add_child(0, 'b')
+    tree.add_child(0, 'c')
+    tree.add_child(0, 'd')
+    tree.add_child(b, 'e')
+    return tree
+
+def test_initialization():
+    tree = FlatTree(1)
+    assert len(tree) == 1
+    assert tree[0] == 1
+    assert tree.max_children is None
+    assert tree.is_leaf(0)
+    assert tree.n_children(0) == 0
+
+    assert FlatTree(1, 3).max_children == 3
+
+def test_add_child():
+    tree = _sample_tree()
+    assert len(tree) == 5
+    assert tree.n_children(0) == 3
+    assert [tree[child] for child in tree.children(0)] == ['b', 'c', 'd']
+    assert tree.parent[4] == 1
+    assert not tree.is_leaf(1)
+    assert tree.is_leaf(2)
+
+def test_add_child_limit():
+    tree = FlatTree(1, 3)
+    for i in range(3):
+        tree.add_child(0, i)
+
+    with pytest.warns(UserWarning):
+        assert tree.add_child(0, 3) == -1
+    assert tree.n_children(0) == 3
+    assert len(tree) == 4
+
+def test_get_child():
+    tree = _sample_tree()
+    assert tree[tree.get_child(0, 0)] == 'b'
+    assert tree[tree.get_child(0, 2)] == 'd'
+    assert tree[tree.get_child(0, -1)] == 'd'
+
+    with pytest.raises(IndexError):
+        tree.get_child(0, 3)
+
+    with pytest.raises(IndexError):
+        tree.get_child(2, 0)
+
+def test_setitem():
+    tree = _sample_tree()
+    tree[2] = 'z'
+    assert tree[2] == 'z'
+
+def test_preorder():
+    tree = _sample_tree()
+    assert [tree[node] for node in tree.preorder()] == ['a', 'b', 'e', 'c', 'd']
+    assert [tree[node] for node in tree.preorder(1)] == ['b', 'e']
+
+def test_generic_tree_conversion():
+    generic = GenericTree.from_parent_array([-1, 0, 0, 1, 1, 2], data='abcdef', max_children=3)
+    flat = FlatTree.from_generic_tree(generic)
+    assert len(flat) == 6
+    assert flat.max_children == 3
+    assert [flat[node] for node in flat.preorder()] == ['a', 'b', 'd', 'e', 'c', 'f']
+
+    back = flat.to_generic_tree()
+    assert back.max_children == 3
+    assert [node.data for node in back.preorder()] == ['a', 'b', 'd', 'e', 'c', 'f']
+    assert [node.data for node in back.level_order()] == [node.data for node in generic.level_order()]
+
+def test_generic_tree_conversion_too_many_children():
+    generic = GenericTree(0, 3)
+    generic.children.extend(GenericTree(i, 3) for i in range(1, 5))
+
+    with pytest.raises(ValueError):
+        FlatTree.from_generic_tree(generic)
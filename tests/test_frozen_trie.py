@@ -0,0 +1,86 @@
+import pytest
+from pystrukts.tree import Trie, FrozenTrie
+
+WORDS = ["hello", "help", "helpful", "world", "word", "a", "ñandú", ""]
+
+def _build_trie(words):
+    trie = Trie()
+    for word in words:
+        trie.insert(word)
+    return trie
+
+def test_freeze_search():
+    frozen = _build_trie(WORDS).freeze()
+
+    for word in WORDS:
+        assert frozen.search(word) == True
+        assert word in frozen
+
+    assert frozen.search("hel") == False
+    assert frozen.search("helpfully") == False
+    assert frozen.search("b") == False
+    assert len(frozen) == len(WORDS)
+
+def test_freeze_startswith():
+    frozen = _build_trie(WORDS).freeze()
+
+    assert frozen.startswith("hel") == True
+    assert frozen.startswith("wor") == True
+    assert frozen.startswith("ñan") == True
+    assert frozen.startswith("") == True
+    assert frozen.startswith("x") == False
+    assert frozen.startswith("helpx") == False
+
+def test_freeze_keys():
+    frozen = _build_trie(WORDS).freeze()
+
+    assert list(frozen) == sorted(WORDS)
+    assert list(frozen.keys("hel")) == ["hello", "help", "helpful"]
+    assert list(frozen.keys("help")) == ["help", "helpful"]
+    assert list(frozen.keys("x")) == []
+
+def test_freeze_empty():
+    frozen = _build_trie([]).freeze()
+
+    assert len(frozen) == 0
+    assert frozen.search("") == False
+    assert frozen.startswith("a") == False
+    assert list(frozen) == []
+
+def test_freeze_large():
+    words = [format(i * 7919, "x") for i in range(2000)]
+    frozen = _build_trie(words).freeze()
+
+    assert len(frozen) == len(set(words))
+    assert all(frozen.search(word) for word in words)
+    assert list(frozen) == sorted(set(words))
+
+def test_save_load(tmp_path):
+    path = tmp_path / "words.trie"
+    _build_trie(WORDS).freeze().save(path)
+
+    with FrozenTrie.load(path) as frozen:
+        assert list(frozen) == sorted(WORDS)
+        assert frozen.search("helpful") == True
+        assert frozen.search("helpless") == False
+
+def test_to_bytes():
+    frozen = _build_trie(WORDS).freeze()
+    copy = FrozenTrie(frozen.to_bytes())
+
+    assert list(copy) == list(frozen)
+
+def test_invalid_buffer(tmp_path):
+    with pytest.raises(ValueError):
+        FrozenTrie(b"not a trie")
+
+    with pytest.raises(ValueError):
+        FrozenTrie(b"x" * 64)
+
+    with pytest.raises(ValueError):
+        FrozenTrie(_build_trie(WORDS).freeze().to_bytes()[:-8])
+
+    path = tmp_path / "invalid.trie"
+    path.write_bytes(b"x" * 64)
+    with pytest.raises(ValueError):
+        FrozenTrie.load(path)
@@ -132,4 +132,87 @@ def test_is_leaf():
     assert tree.is_leaf() == False
 
     tree.remove_child(0)
-    assert tree.is_leaf() == True
\ No newline at end of file
+    assert tree.is_leaf() == True
+
+def test_slots():
+    tree = GenericTree(1, 3)
+    tree.add_child(2)
+
+    assert not hasattr(tree, "__dict__")
+    assert not hasattr(tree.get_child(0), "__dict__")
+
+
+def test_add_child_unbounded():
+    tree = GenericTree(1)
+    for i in range(5):
+        tree.add_child(i)
+    tree.get_child(0).add_child(5)
+
+    assert tree.n_children() == 5
+    assert tree.get_child(0).max_children is None
+    assert tree.get_child(0).get_child(0).data == 5
+
+def _sample_tree():
+    # 0 -> (1 -> (4, 5), 2, 3 -> (6))
+    return GenericTree.from_parent_array([-1, 0, 0, 0, 1, 1, 3])
+
+def test_iter_children():
+    tree = _sample_tree()
+    assert [child.data for child in tree.iter_children()] == [1, 2, 3]
+    assert list(tree.get_child(1).iter_children()) == []
+
+def test_traversals():
+    tree = _sample_tree()
+    assert [node.data for node in tree.preorder()] == [0, 1, 4, 5, 2, 3, 6]
+    assert [node.data for node in tree.postorder()] == [4, 5, 1, 2, 6, 3, 0]
+    assert [node.data for node in tree.level_order()] == [0, 1, 2, 3, 4, 5, 6]
+    assert [node.data for node in GenericTree(7).postorder()] == [7]
+
+def test_traversals_deep():
+    tree = GenericTree.from_parent_array([-1] + list(range(9999)))
+    assert sum(1 for _ in tree.preorder()) == 10000
+    assert next(tree.postorder()).data == 9999
+
+def test_from_parent_array():
+    tree = GenericTree.from_parent_array([1, -1, 1], data=['a', 'b', 'c'], max_children=3)
+    assert tree.data == 'b'
+    assert tree.max_children == 3
+    assert [child.data for child in tree.get_children()] == ['a', 'c']
+
+def test_from_parent_array_errors():
+    with pytest.raises(ValueError):
+        GenericTree.from_parent_array([-1, 0], data=['a'])
+
+    with pytest.raises(ValueError):
+        GenericTree.from_parent_array([-1, -1])
+
+    with pytest.raises(ValueError):
+        GenericTree.from_parent_array([1, 0])
+
+    with pytest.raises(ValueError):
+        GenericTree.from_parent_array([-1, 5])
+
+    with pytest.raises(ValueError):
+        GenericTree.from_parent_array([-1, 2, 1])
+
+    with pytest.raises(ValueError):
+        GenericTree.from_parent_array([-1, 0, 0, 0, 0], max_children=3)
+
+def test_from_edges():
+    tree = GenericTree.from_edges([('ceo', 'cto'), ('cto', 'dev'), ('ceo', 'cfo')], 'ceo')
+    assert tree.data == 'ceo'
+    assert [node.data for node in tree.preorder()] == ['ceo', 'cto', 'dev', 'cfo']
+    assert GenericTree.from_edges([], 'alone').is_leaf()
+
+def test_from_edges_errors():
+    with pytest.raises(ValueError):
+        GenericTree.from_edges([('a', 'b'), ('c', 'b')], 'a')
+
+    with pytest.raises(ValueError):
+        GenericTree.from_edges([('b', 'a')], 'a')
+
+    with pytest.raises(ValueError):
+        GenericTree.from_edges([('a', 'b'), ('c', 'd')], 'a')
+
+    with pytest.raises(ValueError):
+        GenericTree.from_edges([('a', 'b'), ('a', 'c'), ('a', 'd'), ('a', 'e')], 'a', 3)
@@ -0,0 +1,115 @@
+import random
+import pytest
+from pystrukts.tree import OrderStatisticTree
+
+def _sizes_valid(tree: 'OrderStatisticTree'):
+    if tree is None:
+        return 0
+
+    size = 1 + _sizes_valid(tree.left) + _sizes_valid(tree.right)
+    assert tree.size == size
+    return size
+
+def test_initialization():
+    tree = OrderStatisticTree(1)
+    assert tree.data == 1
+    assert tree.size == 1
+    assert len(tree) == 1
+
+def test_insert():
+    tree = OrderStatisticTree(5)
+    for value in [3, 8, 1, 4, 3, 5]:
+        tree.insert(value)
+
+    assert len(tree) == 5
+    assert list(tree.irange()) == [1, 3, 4, 5, 8]
+    _sizes_valid(tree)
+
+def test_rank():
+    tree = OrderStatisticTree(10)
+    for value in [5, 15, 2, 7, 12, 20]:
+        tree.insert(value)
+
+    assert tree.rank(2) == 0
+    assert tree.rank(10) == 3
+    assert tree.rank(20) == 6
+    assert tree.rank(11) == 4
+    assert tree.rank(1) == 0
+    assert tree.rank(100) == 7
+
+def test_select():
+    tree = OrderStatisticTree(10)
+    for value in [5, 15, 2, 7, 12, 20]:
+        tree.insert(value)
+
+    assert [tree.select(k) for k in range(7)] == [2, 5, 7, 10, 12, 15, 20]
+    assert tree.select(-1) == 20
+
+    with pytest.raises(IndexError):
+        tree.select(7)
+
+    with pytest.raises(IndexError):
+        tree.select(-8)
+
+def test_delete():
+    tree = OrderStatisticTree(10)
+    for value in [5, 15, 2, 7, 12, 20]:
+        tree.insert(value)
+
+    tree = tree.delete(10)
+    assert len(tree) == 6
+    _sizes_valid(tree)
+
+    tree = tree.delete(42)
+    assert len(tree) == 6
+
+    tree = tree.delete(2)
+    assert tree.select(0) == 5
+    assert tree.rank(20) == 4
+    _sizes_valid(tree)
+
+def test_random_operations():
+    rng = random.Random(0)
+    tree = OrderStatisticTree(500)
+    expected = {500}
+
+    for _ in range(2000):
+        value = rng.randrange(1000)
+        if rng.random() < 0.6:
+            tree.insert(value)
+            expected.add(value)
+        elif len(expected) > 1:
+            tree = tree.delete(value)
+            expected.discard(value)
+
+    ordered = sorted(expected)
+    _sizes_valid(tree)
+    assert [tree.select(k) for k in range(len(ordered))] == ordered
+    assert all(tree.rank(value) == i for i, value in enumerate(ordered))
+
+def _build(values):
+    tree = OrderStatisticTree(values[0])
+    for value in values[1:]:
+        tree.insert(value)
+    return tree
+
+def test_set_operations():
+    first = [5, 3, 8, 1, 9, 2]
+    second = [4, 8, 10, 1, 0]
+
+    tree = _build(first).union(_build(second))
+    _sizes_valid(tree)
+    assert [tree.select(k) for k in range(len(tree))] == [0, 1, 2, 3, 4, 5, 8, 9, 10]
+
+    tree = _build(first).intersection(_build(second))
+    _sizes_valid(tree)
+    assert list(tree.irange()) == [1, 8]
+
+    tree = _build(first).difference(_build(second))
+    _sizes_valid(tree)
+    assert tree.rank(9) == 3
+
+    smaller, node, greater = _build(first).split(5)
+    _sizes_valid(smaller)
+    _sizes_valid(greater)
+    assert node.size == 1
@@ -0,0 +1,86 @@
+import random
+from pystrukts.tree import PersistentBinarySearchTree
+
+def _check_balanced(node):
+    if node is None:
+        return 0
+
+    left = _check_balanced(node.left)
+    right = _check_balanced(node.right)
+    assert abs(left - right) <= 1
+    assert node.height == 1 + max(left, right)
+    return node.height
+
+def _nodes(node):
+    if node is None:
+        return set()
+
+    return {id(node)} | _nodes(node.left) | _nodes(node.right)
+
+def test_initialization():
+    tree = PersistentBinarySearchTree()
+    assert tree.root is None
+    assert len(tree) == 0
+    assert list(tree) == []
+
+    tree = PersistentBinarySearchTree([3, 1, 2, 3])
+    assert len(tree) == 3
+    assert list(tree) == [1, 2, 3]
+
+def test_insert_returns_new_version():
+    v0 = PersistentBinarySearchTree()
+    v1 = v0.insert(1)
+    v2 = v1.insert(2)
+
+    assert list(v0) == []
+    assert list(v1) == [1]
+    assert list(v2) == [1, 2]
+    assert v2.insert(2) is v2
+
+def test_delete_returns_new_version():
+    v0 = PersistentBinarySearchTree(range(10))
+    v1 = v0.delete(5)
+    v2 = v1.delete(0)
+
+    assert list(v0) == list(range(10))
+    assert list(v1) == [0, 1, 2, 3, 4, 6, 7, 8, 9]
+    assert list(v2) == [1, 2, 3, 4, 6, 7, 8, 9]
+    assert len(v2) == 8
+    assert v2.delete(5) is v2
+    assert PersistentBinarySearchTree().delete(1).root is None
+
+def test_search():
+    tree = PersistentBinarySearchTree([5, 3, 8])
+    assert tree.search(3)
+    assert 8 in tree
+    assert 4 not in tree
+
+def test_structural_sharing():
+    v0 = PersistentBinarySearchTree(range(1024))
+    v1 = v0.insert(1024)
+
+    new_nodes = _nodes(v1.root) - _nodes(v0.root)
+    assert len(new_nodes) <= v1.root.height + 2
+    assert v1.root.left is v0.root.left
+
+    v2 = v0.delete(0)
+    assert len(_nodes(v2.root) - _nodes(v0.root)) <= v0.root.height + 2
+    assert v2.root.right is v0.root.right
+
+def test_random_versions():
+    rng = random.Random(0)
+    versions = [PersistentBinarySearchTree()]
+    expected = [set()]
+    for _ in range(500):
+        value = rng.randrange(100)
+        if rng.random() < 0.6:
+            versions.append(versions[-1].insert(value))
+            expected.append(expected[-1] | {value})
+        else:
+            versions.append(versions[-1].delete(value))
+            expected.append(expected[-1] - {value})
+
+    for version, values in zip(versions, expected):
+        assert list(version) == sorted(values)
+        assert len(version) == len(values)
+        _check_balanced(version.root)
@@ -0,0 +1,131 @@
+import random
+import pytest
+from pystrukts.tree import RedBlackTree
+
+def _inorder(tree: 'RedBlackTree'):
+    if tree is None:
+        return []
+
+    return _inorder(tree.left) + [tree.data] + _inorder(tree.right)
+
+def _black_height(tree: 'RedBlackTree'):
+    if tree is None:
+        return 1
+
+    assert not (tree.right is not None and tree.right.red)
+    if tree.red:
+        assert not (tree.left is not None and tree.left.red)
+
+    left = _black_height(tree.left)
+    assert left == _black_height(tree.right)
+    return left + (0 if tree.red else 1)
+
+def _height(tree: 'RedBlackTree'):
+    if tree is None:
+        return 0
+
+    return 1 + max(_height(tree.left), _height(tree.right))
+
+def test_initialization():
+    tree = RedBlackTree(1)
+    assert tree.data == 1
+    assert tree.left is None
+    assert tree.right is None
+    assert tree.red == False
+
+def test_insert_sorted():
+    tree = RedBlackTree(0)
+    for i in range(1, 1000):
+        tree.insert(i)
+
+    assert _inorder(tree) == list(range(1000))
+    assert tree.red == False
+    _black_height(tree)
+    assert _height(tree) <= 20
+
+def test_insert_reverse_sorted():
+    tree = RedBlackTree(999)
+    for i in range(998, -1, -1):
+        tree.insert(i)
+
+    assert _inorder(tree) == list(range(1000))
+    _black_height(tree)
+    assert _height(tree) <= 20
+
+def test_insert_duplicate():
+    tree = RedBlackTree(1)
+    tree.insert(2)
+    tree.insert(2)
+    tree.insert(1)
+
+    assert _inorder(tree) == [1, 2]
+
+def test_search():
+    tree = RedBlackTree(5)
+    for i in [3, 8, 1, 4, 7, 9]:
+        tree.insert(i)
+
+    assert all(tree.search(i) for i in [1, 3, 4, 5, 7, 8, 9])
+    assert tree.search(2) == False
+    assert tree.search(10) == False
+
+def test_delete():
+    tree = RedBlackTree(1)
+    for i in [5, 0, -1, 4, 3]:
+        tree.insert(i)
+
+    tree = tree.delete(1)
+    assert _inorder(tree) == [-1, 0, 3, 4, 5]
+
+    tree = tree.delete(42)
+    assert _inorder(tree) == [-1, 0, 3, 4, 5]
+
+    for i in [0, 5, 3, 4]:
+        tree = tree.delete(i)
+        _black_height(tree)
+
+    assert _inorder(tree) == [-1]
+    assert tree.delete(-1) is None
+
+def test_random_operations():
+    rng = random.Random(0)
+    tree = RedBlackTree(500)
+    expected = {500}
+
+    for _ in range(3000):
+        value = rng.randrange(1000)
+        if rng.random() < 0.6:
+            tree.insert(value)
+            expected.add(value)
+        elif len(expected) > 1:
+            tree = tree.delete(value)
+            expected.discard(value)
+
+    assert _inorder(tree) == sorted(expected)
+    assert tree.red == False
+    _black_height(tree)
+
+def test_set_operations_not_supported():
+    for operation in ('union', 'intersection', 'difference'):
+        tree = RedBlackTree(0)
+        other = RedBlackTree(100)
+        for i in range(1, 20):
+            tree.insert(i)
+            other.insert(100 + i)
+
+        with pytest.raises(TypeError):
+            getattr(tree, operation)(other)
+        assert _inorder(tree) == list(range(20))
+        assert _inorder(other) == list(range(100, 120))
+        _black_height(tree)
+
+    tree = RedBlackTree(0)
+    for i in range(1, 20):
+        tree.insert(i)
+
+    with pytest.raises(TypeError):
+        tree.split(7)
+    with pytest.raises(TypeError):
+        tree.join(RedBlackTree(100))
+    assert _inorder(tree) == list(range(20))
+    _black_height(tree)
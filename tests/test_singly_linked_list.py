@@ -366,4 +366,105 @@ def test_popleft_circular():
     assert linked_list.popleft() == 1
     assert linked_list._LinkedList__head.data == 2
     assert linked_list._LinkedList__tail.data == 3
-    assert linked_list._LinkedList__tail.next == linked_list._LinkedList__head
\ No newline at end of file
+    assert linked_list._LinkedList__tail.next == linked_list._LinkedList__head
+
+def test_append_returns_node():
+    linked_list = SinglyLinkedList()
+    node = linked_list.append(1)
+    first = linked_list.appendleft(0)
+    middle = linked_list.insert(5, 1)
+
+    assert node.data == 1
+    assert first is linked_list._LinkedList__head
+    assert node is linked_list._LinkedList__tail
+    assert middle.data == 5
+    assert list(linked_list) == [0, 5, 1]
+
+def test_insert_after_node():
+    linked_list = SinglyLinkedList()
+    first = linked_list.append(1)
+    last = linked_list.append(3)
+
+    assert linked_list.insert_after(first, 2).data == 2
+    tail = linked_list.insert_after(last, 4)
+    assert tail is linked_list._LinkedList__tail
+    assert list(linked_list) == [1, 2, 3, 4]
+    assert len(linked_list) == 4
+
+def test_insert_before_node():
+    linked_list = SinglyLinkedList()
+    first = linked_list.append(2)
+    last = linked_list.append(4)
+
+    head = linked_list.insert_before(first, 1)
+    assert head is linked_list._LinkedList__head
+    linked_list.insert_before(last, 3)
+    assert list(linked_list) == [1, 2, 3, 4]
+    assert linked_list.pop() == 4
+    assert len(linked_list) == 3
+
+def test_remove_node():
+    linked_list = SinglyLinkedList()
+    nodes = [linked_list.append(i) for i in range(5)]
+
+    assert linked_list.remove_node(nodes[2]) == 2
+    assert linked_list.remove_node(nodes[0]) == 0
+    assert linked_list.remove_node(nodes[4]) == 4
+    assert list(linked_list) == [1, 3]
+    assert len(linked_list) == 2
+    assert linked_list._LinkedList__tail is nodes[3]
+    assert linked_list.pop() == 3
+    assert linked_list.pop() == 1
+
+def test_move_to_front():
+    linked_list = SinglyLinkedList()
+    nodes = [linked_list.append(i) for i in range(4)]
+
+    linked_list.move_to_front(nodes[2])
+    assert list(linked_list) == [2, 0, 1, 3]
+    linked_list.move_to_front(nodes[3])
+    assert list(linked_list) == [3, 2, 0, 1]
+    assert linked_list._LinkedList__tail is nodes[1]
+    linked_list.move_to_front(nodes[3])
+    assert list(linked_list) == [3, 2, 0, 1]
+    assert linked_list._LinkedList__head is nodes[3]
+    assert [linked_list.pop() for _ in range(4)] == [1, 0, 2, 3]
+
+def test_move_to_front_circular():
+    linked_list = SinglyLinkedList(circular=True)
+    nodes = [linked_list.append(i) for i in range(3)]
+
+    linked_list.move_to_front(nodes[2])
+    assert linked_list._LinkedList__head is nodes[2]
+    assert linked_list._LinkedList__tail is nodes[1]
+    assert linked_list._LinkedList__tail.next is nodes[2]
+    assert [linked_list.get(i) for i in range(3)] == [2, 0, 1]
+
+    assert linked_list.remove_node(nodes[0]) == 0
+    assert linked_list._LinkedList__tail.next is linked_list._LinkedList__head
+    assert [linked_list.get(i) for i in range(2)] == [2, 1]
+
+def test_node_not_in_list():
+    linked_list = SinglyLinkedList()
+    linked_list.append(1)
+    linked_list.append(2)
+
+    with pytest.raises(ValueError):
+        linked_list.remove_node(SinglyLinkedNode(3))
+
+def test_node_slots():
+    node = SinglyLinkedNode(1)
+    assert not hasattr(node, "__dict__")
+
+    with pytest.raises(AttributeError):
+        node.extra = 1
+
+def test_head_and_tail():
+    linked_list = SinglyLinkedList()
+    assert linked_list.head is None
+    assert linked_list.tail is None
+
+    first = linked_list.append(1)
+    last = linked_list.append(2)
+    assert linked_list.head is first
+    assert linked_list.tail is last
@@ -0,0 +1,111 @@
+import random
+import pytest
+from pystrukts.tree import Treap
+
+def _check(node):
+    if node is None:
+        return 0
+
+    for child in (node.left, node.right):
+        if child is not None:
+            assert child.priority <= node.priority
+    if node.left is not None:
+        assert node.left.data <= node.data
+    if node.right is not None:
+        assert node.right.data >= node.data
+
+    size = 1 + _check(node.left) + _check(node.right)
+    assert node.size == size
+    return size
+
+def test_initialization():
+    treap = Treap()
+    assert len(treap) == 0
+    assert list(treap) == []
+
+    treap = Treap([3, 1, 2, 1], seed=0)
+    assert len(treap) == 4
+    assert list(treap) == [1, 1, 2, 3]
+    _check(treap.root)
+
+def test_seed_is_reproducible():
+    first = Treap(range(100), seed=42)
+    second = Treap(range(100), seed=42)
+    assert first.root.data == second.root.data
+    assert first.root.priority == second.root.priority
+
+def test_getitem():
+    treap = Treap([5, 1, 4, 2, 3], seed=1)
+    assert [treap[i] for i in range(5)] == [1, 2, 3, 4, 5]
+    assert treap[-1] == 5
+    assert treap[-5] == 1
+
+    with pytest.raises(IndexError):
+        treap[5]
+
+    with pytest.raises(IndexError):
+        treap[-6]
+
+def test_slicing():
+    values = list(range(0, 40, 2))
+    treap = Treap(values, seed=2)
+    assert treap[3:8] == values[3:8]
+    assert treap[:] == values
+    assert treap[-3:] == values[-3:]
+    assert treap[::3] == values[::3]
+    assert treap[::-1] == values[::-1]
+    assert treap[10:2] == []
+    assert treap[15:100] == values[15:100]
+
+def test_bisect_and_count():
+    treap = Treap([1, 2, 2, 2, 5], seed=3)
+    assert treap.bisect_left(2) == 1
+    assert treap.bisect_right(2) == 4
+    assert treap.bisect_left(0) == 0
+    assert treap.bisect_right(6) == 5
+    assert treap.count(2) == 3
+    assert treap.count(3) == 0
+    assert 5 in treap
+    assert 3 not in treap
+
+def test_remove():
+    treap = Treap([1, 2, 2, 3], seed=4)
+    treap.remove(2)
+    assert list(treap) == [1, 2, 3]
+
+    with pytest.raises(ValueError):
+        treap.remove(4)
+
+    assert Treap().count(1) == 0
+    with pytest.raises(ValueError):
+        Treap().remove(1)
+
+def test_pop():
+    treap = Treap(range(10), seed=5)
+    assert treap.pop() == 9
+    assert treap.pop(0) == 0
+    assert treap.pop(-2) == 7
+    assert list(treap) == [1, 2, 3, 4, 5, 6, 8]
+
+    with pytest.raises(IndexError):
+        Treap().pop()
+
+def test_random_operations():
+    rng = random.Random(6)
+    treap = Treap(seed=6)
+    expected = []
+    for _ in range(2000):
+        value = rng.randrange(50)
+        if value in expected and rng.random() < 0.4:
+            treap.remove(value)
+            expected.remove(value)
+        elif expected and rng.random() < 0.2:
+            assert treap.pop(0) == expected.pop(0)
+        else:
+            treap.add(value)
+            expected.append(value)
+            expected.sort()
+
+    _check(treap.root)
+    assert list(treap) == expected
+    assert [treap[i] for i in range(len(expected))] == expected
@@ -47,4 +47,143 @@ def test_trie_startswith():
 
     assert trie.startswith("hell") == True
     assert trie.startswith("world") == False
-    assert trie.startswith("hello") == True
\ No newline at end of file
+    assert trie.startswith("hello") == True
+
+def test_trie_instances_isolated():
+    trie1 = Trie()
+    trie2 = Trie()
+    trie1.insert("hello")
+
+    assert trie1.root is not trie2.root
+    assert trie1.search("hello") == True
+    assert trie2.search("hello") == False
+    assert trie2.root.children == {}
+
+def test_trie_clear():
+    trie = Trie()
+    trie.insert("hello")
+    trie.insert("world")
+
+    trie.clear()
+    assert trie.search("hello") == False
+    assert trie.root.children == {}
+    assert trie.node_count() == 1
+
+def test_trie_node_count():
+    trie = Trie()
+    assert trie.node_count() == 1
+
+    trie.insert("hello")
+    trie.insert("help")
+    trie.insert("hello")
+    assert trie.node_count() == 7
+
+def test_trie_estimate_memory():
+    trie = Trie()
+    empty = trie.estimate_memory()
+    assert empty > 0
+
+    trie.insert("hello")
+    assert trie.estimate_memory() > empty
+
+
+def _build_trie(words):
+    trie = Trie()
+    for word in words:
+        trie.insert(word)
+    return trie
+
+def test_trie_delete_long_word():
+    word = "ACGT" * 1000
+    trie = _build_trie([word, word[:10]])
+
+    trie.delete(word)
+    assert trie.search(word) == False
+    assert trie.search(word[:10]) == True
+    assert trie.startswith(word[:11]) == False
+
+def test_trie_repr_long_word():
+    assert repr(Trie()) == "Trie()"
+
+    trie = _build_trie(["ACGT" * 1250])
+    assert repr(trie) == "Trie()"
+    assert trie != _build_trie(["ACGT" * 1250])
+
+def test_trie_delete_missing():
+    trie = _build_trie(["hello"])
+
+    trie.delete("help")
+    trie.delete("hell")
+    assert trie.search("hello") == True
+    assert trie.startswith("hell") == True
+
+def test_trie_delete_prefix():
+    trie = _build_trie(["hello", "help", "helpful", "world"])
+
+    trie.delete_prefix("help")
+    assert trie.search("help") == False
+    assert trie.search("helpful") == False
+    assert trie.search("hello") == True
+    assert trie.search("world") == True
+
+    trie.delete_prefix("hel")
+    assert trie.startswith("h") == False
+    assert list(trie.root.children) == ["w"]
+
+    trie.delete_prefix("x")
+    assert trie.search("world") == True
+
+def test_trie_delete_prefix_empty():
+    trie = _build_trie(["", "hello", "world"])
+
+    trie.delete_prefix("")
+    assert trie.search("") == False
+    assert trie.root.children == {}
+
+def test_trie_delete_many():
+    words = ["a", "ab", "abc", "abd", "b", "bcd", "hello", "help"]
+    trie = _build_trie(words)
+
+    trie.delete_many(["abd", "a", "bcd", "help", "missing", "abcd"])
+    assert trie.search("a") == False
+    assert trie.search("abd") == False
+    assert trie.search("bcd") == False
+    assert trie.search("help") == False
+    assert trie.search("ab") == True
+    assert trie.search("abc") == True
+    assert trie.search("b") == True
+    assert trie.search("hello") == True
+    assert trie.startswith("abd") == False
+    assert trie.startswith("bc") == False
+    assert trie.startswith("help") == False
+
+    trie.delete_many(["ab", "abc", "b", "hello"])
+    assert trie.root.children == {}
+
+def test_trie_search_fuzzy():
+    trie = _build_trie(["hello", "hallo", "help", "hell", "world", "yellow"])
+
+    assert trie.search_fuzzy("hello", 0) == [("hello", 0)]
+    assert trie.search_fuzzy("hello", 1) == [("hallo", 1), ("hell", 1), ("hello", 0)]
+    assert trie.search_fuzzy("hello", 2) == [("hallo", 1), ("hell", 1), ("hello", 0),
+                                             ("help", 2), ("yellow", 2)]
+    assert trie.search_fuzzy("xyz", 1) == []
+
+def test_trie_search_fuzzy_empty():
+    trie = _build_trie(["", "a", "ab"])
+
+    assert trie.search_fuzzy("", 1) == [("", 0), ("a", 1)]
+    assert trie.search_fuzzy("b", 1) == [("", 1), ("a", 1), ("ab", 1)]
+
+def test_trie_search_pattern():
+    trie = _build_trie(["hello", "hallo", "help", "hell", "world", "yellow", "h"])
+
+    assert trie.search_pattern("h?llo") == ["hallo", "hello"]
+    assert trie.search_pattern("hel*") == ["hell", "hello", "help"]
+    assert trie.search_pattern("*llo*") == ["hallo", "hello", "yellow"]
+    assert trie.search_pattern("h*") == ["h", "hallo", "hell", "hello", "help"]
+    assert trie.search_pattern("*") == ["h", "hallo", "hell", "hello", "help", "world", "yellow"]
+    assert trie.search_pattern("?") == ["h"]
+    assert trie.search_pattern("w**d") == ["world"]
+    assert trie.search_pattern("x*") == []
+    assert trie.search_pattern("hello") == ["hello"]
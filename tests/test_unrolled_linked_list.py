@@ -0,0 +1,159 @@
+import random
+import pytest
+from pystrukts.list import UnrolledLinkedList
+
+def _check_blocks(linked_list):
+    blocks = list(linked_list.blocks)
+    assert all(0 < len(block) <= linked_list.capacity for block in blocks)
+    assert sum(len(block) for block in blocks) == len(linked_list)
+
+def test_list_initialization():
+    linked_list = UnrolledLinkedList(4)
+    assert linked_list.capacity == 4
+    assert len(linked_list) == 0
+    assert list(linked_list) == []
+    assert not linked_list.iscircular()
+    assert str(linked_list) == "UnrolledLinkedList([])"
+
+    with pytest.raises(ValueError):
+        UnrolledLinkedList(1)
+
+def test_append_and_appendleft():
+    linked_list = UnrolledLinkedList(4)
+    for i in range(10):
+        linked_list.append(i)
+    for i in range(1, 6):
+        linked_list.appendleft(-i)
+
+    assert list(linked_list) == list(range(-5, 10))
+    assert len(linked_list) == 15
+    assert str(linked_list) == f"UnrolledLinkedList({list(range(-5, 10))})"
+    _check_blocks(linked_list)
+
+def test_get():
+    linked_list = UnrolledLinkedList(3)
+    for i in range(20):
+        linked_list.append(i)
+
+    assert [linked_list.get(i) for i in range(20)] == list(range(20))
+    assert linked_list.get(-1) == 19
+    assert linked_list.get(-20) == 0
+
+    with pytest.raises(IndexError):
+        linked_list.get(20)
+
+    with pytest.raises(IndexError):
+        linked_list.get(-21)
+
+def test_insert():
+    linked_list = UnrolledLinkedList(4)
+    for i in range(8):
+        linked_list.append(i)
+
+    linked_list.insert('a', 2)
+    linked_list.insert('b', 0)
+    linked_list.insert('c', len(linked_list))
+    linked_list.insert('d', -1)
+    assert list(linked_list) == ['b', 0, 1, 'a', 2, 3, 4, 5, 6, 7, 'c', 'd']
+    _check_blocks(linked_list)
+
+    with pytest.raises(IndexError):
+        linked_list.insert('e', 13)
+
+    empty = UnrolledLinkedList()
+    empty.insert(1, 0)
+    assert list(empty) == [1]
+
+def test_remove():
+    linked_list = UnrolledLinkedList(4)
+    for i in range(12):
+        linked_list.append(i)
+
+    assert linked_list.remove(5) == 5
+    assert linked_list.remove(0) == 0
+    assert linked_list.remove(-1) == 11
+    assert list(linked_list) == [1, 2, 3, 4, 6, 7, 8, 9, 10]
+    _check_blocks(linked_list)
+
+    with pytest.raises(IndexError):
+        linked_list.remove(9)
+
+def test_pop_and_popleft():
+    linked_list = UnrolledLinkedList(3)
+    for i in range(7):
+        linked_list.append(i)
+
+    assert linked_list.pop() == 6
+    assert linked_list.popleft() == 0
+    assert [linked_list.pop() for _ in range(5)] == [5, 4, 3, 2, 1]
+    assert len(linked_list.blocks) == 0
+
+    with pytest.raises(IndexError):
+        linked_list.pop()
+
+    with pytest.raises(IndexError):
+        linked_list.popleft()
+
+def test_index():
+    linked_list = UnrolledLinkedList(3)
+    for i in range(10):
+        linked_list.append(i % 5)
+
+    assert linked_list.index(3) == 3
+    assert linked_list.index(0) == 0
+
+    with pytest.raises(ValueError):
+        linked_list.index(5)
+
+def test_clear():
+    linked_list = UnrolledLinkedList()
+    for i in range(100):
+        linked_list.append(i)
+
+    linked_list.clear()
+    assert len(linked_list) == 0
+    assert list(linked_list) == []
+    linked_list.append(1)
+    assert list(linked_list) == [1]
+
+@pytest.mark.parametrize('capacity', [2, 3, 8])
+def test_random_operations(capacity):
+    rng = random.Random(capacity)
+    linked_list = UnrolledLinkedList(capacity)
+    expected = []
+    for _ in range(3000):
+        operation = rng.random()
+        if operation < 0.4 or not expected:
+            index = rng.randint(0, len(expected))
+            linked_list.insert(operation, index)
+            expected.insert(index, operation)
+        elif operation < 0.7:
+            index = rng.randrange(len(expected))
+            assert linked_list.remove(index) == expected.pop(index)
+        elif operation < 0.8:
+            assert linked_list.pop() == expected.pop()
+        elif operation < 0.9:
+            assert linked_list.popleft() == expected.pop(0)
+        else:
+            index = rng.randrange(len(expected))
+            assert linked_list.get(index) == expected[index]
+
+    _check_blocks(linked_list)
+    assert list(linked_list) == expected
+
+def test_capacity_grows():
+    linked_list = UnrolledLinkedList(4)
+    for i in range(16):
+        linked_list.append(i)
+    assert linked_list.capacity == 4
+
+    linked_list.appendleft(-1)
+    assert linked_list.capacity == 8
+    assert list(linked_list) == list(range(-1, 16))
+    _check_blocks(linked_list)
+
+    for i in range(10000):
+        linked_list.insert(i, len(linked_list) // 2)
+    assert linked_list.capacity ** 2 >= len(linked_list) > (linked_list.capacity // 2) ** 2
+    assert len(list(linked_list.blocks)) <= 2 * linked_list.capacity
+    _check_blocks(linked_list)